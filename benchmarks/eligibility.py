@@ -0,0 +1,316 @@
+import pandas as pd
+import numpy as np
+import time
+
+from benchmarks import reference
+from benchmarks.reference import combine_eligible_courses_rowwise, create_combined_courses
+from benchmarks.synthetic import synthetic_major_profiles
+from eligibility_pipeline import (
+    add_co_requisite_courses,
+    cohort_eligible_by_prerequisites,
+    cohort_eligible_by_rules,
+    cohort_taken_matrix,
+    combine_eligible_courses,
+    course_dependents,
+    eligibility_timeline,
+    eligible_by_rules,
+    future_eligible_courses,
+    future_eligible_special,
+    major_catalog_sheets,
+    major_registry,
+    process_major_data,
+    special_condition_sheets,
+)
+
+# Benchmarks of the eligibility engine: each pairs the path the pipeline replaced with the one it
+# uses now. The helpers computing both sides are shared with the tests, which check they agree
+
+def best_of(run, repeats):
+    # (fastest of `repeats` runs in seconds, output of the last run)
+    best = None
+    for _ in range(repeats):
+        started = time.perf_counter()
+        output = run()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best, output
+
+def largest_major(catalog):
+    # (major name, sheet) of the catalog major with the most standard prerequisite entries
+    sheet_major = max(catalog["majors"], key=lambda code: len(catalog["majors"][code]["prerequisites"]))
+    return next(name for name, profile in synthetic_major_profiles.items() if profile[2] == sheet_major), sheet_major
+
+def semester_histories(major_data):
+    # Courses of each semester, per student
+    major_data = major_data.sort_values(by=['Student_ID', 'Semester'])
+    return [[set(semester_group['Course_ID']) for _, semester_group in group.groupby('Semester')]
+            for _, group in major_data.groupby('Student_ID')]
+
+def eligible_by_sets(histories, prerequisites):
+    results = []
+    for semesters in histories:
+        cumulative_courses = set()
+        for taken_courses in semesters:
+            cumulative_courses.update(taken_courses)
+            results.append({course for course in prerequisites.keys() if all(req in cumulative_courses for req in prerequisites[course])})
+    return results
+
+def eligible_by_matrix(major_data, major_catalog):
+    # eligible_by_sets over semester_histories, from the pipeline's cohort prerequisite matrix
+    course_index = pd.Index(major_data['Course_ID'].dropna().unique())
+    _, _, cumulative = cohort_taken_matrix(major_data, course_index)
+    courses = list(major_catalog["prerequisites"])
+    return [{courses[course_code] for course_code in np.flatnonzero(row)}
+            for row in cohort_eligible_by_prerequisites(major_catalog["prerequisites"], cumulative, course_index)]
+
+def per_student_eligibility(major_data, major_catalog):
+    # {(Student_ID, Semester): (standard, special eligible courses)} walking students one at a time
+    major_data = major_data.sort_values(by=['Student_ID', 'Semester'])
+    prerequisites = major_catalog["prerequisites"]
+    results = {}
+    for student_id, group in major_data.groupby('Student_ID'):
+        cumulative_courses = set()
+        for semester, semester_group in group.groupby('Semester'):
+            cumulative_courses.update(semester_group['Course_ID'].tolist())
+            results[(student_id, semester)] = (
+                {course for course in prerequisites.keys() if all(req in cumulative_courses for req in prerequisites[course])},
+                eligible_by_rules(major_catalog["special_rules"], cumulative_courses, semester_group.iloc[0].to_dict()))
+    return results
+
+def cohort_eligibility(major_data, major_catalog):
+    # per_student_eligibility from the pipeline's cohort matrices
+    major_data = major_data.sort_values(by=['Student_ID', 'Semester'])
+    courses = list(major_catalog["prerequisites"])
+    special_courses = list(major_catalog["special_rules"])
+    course_index = pd.Index(major_data['Course_ID'].dropna().unique())
+    semester_keys, first_positions, cumulative = cohort_taken_matrix(major_data, course_index)
+    eligible = cohort_eligible_by_prerequisites(major_catalog["prerequisites"], cumulative, course_index)
+    special_eligible = cohort_eligible_by_rules(major_catalog["special_rules"], cumulative, course_index,
+                                                major_data.iloc[first_positions].reset_index(drop=True))
+    return {key: ({courses[course_code] for course_code in np.flatnonzero(row)},
+                  {special_courses[course_code] for course_code in np.flatnonzero(special_row)})
+            for key, row, special_row in zip(semester_keys, eligible, special_eligible)}
+
+def special_condition_states(st_hist_data, catalog, max_states=200):
+    # (sheet_major, taken_courses, student_info) samples per major: the cumulative history of each
+    # student-semester, plus that history completed with every special course's prerequisites
+    states = []
+    for major_name, (_, _, sheet_major) in synthetic_major_profiles.items():
+        major_data = st_hist_data[st_hist_data["Major"] == major_name].sort_values(by=['Student_ID', 'Semester'])
+        major_states = []
+        for student_id, group in major_data.groupby('Student_ID'):
+            cumulative_courses = set()
+            for semester, semester_group in group.groupby('Semester'):
+                cumulative_courses.update(semester_group['Course_ID'].tolist())
+                major_states.append((set(cumulative_courses), semester_group.iloc[0].to_dict()))
+        major_states = major_states[:max_states]
+        prerequisites_special = catalog["majors"][sheet_major]["prerequisites_special"]
+        for taken_courses, student_info in list(major_states):
+            for prereqs in prerequisites_special.values():
+                major_states.append((taken_courses | set(prereqs), student_info))
+        states.extend((sheet_major, taken_courses, student_info) for taken_courses, student_info in major_states)
+    return states
+
+def special_condition_chain(sheet_major, future=False):
+    # The is_eligible_special_<variant> chain a major sheet's conditions were evaluated with
+    return getattr(reference, f"is_eligible_special_{special_condition_sheets[sheet_major]}{'_' if future else ''}")
+
+def future_eligibility_per_row(comprehensive_data, major_catalog, sheet_major):
+    # The original scan: every prerequisite list and condition chain re-evaluated per row
+    is_eligible_special = special_condition_chain(sheet_major, future=True)
+    return list(zip(
+        comprehensive_data.apply(lambda row: reference.find_additional_eligibilities(row['Eligible_Courses_CO'], set(row['Eligible_Courses_CO']), major_catalog["prerequisites"]), axis=1),
+        comprehensive_data.apply(lambda row: reference.find_additional_eligibilities_special(row['Eligible_Courses_CO'], set(row['Eligible_Courses_CO']), row, major_catalog["prerequisites_special"], major_catalog["conditions"], is_eligible_special), axis=1)))
+
+def future_eligibility_unlocks(comprehensive_data, major_catalog, course_bits):
+    return list(zip(future_eligible_courses(comprehensive_data, major_catalog, course_bits),
+                    future_eligible_special(comprehensive_data, major_catalog)))
+
+def dependent_queries(catalog):
+    return [(major_catalog, course) for major_catalog in catalog["majors"].values() for course in major_catalog["course_ids"]]
+
+def dependents_by_scan(queries):
+    return [sorted({dependent for prerequisites in [major_catalog["prerequisites"], major_catalog["prerequisites_special"]]
+                    for dependent, prereqs in prerequisites.items() if course in prereqs})
+            for major_catalog, course in queries]
+
+def dependents_by_index(queries):
+    return [sorted({dependent for dependent, condition in course_dependents(major_catalog, course)}) for major_catalog, course in queries]
+
+def eligible_course_lists(major_data, major_catalog):
+    # Student_ID, Semester, Eligible_Courses frame of a major's standard eligibility
+    eligibility = cohort_eligibility(major_data, major_catalog)
+    return pd.DataFrame({'Student_ID': [student_id for student_id, semester in eligibility],
+                         'Semester': [semester for student_id, semester in eligibility],
+                         'Eligible_Courses': [list(courses) for courses, _ in eligibility.values()]})
+
+def synthetic_eligibility_frames(catalog, rows=100000, seed=0):
+    # (standard, special) eligibility frames of `rows` Computer Science student-semesters
+    rng = np.random.default_rng(seed)
+    major_catalog = catalog["majors"]["COMSCIENCE"]
+    standard_pool = list(major_catalog["prerequisites"])
+    special_pool = list(major_catalog["prerequisites_special"])
+    columns = {
+        'Student_ID': np.arange(rows) // 4,
+        'Semester': 2000 + np.arange(rows) % 4 * 10,
+        'Major': 'Computer Science',
+        'College': 'CAS',
+        'Program': 'BS',
+        'Passed Credits': rng.integers(0, 130, rows),
+        'Student_Level': 'Junior',
+    }
+    standard = pd.DataFrame(dict(columns, Eligible_Courses=[list(rng.choice(standard_pool, rng.integers(0, 12), replace=False)) for _ in range(rows)]))
+    special = pd.DataFrame(dict(columns, Eligible_Courses=[list(rng.choice(special_pool, rng.integers(0, 4), replace=False)) for _ in range(rows)]))
+    return standard, special
+
+def print_timings(timings, baseline, replacement, precision=3):
+    for mode, elapsed in timings.items():
+        print(f"  {mode}: {elapsed:.{precision}f}s")
+    print(f"  speedup: {timings[baseline] / timings[replacement]:.1f}x")
+
+def benchmark_eligibility_engine(st_hist_data, catalog, repeats=3):
+    # Set-based standard eligibility per student-semester vs the cohort prerequisite matrix, for the largest major
+    major_name, sheet_major = largest_major(catalog)
+    major_catalog = catalog["majors"][sheet_major]
+    major_data = st_hist_data[st_hist_data["Major"] == major_name]
+    histories = semester_histories(major_data)
+    timings = {}
+    for mode, run in [("set-based", lambda: eligible_by_sets(histories, major_catalog["prerequisites"])),
+                      ("cohort matrix", lambda: eligible_by_matrix(major_data, major_catalog))]:
+        timings[mode], output = best_of(run, repeats)
+    checks = len(output) * len(major_catalog["prerequisites"])
+    print(f"{major_name} ({sheet_major}): {len(major_catalog['prerequisites'])} courses, {len(output)} student-semesters")
+    for mode, elapsed in timings.items():
+        print(f"  {mode}: {elapsed:.4f}s ({checks / elapsed:,.0f} course checks/s)")
+    print(f"  speedup: {timings['set-based'] / timings['cohort matrix']:.1f}x")
+    return timings
+
+def benchmark_cohort_eligibility(st_hist_data, catalog, repeats=3):
+    # Per-student set loop and compiled special rules vs the cohort eligibility matrices, for
+    # every major in the data
+    timings = {"per-student": 0.0, "cohort matrix": 0.0}
+    rows = 0
+    for major_name, (_, _, sheet_major) in synthetic_major_profiles.items():
+        major_data = st_hist_data[st_hist_data["Major"] == major_name]
+        if major_data.empty:
+            continue
+        major_catalog = catalog["majors"][sheet_major]
+        for mode, run in [("per-student", lambda: per_student_eligibility(major_data, major_catalog)),
+                          ("cohort matrix", lambda: cohort_eligibility(major_data, major_catalog))]:
+            elapsed, output = best_of(run, repeats)
+            timings[mode] += elapsed
+        rows += len(output)
+    print(f"{rows} student-semesters across {st_hist_data['Major'].nunique()} majors")
+    print_timings(timings, "per-student", "cohort matrix")
+    return timings
+
+def benchmark_special_conditions(st_hist_data, catalog, max_states=200, repeats=3):
+    # Per-condition time of the if/elif chain vs the compiled predicate, current-semester variants
+    calls = {}
+    for sheet_major, taken_courses, student_info in special_condition_states(st_hist_data, catalog, max_states):
+        major_catalog = catalog["majors"][sheet_major]
+        is_eligible_special = special_condition_chain(sheet_major)
+        for course, rule in major_catalog["special_rules"].items():
+            calls.setdefault(major_catalog["conditions"][course], []).append(
+                (is_eligible_special, course, taken_courses, student_info, major_catalog["prerequisites_special"], major_catalog["conditions"], rule))
+
+    def run_chains(condition_calls):
+        for is_eligible_special, course, taken_courses, student_info, prerequisites_special, conditions, rule in condition_calls:
+            is_eligible_special(course, taken_courses, student_info, prerequisites_special, conditions)
+
+    def run_compiled(condition_calls):
+        for is_eligible_special, course, taken_courses, student_info, prerequisites_special, conditions, rule in condition_calls:
+            rule(taken_courses, student_info)
+
+    timings = {}
+    for condition, condition_calls in sorted(calls.items()):
+        best_chain = best_of(lambda: run_chains(condition_calls), repeats)[0]
+        best_compiled = best_of(lambda: run_compiled(condition_calls), repeats)[0]
+        timings[condition] = (len(condition_calls), best_chain, best_compiled)
+        print(f"{condition:28s} {len(condition_calls):8d} calls  chain {best_chain / len(condition_calls) * 1e9:7.0f} ns  "
+              f"compiled {best_compiled / len(condition_calls) * 1e9:7.0f} ns  {best_chain / best_compiled:5.1f}x")
+    return timings
+
+def benchmark_latest_only(st_hist_data, catalog, requirements_weights_path="Requierments_Weights.xlsx"):
+    # Every pipeline with the full semester history vs only each student's latest state
+    timings = {"full history": 0.0, "latest only": 0.0}
+    for major_name in major_registry:
+        major_data = st_hist_data[st_hist_data["Major"] == major_name]
+        for mode, latest_only in [("full history", False), ("latest only", True)]:
+            started = time.perf_counter()
+            process_major_data(major_name, major_data, catalog, requirements_weights_path, latest_only=latest_only)
+            timings[mode] += time.perf_counter() - started
+    semesters = st_hist_data.groupby('Student_ID')['Semester'].nunique().mean()
+    print(f"{st_hist_data['Student_ID'].nunique()} students, {semesters:.1f} semesters each")
+    print_timings(timings, "full history", "latest only", precision=2)
+    return timings
+
+def benchmark_eligibility_timeline(st_hist_data, catalog, repeats=3):
+    # Incremental eligibility_timeline vs re-checking the whole catalog at every semester
+    timings = {"full re-check": 0.0, "incremental": 0.0}
+    rows = 0
+    for major in major_catalog_sheets:
+        if not (st_hist_data["Major"] == major).any():
+            continue
+        for mode, incremental in [("full re-check", False), ("incremental", True)]:
+            elapsed, output = best_of(lambda: eligibility_timeline(st_hist_data, catalog, major, incremental=incremental), repeats)
+            timings[mode] += elapsed
+        rows += len(output)
+    print(f"{rows} student-semesters")
+    print_timings(timings, "full re-check", "incremental", precision=2)
+    return timings
+
+def benchmark_future_eligibility(st_hist_data, catalog, requirements_weights_path="Requierments_Weights.xlsx", repeats=3):
+    # Future eligibility of the comprehensive rows: per-row scan of every prerequisite vs the unlock tables
+    timings = {"per-row scan": 0.0, "unlock table": 0.0}
+    rows = 0
+    for major in major_registry:
+        major_data = st_hist_data[st_hist_data["Major"] == major]
+        if major_data.empty:
+            continue
+        major_catalog = catalog["majors"][major_catalog_sheets[major]]
+        comprehensive_data = process_major_data(major, major_data, catalog, requirements_weights_path)[5]
+        timings["per-row scan"] += best_of(lambda: future_eligibility_per_row(comprehensive_data, major_catalog, major_catalog_sheets[major]), repeats)[0]
+        timings["unlock table"] += best_of(lambda: future_eligibility_unlocks(comprehensive_data, major_catalog, catalog["course_bits"]), repeats)[0]
+        rows += len(comprehensive_data)
+    print(f"{rows} comprehensive rows")
+    print_timings(timings, "per-row scan", "unlock table")
+    return timings
+
+def benchmark_course_dependents(catalog, repeats=3):
+    # "Which courses depend on X" for every course of every major: scanning prerequisites vs the reverse index
+    queries = dependent_queries(catalog)
+    timings = {}
+    for mode, run in [("scan", dependents_by_scan), ("reverse index", dependents_by_index)]:
+        timings[mode] = best_of(lambda: run(queries), repeats)[0]
+    print(f"{len(queries)} dependent queries")
+    print_timings(timings, "scan", "reverse index", precision=4)
+    return timings
+
+def benchmark_co_requisites(st_hist_data, catalog, repeats=3):
+    # Co-requisite matching over every student-semester: apply(create_combined_courses) vs the co-requisite index
+    timings = {"apply": 0.0, "index": 0.0}
+    rows = 0
+    for major, sheet_major in major_catalog_sheets.items():
+        major_data = st_hist_data[st_hist_data["Major"] == major]
+        if major_data.empty:
+            continue
+        major_catalog = catalog["majors"][sheet_major]
+        combined_list = eligible_course_lists(major_data, major_catalog)
+        for mode, run in [("apply", lambda: combined_list.apply(create_combined_courses, axis=1, co=major_catalog["co"])),
+                          ("index", lambda: add_co_requisite_courses(combined_list, major_catalog["co_index"]))]:
+            timings[mode] += best_of(run, repeats)[0]
+        rows += len(combined_list)
+    print(f"{rows} student-semester rows")
+    print_timings(timings, "apply", "index")
+    return timings
+
+def benchmark_combine_eligible_courses(catalog, rows=100000, seed=0):
+    # Standard + special merge over `rows` student-semesters: row-wise iterrows vs the column pass
+    standard, special = synthetic_eligibility_frames(catalog, rows, seed)
+    timings = {}
+    for mode, combine in [("row-wise", combine_eligible_courses_rowwise), ("vectorized", combine_eligible_courses)]:
+        timings[mode] = best_of(lambda: combine(standard, special), 1)[0]
+    print(f"{rows} student-semester rows")
+    print_timings(timings, "row-wise", "vectorized")
+    return timings
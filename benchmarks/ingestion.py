@@ -0,0 +1,212 @@
+import pandas as pd
+import os
+import shutil
+import threading
+import time
+import tracemalloc
+
+from benchmarks.reference import add_incoming_pcr_rowwise
+from benchmarks.synthetic import create_benchmark_db, create_warehouse_db, warehouse_query, warehouse_sync_queries
+from eligibility_data import (
+    add_incoming_pcr,
+    build_major_scoped_queries,
+    combine_student_history,
+    fetch_data_from_db,
+    fetch_data_from_db_chunked,
+    fetch_enrollment_and_transfer_data,
+    st_data_cleaning,
+    st_enrollment_query,
+    sync_enrollment_snapshot,
+    tc_query,
+)
+from eligibility_pipeline import MAJOR_SHEET_PATH, load_major_sheet
+
+# Benchmarks of the data layer: fetching, ingestion, cleaning and the major sheet cache. The tests
+# check that each faster path returns what the one it replaced did
+
+def benchmark_concurrent_fetch(enrollment_data, transfer_data, latencies=(0.0, 0.25, 1.0), repeats=3, db_path="benchmark_fetch.sqlite"):
+    enrollment_query = "SELECT * FROM ActiveStudentEnrollmentFull"
+    transfer_query = "SELECT * FROM StudentCourseTransfer"
+    results = []
+    for latency in latencies:
+        engine, pool_stats = create_benchmark_db(enrollment_data, transfer_data, db_path, latency)
+        # Warm the pool so both modes reuse existing connections
+        fetch_enrollment_and_transfer_data(enrollment_query, transfer_query, engine, pool_stats, stream_enrollment=False)
+        for mode in ["sequential", "concurrent"]:
+            timings = []
+            for _ in range(repeats):
+                started = time.perf_counter()
+                if mode == "sequential":
+                    fetch_data_from_db(enrollment_query, engine, pool_stats)
+                    fetch_data_from_db(transfer_query, engine, pool_stats)
+                else:
+                    fetch_enrollment_and_transfer_data(enrollment_query, transfer_query, engine, pool_stats, stream_enrollment=False)
+                timings.append(time.perf_counter() - started)
+            results.append({"Latency_s": latency, "Mode": mode, "Best_s": min(timings), "Mean_s": sum(timings) / len(timings)})
+        engine.dispose()
+    os.remove(db_path)
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False))
+    return results
+
+def benchmark_streaming_ingestion(enrollment_data, transfer_data, chunk_sizes=(1000, 10000, 50000), db_path="benchmark_stream.sqlite"):
+    query = "SELECT * FROM ActiveStudentEnrollmentFull"
+    engine, pool_stats = create_benchmark_db(enrollment_data, transfer_data, db_path)
+    results = []
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    df = fetch_data_from_db(query, engine, pool_stats)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    results.append({"Mode": "full read_sql", "Chunk_Size": None, "Chunks": 1, "Rows": len(df),
+                    "Rows_per_s": round(len(df) / elapsed, 1), "Peak_MB": round(peak / 1024 ** 2, 2),
+                    "Result_MB": round(df.memory_usage(deep=True).sum() / 1024 ** 2, 2)})
+
+    for chunksize in chunk_sizes:
+        stats = {}
+        tracemalloc.start()
+        df = fetch_data_from_db_chunked(query, chunksize, engine, pool_stats, stats)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({"Mode": "streamed", "Chunk_Size": chunksize, "Chunks": stats["chunks"], "Rows": stats["rows"],
+                        "Rows_per_s": stats["rows_per_second"], "Peak_MB": round(peak / 1024 ** 2, 2),
+                        "Result_MB": stats["buffer_mb"]})
+
+    engine.dispose()
+    os.remove(db_path)
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False))
+    return results
+
+def benchmark_typed_ingestion(enrollment_data, transfer_data, chunksize=10000, db_path="benchmark_typed.sqlite"):
+    query = "SELECT * FROM ActiveStudentEnrollmentFull"
+    engine, pool_stats = create_benchmark_db(enrollment_data, transfer_data, db_path)
+    results = []
+    for mode in ["read_sql", "streamed text", "streamed typed"]:
+        tracemalloc.start()
+        started = time.perf_counter()
+        if mode == "read_sql":
+            df = fetch_data_from_db(query, engine, pool_stats)
+        else:
+            df = fetch_data_from_db_chunked(query, chunksize, engine, pool_stats, typed=mode == "streamed typed")
+        fetch_seconds = time.perf_counter() - started
+        fetch_peak = tracemalloc.get_traced_memory()[1]
+        buffer_mb = df.memory_usage(deep=True).sum() / 1024 ** 2
+
+        tracemalloc.reset_peak()
+        started = time.perf_counter()
+        st_data_cleaning(df, transfer_data.copy())
+        clean_seconds = time.perf_counter() - started
+        clean_peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({"Mode": mode, "Fetch_s": round(fetch_seconds, 3), "Fetch_Peak_MB": round(fetch_peak / 1024 ** 2, 2),
+                        "Buffer_MB": round(buffer_mb, 2), "Clean_s": round(clean_seconds, 3),
+                        "Clean_Peak_MB": round(clean_peak / 1024 ** 2, 2)})
+
+    engine.dispose()
+    os.remove(db_path)
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False))
+    return results
+
+def benchmark_snapshot_sync(enrollment_data, transfer_data, chunksize=10000, db_path="benchmark_sync.sqlite",
+                            snapshot_dir="benchmark_snapshot"):
+    # Rows pulled from the warehouse by a direct pull, a full snapshot rebuild and a delta sync
+    # (from the last synced term onwards) that returns the same enrollment frame
+    engine, pool_stats = create_warehouse_db(enrollment_data, transfer_data, db_path)
+    snapshot_lock = threading.Lock()
+    results = []
+    started = time.perf_counter()
+    full_pull = fetch_data_from_db_chunked(warehouse_query(st_enrollment_query), chunksize, engine, pool_stats)
+    results.append({"Mode": "direct", "Rows_Transferred": len(full_pull), "Snapshot_Rows": len(full_pull),
+                    "Seconds": round(time.perf_counter() - started, 3)})
+
+    for mode in ["full", "delta"]:
+        stats = {}
+        started = time.perf_counter()
+        sync_enrollment_snapshot(mode, snapshot_dir, engine, pool_stats, chunksize, sync_stats=stats,
+                                 snapshot_lock=snapshot_lock, queries=warehouse_sync_queries())
+        results.append({"Mode": f"{mode} sync", "Rows_Transferred": stats["rows_transferred"] + stats["active_ids_transferred"],
+                        "Snapshot_Rows": stats["full_pull_rows"], "Seconds": round(time.perf_counter() - started, 3)})
+
+    engine.dispose()
+    os.remove(db_path)
+    shutil.rmtree(snapshot_dir)
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False))
+    return results
+
+def benchmark_semester_stats(enrollment_data, transfer_data, repeats=3):
+    # Time and peak memory of the semester statistics step alone, on the same combined history
+    combined_data = combine_student_history(enrollment_data.copy(), transfer_data.copy())
+    results = []
+    for mode, add_stats in [("row-wise merges", add_incoming_pcr_rowwise), ("single-pass table", add_incoming_pcr)]:
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            add_stats(combined_data)
+            timings.append(time.perf_counter() - started)
+        tracemalloc.start()
+        add_stats(combined_data)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results.append({"Mode": mode, "Rows": len(combined_data), "Best_s": round(min(timings), 4),
+                        "Peak_MB": round(peak / 1024 ** 2, 2)})
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False))
+    return results
+
+def benchmark_major_sheet_cache(path=MAJOR_SHEET_PATH, cache_dir="benchmark_catalog_cache", repeats=3):
+    results = []
+    started = time.perf_counter()
+    pd.read_excel(path, sheet_name=None)
+    results.append({"Mode": "read_excel", "Seconds": round(time.perf_counter() - started, 4)})
+
+    # Cold: no cache yet, the workbook is parsed and compiled
+    if os.path.exists(cache_dir):
+        for cache_file in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, cache_file))
+    stats = {}
+    load_major_sheet(path, cache_dir, stats)
+    results.append({"Mode": "cold (compile)", "Seconds": stats["seconds"]})
+
+    for _ in range(repeats):
+        stats = {}
+        load_major_sheet(path, cache_dir, stats)
+        results.append({"Mode": f"warm ({stats['source']})", "Seconds": stats["seconds"]})
+
+    for cache_file in os.listdir(cache_dir):
+        os.remove(os.path.join(cache_dir, cache_file))
+    os.rmdir(cache_dir)
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False))
+    return results
+
+def benchmark_major_pushdown(enrollment_data, transfer_data,
+                             selections=(["Accounting", "Finance"], ["Digital Media Production"], ["Computer Engineering"]),
+                             db_path="benchmark_pushdown.sqlite"):
+    # The production full and major-scoped queries against a SQLite mirror of the warehouse tables;
+    # the tests check the scoped rows are the full pull filtered to the selected students
+    engine, pool_stats = create_warehouse_db(enrollment_data, transfer_data, db_path)
+    full_enrollment, full_transfer = fetch_enrollment_and_transfer_data(
+        warehouse_query(st_enrollment_query), warehouse_query(tc_query), engine, pool_stats)
+    full_rows = len(full_enrollment) + len(full_transfer)
+
+    results = []
+    for selection in selections:
+        enrollment_query, transfer_query, params = build_major_scoped_queries(selection)
+        started = time.perf_counter()
+        enrollment, transfer = fetch_enrollment_and_transfer_data(
+            warehouse_query(enrollment_query), warehouse_query(transfer_query), engine, pool_stats, params=params)
+        elapsed = time.perf_counter() - started
+        scoped_rows = len(enrollment) + len(transfer)
+        results.append({"Majors": ", ".join(selection), "Full_Rows": full_rows, "Scoped_Rows": scoped_rows,
+                        "Rows_Saved_pct": round(100 * (1 - scoped_rows / full_rows), 1), "Fetch_s": round(elapsed, 3)})
+
+    engine.dispose()
+    os.remove(db_path)
+    results = pd.DataFrame(results)
+    print(results.to_string(index=False))
+    return results
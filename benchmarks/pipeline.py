@@ -0,0 +1,112 @@
+import pandas as pd
+import os
+import pickle
+import time
+
+from eligibility_pipeline import (
+    major_partitions,
+    major_registry,
+    major_task_ranges,
+    pipeline_pool,
+    process_major_data,
+    report_files,
+    run_all_majors,
+    share_history,
+    worker_history_rows,
+)
+
+# Benchmarks of the batch pipeline: all majors in one job, process pools, student shards and the
+# cost of handing tasks their history. The tests check the reports match the in-process ones
+
+def per_major_reports(st_hist_data, catalog, requirements_weights_path):
+    # Main-page loop: one boolean mask and grade filter per major, reports concatenated per family
+    loop_reports = {family: [] for family in report_files}
+    for major in major_registry:
+        major_data = st_hist_data[st_hist_data['Major'] == major]
+        if major_data.empty:
+            continue
+        for family, report in zip(report_files, process_major_data(major, major_data, catalog, requirements_weights_path)):
+            loop_reports[family].append(report)
+    return {family: pd.concat(report_list, ignore_index=True) for family, report_list in loop_reports.items() if report_list}
+
+def benchmark_all_majors(st_hist_data, catalog, requirements_weights_path="Requierments_Weights.xlsx"):
+    # Main-page loop vs run_all_majors
+    started = time.perf_counter()
+    per_major_reports(st_hist_data, catalog, requirements_weights_path)
+    loop_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    _, timings = run_all_majors(st_hist_data, catalog, requirements_weights_path)
+    batch_time = time.perf_counter() - started
+
+    print(f"{st_hist_data['Student_ID'].nunique()} students, {len(timings)} majors")
+    for major, elapsed in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  {major}: {elapsed:.2f}s")
+    print(f"  per-major loop: {loop_time:.2f}s, batch: {batch_time:.2f}s")
+    return timings
+
+def benchmark_pipeline_workers(st_hist_data, catalog, requirements_weights_path="Requierments_Weights.xlsx", worker_counts=(1, 2, 4, 8)):
+    # All-majors batch run in-process and in process pools of each size
+    timings = {}
+    print(f"{st_hist_data['Student_ID'].nunique()} students, {os.cpu_count()} CPUs")
+    for workers in worker_counts:
+        started = time.perf_counter()
+        run_all_majors(st_hist_data, catalog, requirements_weights_path, workers=workers)
+        timings[workers] = time.perf_counter() - started
+        print(f"  {workers} worker(s): {timings[workers]:.2f}s, speedup: {timings[worker_counts[0]] / timings[workers]:.2f}x")
+    return timings
+
+def benchmark_student_shards(st_hist_data, catalog, requirements_weights_path="Requierments_Weights.xlsx", major="Computer Science", shard_counts=(1, 2, 4, 8)):
+    # One major's pipeline with its per-student stages in 1..N student shards
+    major_data = st_hist_data[st_hist_data["Major"] == major]
+    timings = {}
+    print(f"{major}: {major_data['Student_ID'].nunique()} students, {os.cpu_count()} CPUs")
+    for shards in shard_counts:
+        with pipeline_pool(catalog, shards) as executor:
+            # Time a warm pool, as the long-lived one is after its first run
+            list(executor.map(abs, range(shards)))
+            started = time.perf_counter()
+            process_major_data(major, major_data, catalog, requirements_weights_path, student_shards=shards, executor=executor)
+            timings[shards] = time.perf_counter() - started
+        print(f"  {shards} shard(s): {timings[shards]:.2f}s, speedup: {timings[shard_counts[0]] / timings[shards]:.2f}x")
+    return timings
+
+def benchmark_task_serialization(st_hist_data, catalog, requirements_weights_path="Requierments_Weights.xlsx", workers=2, repeats=3):
+    # Per-task cost of handing a major its history: pickling the partitions into every task vs the
+    # layout and row ranges of a shared-memory block (including a worker attaching it and decoding the rows)
+    partitions = major_partitions(st_hist_data)
+    block, layout = share_history(pd.concat([frame for _, passed_data, failed_data in partitions for frame in (passed_data, failed_data)]))
+    try:
+        task_sets = [("pickled history", [(major, passed_data, failed_data, requirements_weights_path) for major, passed_data, failed_data in partitions]),
+                     ("shared memory", [(major, layout, passed_rows, failed_rows, requirements_weights_path) for major, passed_rows, failed_rows in major_task_ranges(partitions)])]
+        results = {}
+        for mode, tasks in task_sets:
+            best = None
+            for _ in range(repeats):
+                started = time.perf_counter()
+                payloads = [pickle.dumps(task, protocol=pickle.HIGHEST_PROTOCOL) for task in tasks]
+                received = [pickle.loads(payload) for payload in payloads]
+                if mode == "shared memory":
+                    received = [(major, worker_history_rows(task_layout, *passed_rows), worker_history_rows(task_layout, *failed_rows), path)
+                                for major, task_layout, passed_rows, failed_rows, path in received]
+                elapsed = time.perf_counter() - started
+                best = elapsed if best is None else min(best, elapsed)
+            results[mode] = {"bytes": sum(len(payload) for payload in payloads) / len(tasks), "seconds": best / len(tasks)}
+        layout_bytes = len(pickle.dumps(layout, protocol=pickle.HIGHEST_PROTOCOL))
+    finally:
+        block.close()
+        block.unlink()
+
+    print(f"{len(partitions)} major tasks, {len(st_hist_data)} history rows; once per worker: catalog {len(pickle.dumps(catalog)) / 1e6:.2f} MB, "
+          f"history decode tables {layout['tables'][1] / 1e3:.1f} KB; in every shared-memory task: history layout {layout_bytes / 1e3:.2f} KB")
+    for mode, result in results.items():
+        print(f"  {mode}: {result['bytes'] / 1e3:.2f} KB and {result['seconds'] * 1e3:.2f} ms per task")
+    print(f"  per-task bytes: {results['pickled history']['bytes'] / results['shared memory']['bytes']:.0f}x smaller")
+
+    timings = {}
+    for mode, shared_memory_tasks in [("pickled history", False), ("shared memory", True)]:
+        started = time.perf_counter()
+        run_all_majors(st_hist_data, catalog, requirements_weights_path, workers=workers, shared_memory_tasks=shared_memory_tasks)
+        timings[mode] = time.perf_counter() - started
+        print(f"  all majors with {workers} workers, {mode}: {timings[mode]:.2f}s")
+    return results, timings
@@ -0,0 +1,1081 @@
+import pandas as pd
+
+# Original implementations the pipeline has replaced, kept to check and time the replacements
+# against (benchmarks only, never the reports)
+
+# Student history: row-wise latest/previous semester merges, replaced by add_incoming_pcr
+def add_incoming_pcr_rowwise(combined_data):
+    # Identify the latest semester for each student
+    latest_semester = combined_data.groupby('Student_ID')['Semester'].max().reset_index()
+    latest_semester.columns = ['Student_ID', 'Latest_Semester']
+
+    # Merge this information back with the original dataframe
+    combined_data = pd.merge(combined_data, latest_semester, on='Student_ID')
+
+    # Filter rows for each student where the semester is their latest semester
+    latest_semester_data = combined_data[combined_data['Semester'] == combined_data['Latest_Semester']]
+
+    # Extract the passed credits for each student from the latest semester data
+    latest_semester_passed_credits = latest_semester_data[['Student_ID', 'Passed Credits']].drop_duplicates()
+    # Summing the CREDITS for the latest semester
+    latest_semester_credits_sum = latest_semester_data.groupby('Student_ID')['CREDITS'].sum().reset_index()
+    latest_semester_credits_sum.columns = ['Student_ID', 'Latest_Semester_Credits']
+
+
+    previous_semesters_data = combined_data[combined_data['Semester'] != combined_data['Latest_Semester']]
+    # Identify the latest semester for each student
+    latest_semester_previous = previous_semesters_data.groupby('Student_ID')['Semester'].max().reset_index()
+    latest_semester_previous.columns = ['Student_ID', 'Latest_Semester_Previous']
+
+    # Merge this information back with the original dataframe
+    combined_data = pd.merge(combined_data, latest_semester_previous, on='Student_ID',how = "left")
+    combined_data = combined_data.fillna(0)
+    combined_data["Latest_Semester_Previous"] = combined_data["Latest_Semester_Previous"].astype(int)
+
+    # Filter rows for each student where the semester is their latest semester
+    latest_semester_previous_data = combined_data[combined_data['Semester'] == combined_data['Latest_Semester_Previous']]
+
+    # Extract the passed credits for each student from the latest semester data
+    latest_semester_previous_passed_credits = latest_semester_previous_data[['Student_ID', 'Passed Credits']].drop_duplicates()
+
+    latest_semester_passed_credits = latest_semester_passed_credits.rename(columns={"Passed Credits":"Passed_Credits_Latest"})
+    latest_semester_previous_passed_credits = latest_semester_previous_passed_credits.rename(columns={"Passed Credits":"Passed_Credits_Previous"})
+
+    total_pcr_previous_latest = pd.merge(latest_semester_passed_credits,latest_semester_previous_passed_credits, on='Student_ID',how = "left")
+    total_pcr_previous_latest = total_pcr_previous_latest.fillna(0)
+    total_pcr_previous_latest["Passed_Credits_Previous"] = total_pcr_previous_latest["Passed_Credits_Previous"].astype(int)
+
+    total_pcr_previous_latest = pd.merge(latest_semester_credits_sum, total_pcr_previous_latest, on='Student_ID')
+    total_pcr_previous_latest['Incoming_PCR'] = total_pcr_previous_latest.apply(
+        lambda row: row['Latest_Semester_Credits'] + row['Passed_Credits_Latest'] 
+        if row['Passed_Credits_Previous'] == row['Passed_Credits_Latest'] 
+        else row['Passed_Credits_Latest'],
+        axis=1)
+    combined_data = pd.merge(combined_data, total_pcr_previous_latest[['Student_ID', 'Incoming_PCR']], on='Student_ID')
+    combined_data['Incoming_PCR'] = combined_data.apply(
+        lambda row: 0 if row['Semester'] != row['Latest_Semester'] else row['Incoming_PCR'],
+        axis=1)
+    combined_data = combined_data.drop(columns=["Latest_Semester_Previous","Latest_Semester"])
+    
+    return combined_data
+
+# Student history: text round-trip and a row-wise transfer semester, replaced by combine_student_history
+def combine_student_history_rowwise(st_enrollment_data, transfer_credit_data):
+    ac_st_enrollment_data = st_enrollment_data
+    tc_data = transfer_credit_data
+    
+    # Rename columns
+    rename_columns_dict = {"EMPLID": "Student_ID", "STRM": "Semester", "Course": "Course_ID",
+                           "Level": "Student_Level", "Plan": "Major",
+                           "COURSE": "Course_ID", "chosen_semester": "Semester",
+                          "STUDENT_ID" : "Student_ID","TRANSFER_TERM":"Semester",
+                          "UNT_TRNSFR":"CREDITS","CUM_GPA":"GPA"}
+    tc_data.rename(columns=rename_columns_dict, inplace=True)
+    ac_st_enrollment_data.rename(columns=rename_columns_dict, inplace=True)
+    ac_st_enrollment_data = ac_st_enrollment_data.fillna(0)
+    ac_st_enrollment_data = ac_st_enrollment_data.astype(str)
+    tc_data = tc_data.astype(str)
+    
+    # Strip whitespace from all columns
+    for df in [tc_data, ac_st_enrollment_data]:
+        for column in df.columns:
+            df[column] = df[column].str.strip()
+            
+    # Convert relevant columns to appropriate types
+    ac_st_enrollment_data["Student_Level"] = ac_st_enrollment_data["Student_Level"].str.extract('(\d+)', expand=False)
+    ac_st_enrollment_data = ac_st_enrollment_data.dropna(subset=["Student_Level"])
+    ac_st_enrollment_data["Semester"] = ac_st_enrollment_data["Semester"].astype(int)
+    ac_st_enrollment_data["Student_Level"] = ac_st_enrollment_data["Student_Level"].astype(int)
+    ac_st_enrollment_data["CREDITS"] = ac_st_enrollment_data["CREDITS"].astype(float)
+    ac_st_enrollment_data["Passed Credits"] = ac_st_enrollment_data["Passed Credits"].astype(float)
+    ac_st_enrollment_data["GPA"] = ac_st_enrollment_data["GPA"].astype(float)
+    ac_st_enrollment_data["MPA"] = ac_st_enrollment_data["MPA"].astype(float)
+    tc_data["Semester"] = tc_data["Semester"].astype(int)
+    tc_data["CREDITS"] = tc_data["CREDITS"].astype(float)
+    
+    ac_st_enrollment_data["CREDITS"] = ac_st_enrollment_data["CREDITS"].astype(int)
+    ac_st_enrollment_data["Passed Credits"] = ac_st_enrollment_data["Passed Credits"].astype(int)
+    tc_data["CREDITS"] = tc_data["CREDITS"].astype(int)
+    
+    max_semester_index = ac_st_enrollment_data.groupby('Student_ID')['Semester'].idxmax()
+    latest_major_df = ac_st_enrollment_data.loc[max_semester_index, ['Student_ID', 'Semester',
+                                                              "College", "Program", 'Major']]
+    
+    
+    ac_st_enrollment_data = pd.merge(ac_st_enrollment_data.drop(columns=["College", "Program", 'Major']),
+                          latest_major_df[["Student_ID", "College", "Program", 'Major']],
+                          left_on="Student_ID", right_on="Student_ID", how='inner')
+
+    tc_data = pd.merge(tc_data, latest_major_df[["Student_ID", "College", "Program", 'Major']],
+                           left_on="Student_ID", right_on="Student_ID", how='inner')
+    
+    # Define a function to determine the chosen semester
+    def determine_chosen_semester(row):
+        if row['Semester'] == row['min']:
+            return row['Semester']
+        else:
+            return row['min']
+        
+    semester_stats = ac_st_enrollment_data.groupby('Student_ID')['Semester'].agg(['min', 'max']).reset_index()
+    tc_data = tc_data.merge(semester_stats, on='Student_ID', how='left')
+    
+    tc_data['chosen_semester'] = tc_data.apply(determine_chosen_semester, axis=1)
+    tc_data = tc_data.drop(columns=["min", "max", "Semester", "SUBJECT","CATALOG_NBR"])
+    tc_data.rename(columns=rename_columns_dict, inplace=True)
+    grouped_data = ac_st_enrollment_data.groupby(['Student_ID', 'Semester']).agg({
+        'Student_Level': 'first',
+        'ADMIT_TERM': 'first',
+        'Passed Credits': 'first',
+        'Status': 'first',
+        'GPA': 'first',
+        'MPA': 'first'
+    }).reset_index()
+    
+    tc_data = pd.merge(tc_data, grouped_data, on=['Student_ID', 'Semester'], how='inner')
+
+    # Select and reorder columns
+    tc_data = tc_data[['Student_ID', 'Semester', 'Status', 'Student_Level',
+                       'Course_ID',"CREDITS", 'College', 'Program', 'Major', 'ADMIT_TERM',
+                       'Passed Credits', 'GPA', 'MPA']]
+
+    # Filter out unwanted records
+    values_to_delete = ['Visit', 'Non-Degree', 'Undeclared - English',
+                        'FA', 'F', 'I', 'S', 'NP', 'WA']
+
+    ac_st_enrollment_data = ac_st_enrollment_data[~ac_st_enrollment_data["Major"].isin(values_to_delete)]
+    ac_st_enrollment_data = ac_st_enrollment_data[['Student_ID', 'Semester','GRADE', 'Status', 'Student_Level',
+                                     'Course_ID',"CREDITS", 'College', 'Program', 'Major', 'ADMIT_TERM',
+                                     'Passed Credits', 'GPA', 'MPA']]
+    
+    # Combine data
+    combined_data = pd.concat([ac_st_enrollment_data, tc_data], axis=0)
+    combined_data["Major"] = combined_data['Major'].replace('Radio / TV', 'Digital Media Production')
+    
+    return combined_data
+
+def st_data_cleaning_rowwise(st_enrollment_data, transfer_credit_data):
+    combined_data = combine_student_history_rowwise(st_enrollment_data, transfer_credit_data)
+    return add_incoming_pcr_rowwise(combined_data)
+
+# Special conditions: one if/elif chain per major variant, replaced by the compiled predicates
+# (special_condition_builders / special_condition_variants)
+def is_eligible_special_acc(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Credits":
+        return (student_info['Passed Credits'] >= 81) or (int(student_info['Incoming_PCR']) >= 81)
+    elif condition == "Credits_College":
+        return (student_info['Passed Credits'] >= 81 and student_info['College'] == "CBA") or (int(student_info['Incoming_PCR']) >= 81 and student_info['College'] == "CBA") 
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "AND_Senior":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Student_Level'] == 4
+    elif condition == "Junior_AND_Major_ACC":
+        return student_info['Student_Level'] == 3 and student_info['Major'] == "Accounting"
+    elif condition == "AND_Major_ACC":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Accounting"
+    elif condition == "Senior":
+        return student_info['Student_Level'] == 4
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_ib(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior")
+    elif condition == "AND_Major_MG_IB_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing")
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Credits":
+        return (student_info['Passed Credits'] >= 81) or (int(student_info['Incoming_PCR']) >= 81)
+    elif condition == "Credits_College":
+        return (student_info['Passed Credits'] >= 81 and student_info['College'] == "CBA") or (int(student_info['Incoming_PCR']) >= 81 and student_info['College'] == "CBA")
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "Senior_And_Major_MG_IB":
+        return student_info['Student_Level'] == 4 and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior")
+    elif condition == "Junior_And_Major_IB":
+        return student_info['Student_Level'] == 3 and student_info['Major'] == "International Business"
+    elif condition == "Senior":
+        return student_info['Student_Level'] == 4
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_mob(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior")
+    elif condition == "AND_Major_MG_IB_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing")
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Credits":
+        return (student_info['Passed Credits'] >= 81) or (int(student_info['Incoming_PCR']) >= 81)
+    elif condition == "Credits_College":
+        return (student_info['Passed Credits'] >= 81 and student_info['College'] == "CBA") or (int(student_info['Incoming_PCR']) >= 81 and student_info['College'] == "CBA")
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "Senior_And_Major_MG_IB":
+        return student_info['Student_Level'] == 4 and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior")
+    elif condition == "Junior_And_Major_MOB":
+        return student_info['Student_Level'] == 3 and student_info['Major'] == "Mgmt & Organizational Behavior"
+    elif condition == "Senior":
+        return student_info['Student_Level'] == 4
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_mis(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Credits":
+        return (student_info['Passed Credits'] >= 81) or (int(student_info['Incoming_PCR']) >= 81)
+    elif condition == "Credits_College":
+        return (student_info['Passed Credits'] >= 81 and student_info['College'] == "CBA") or (int(student_info['Incoming_PCR']) >= 81 and student_info['College'] == "CBA")
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "Senior_AND_Major_MIS":
+        return student_info['Student_Level'] == 4 and student_info['Major'] == "Management Information Systems" 
+    elif condition == "Junior_AND_Major_MIS":
+        return student_info['Student_Level'] == 3 and student_info['Major'] == "Management Information Systems"
+    elif condition == "AND_Major_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Management Information Systems"
+    elif condition == "Senior":
+        return student_info['Student_Level'] == 4
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_Credits_MIS_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] < 45 and (student_info['Major'] == "Management Information Systems" or student_info['Major'] == "Computer Science")
+    else:
+        return False
+
+def is_eligible_special_mrkt(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing")
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Credits":
+        return (student_info['Passed Credits'] >= 81) or (int(student_info['Incoming_PCR']) >= 81)
+    elif condition == "Credits_College":
+        return (student_info['Passed Credits'] >= 81 and student_info['College'] == "CBA") or (int(student_info['Incoming_PCR']) >= 81 and student_info['College'] == "CBA")
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "Senior_AND_Major_MRKT":
+        return student_info['Student_Level'] == 4 and student_info['Major'] == "Marketing"
+    elif condition == "Junior_AND_Major_MRKT":
+        return student_info['Student_Level'] == 3 and student_info['Major'] == "Marketing"
+    elif condition == "AND_Major_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Marketing"
+    elif condition == "Senior":
+        return student_info['Student_Level'] == 4
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_fin(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Credits":
+        return (student_info['Passed Credits'] >= 81) or (int(student_info['Incoming_PCR']) >= 81)
+    elif condition == "Credits_College":
+        return (student_info['Passed Credits'] >= 81 and student_info['College'] == "CBA") or (int(student_info['Incoming_PCR']) >= 81 and student_info['College'] == "CBA") 
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "OR_AND":
+        return all(prereq in taken_courses for prereq in prereqs[:2]) or any(prereq in taken_courses for prereq in prereqs[2:])
+    elif condition == "Senior_AND_Major_FIN":
+        return student_info['Student_Level'] == 4 and student_info['Major'] == "Finance"
+    elif condition == "AND_Major_FIN":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Finance"
+    elif condition == "AND_Senior":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Student_Level'] == 4
+    elif condition == "Senior":
+        return student_info['Student_Level'] == 4
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_cs(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "OR_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Computer Science"
+    elif condition == "Junior_CS":
+        return student_info['Student_Level'] == 3 and student_info['Major'] == "Computer Science"
+    elif condition == "Senior_CS":
+        return student_info['Student_Level'] == 4 and student_info['Major'] == "Computer Science"
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "OR_AND_College_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_Credits_MIS_CS":
+        return (all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] < 45 and (student_info['Major'] == "Management Information Systems" or student_info['Major'] == "Computer Science")) or (all(prereq in taken_courses for prereq in prereqs) and int(student_info['Incoming_PCR']) < 45 and (student_info['Major'] == "Management Information Systems" or student_info['Major'] == "Computer Science"))
+    else:
+        return False
+
+def is_eligible_special_dmp(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "OR_MCOM":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM":
+        return (all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 54 and student_info['Program'] == "Mass Communication") or (all(prereq in taken_courses for prereq in prereqs) and int(student_info['Incoming_PCR']) >= 54 and student_info['Program'] == "Mass Communication")
+    elif condition == "AND_Credits_MCOM_2":
+        return (all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 60 and student_info['Program'] == "Mass Communication") or (all(prereq in taken_courses for prereq in prereqs) and int(student_info['Incoming_PCR']) >= 60 and student_info['Program'] == "Mass Communication")
+    elif condition == "AND_OR_2":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:3]) and any(prereq in taken_courses for prereq in prereqs[3:])
+    elif condition == "AND_OR_PR":
+        return (all(prereq in taken_courses for prereq in prereqs[:3]) and student_info['Major'] == "Public relations & Advertising") or all(prereq in taken_courses for prereq in prereqs[4:]) 
+    elif condition == "AND_OR_Junior_Program":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:]) and student_info['Student_Level'] == 3 and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "AND_Junior":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "Junior_Program":
+        return student_info['Student_Level'] == 3 and student_info['Program'] == "Mass Communication"
+    elif condition == "Senior_MCOM":
+        return student_info['Student_Level'] == 4 and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Junior_Program":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    else:
+        return False
+
+def is_eligible_special_eng_lin(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_UENG":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "English"
+    elif condition == "Senior_Lingusitics":
+        return student_info['Student_Level'] == 4 and student_info['Major'] == "Eng- Linguistics - Translation"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "Senior_AND_UENG":
+        return student_info['Student_Level'] == 4 and student_info['Program'] == "English"
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_LIN_LIT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Eng- Linguistics - Translation" or student_info['Major'] == "English Literature")
+    else:
+        return False
+
+def is_eligible_special_eng_edu(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_EDU":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "English Education"
+    elif condition == "AND_UENG":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "English"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "Any_Three":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 3
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Senior_Lingusitics":
+        return student_info['Student_Level'] == 4 and student_info['Major'] == "Eng- Linguistics - Translation"
+    elif condition == "Senior_AND_UENG":
+        return student_info['Student_Level'] == 4 and student_info['Program'] == "English"
+    else:
+        return False
+
+def is_eligible_special_eng_lit(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_UENG":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "English"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "Senior_Lingusitics":
+        return student_info['Student_Level'] == 4 and student_info['Major'] == "Eng- Linguistics - Translation"
+    elif condition == "Senior_AND_UENG":
+        return student_info['Student_Level'] == 4 and student_info['Program'] == "English"
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_LIN_LIT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Eng- Linguistics - Translation" or student_info['Major'] == "English Literature")
+    else:
+        return False
+
+def is_eligible_special_pr(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "OR_MCOM":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM":
+        return (all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 54 and student_info['Program'] == "Mass Communication") or (all(prereq in taken_courses for prereq in prereqs) and int(student_info['Incoming_PCR']) >= 54 and student_info['Program'] == "Mass Communication")
+    elif condition == "AND_Credits_MCOM_2":
+        return (all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 60 and student_info['Program'] == "Mass Communication") or (all(prereq in taken_courses for prereq in prereqs) and int(student_info['Incoming_PCR']) >= 60 and student_info['Program'] == "Mass Communication")
+    elif condition == "AND_OR_2":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:3]) and any(prereq in taken_courses for prereq in prereqs[3:])
+    elif condition == "AND_OR_PR":
+        return (all(prereq in taken_courses for prereq in prereqs[:3]) and student_info['Major'] == "Public relations & Advertising") or all(prereq in taken_courses for prereq in prereqs[4:])
+    elif condition == "AND_OR_Junior_Program":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:]) and student_info['Student_Level'] == 3 and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "Junior_Program":
+        return student_info['Student_Level'] == 3 and student_info['Program'] == "Mass Communication"
+    elif condition == "Senior_MCOM":
+        return student_info['Student_Level'] == 4 and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Junior":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Junior_Program":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    else:
+        return False
+
+def is_eligible_special_vc(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_MCOM":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM":
+        return (all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 54 and student_info['Program'] == "Mass Communication") or (all(prereq in taken_courses for prereq in prereqs) and int(student_info['Incoming_PCR']) >= 54 and student_info['Program'] == "Mass Communication")
+    elif condition == "AND_Credits_MCOM_2":
+        return (all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 60 and student_info['Program'] == "Mass Communication") or (all(prereq in taken_courses for prereq in prereqs) and int(student_info['Incoming_PCR']) >= 60 and student_info['Program'] == "Mass Communication")
+    elif condition == "AND_OR_Junior_Program":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:]) and student_info['Student_Level'] == 3 and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_OR_2":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:3]) and any(prereq in taken_courses for prereq in prereqs[3:])
+    elif condition == "AND_OR_PR":
+        return (all(prereq in taken_courses for prereq in prereqs[:3]) and student_info['Major'] == "Public relations & Advertising") or all(prereq in taken_courses for prereq in prereqs[4:])
+    elif condition == "Senior_MCOM":
+        return student_info['Student_Level'] == 4 and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "Junior_Program":
+        return student_info['Student_Level'] == 3 and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Junior":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Junior_Program":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    else:
+        return False
+
+def is_eligible_special_mgmt(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_College":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['College'] == "COE"
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_Senior":
+        return student_info['Student_Level'] == 4 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_OR_2":
+        return all(prereq in taken_courses for prereq in prereqs[:2]) and any(prereq in taken_courses for prereq in prereqs[3:])
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    else:
+        return False
+
+def is_eligible_special_elec(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_College":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['College'] == "COE"
+    elif condition == "OR_AND_College_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_Senior":
+        return student_info['Student_Level'] == 4 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_OR_2":
+        return all(prereq in taken_courses for prereq in prereqs[:2]) and any(prereq in taken_courses for prereq in prereqs[3:])
+    elif condition == "AND_3_Courses":
+        return all(prereq in taken_courses for prereq in prereqs[:3]) and sum(prereq in taken_courses for prereq in prereqs[3:]) >= 3
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    else:
+        return False
+
+def is_eligible_special_comp(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND":
+        return all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_College":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['College'] == "COE"
+    elif condition == "OR_AND_College_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_OR":
+        return prereqs and prereqs[0] in taken_courses and any(prereq in taken_courses for prereq in prereqs[1:])
+    elif condition == "Junior_ECOM":
+        return student_info['Student_Level'] == 3 and student_info['Program'] == "Computer Engineering"
+    elif condition == "Senior_ECOM":
+        return student_info['Student_Level'] == 4 and student_info['Program'] == "Computer Engineering"
+    elif condition == "AND_OR_2":
+        return all(prereq in taken_courses for prereq in prereqs[:2]) and any(prereq in taken_courses for prereq in prereqs[2:])
+    elif condition == "AND_OR_3":
+        return any(prereq in taken_courses for prereq in prereqs[:2]) and all(prereq in taken_courses for prereq in prereqs[2:])
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_3_Courses":
+        return all(prereq in taken_courses for prereq in prereqs[:3]) and sum(prereq in taken_courses for prereq in prereqs[3:]) >= 3
+    elif condition == "Any_Two":
+        return sum(prereq in taken_courses for prereq in prereqs) >= 2
+    elif condition == "AND_Senior":
+        return student_info['Student_Level'] == 4 and all(prereq in taken_courses for prereq in prereqs)
+    else:
+        return False
+
+def is_eligible_special_acc_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_Senior":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Student_Level'] == 4
+    elif condition == "AND_Major_ACC":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Accounting"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_ib_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior")
+    elif condition == "AND_Major_MG_IB_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing")
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_mob_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior")
+    elif condition == "AND_Major_MG_IB_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing")
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_mis_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_Major_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Management Information Systems"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_Credits_MIS_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] < 45 and (student_info['Major'] == "Management Information Systems" or student_info['Major'] == "Computer Science")
+    else:
+        return False
+
+def is_eligible_special_mrkt_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Major_MG_IB_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing")
+    elif condition == "AND_Major_MG_IB_MRKT_MIS":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "International Business" or student_info['Major'] == "Mgmt & Organizational Behavior" or student_info['Major'] == "Marketing" or student_info['Major'] == "Management Information Systems")
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_Major_MRKT":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Marketing"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_fin_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_Major_FIN":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Finance"
+    elif condition == "AND_Senior":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Student_Level'] == 4
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    else:
+        return False
+
+def is_eligible_special_cs_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "OR_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "Computer Science"
+    elif condition == "OR_AND_College_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_Credits_MIS_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] < 45 and (student_info['Major'] == "Management Information Systems" or student_info['Major'] == "Computer Science")
+    else:
+        return False
+
+def is_eligible_special_dmp_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "OR_MCOM":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 54 and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM_2":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 60 and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "AND_Junior":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "OR_MCOM":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Junior_Program":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    else:
+        return False
+
+def is_eligible_special_eng_lin_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_UENG":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "English"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_LIN_LIT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Eng- Linguistics - Translation" or student_info['Major'] == "English Literature")
+    else:
+        return False
+
+def is_eligible_special_eng_edu_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_EDU":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] == "English Education"
+    elif condition == "AND_UENG":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "English"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    else:
+        return False
+
+def is_eligible_special_eng_lit_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_UENG":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "English"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_LIN_LIT":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Eng- Linguistics - Translation" or student_info['Major'] == "English Literature")
+    else:
+        return False
+
+def is_eligible_special_pr_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "OR_MCOM":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 54 and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM_2":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 60 and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "AND_Junior":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Junior_Program":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    else:
+        return False
+
+def is_eligible_special_vc_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_MCOM":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 54 and student_info['Program'] == "Mass Communication"
+    elif condition == "AND_Credits_MCOM_2":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Passed Credits'] >= 60 and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_Program_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Program'] == "Mass Communication" or student_info['Program'] == "English")
+    elif condition == "AND_Junior":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_Junior_Program":
+        return student_info['Student_Level'] == 3 and all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] == "Mass Communication"
+    elif condition == "OR_AND_NOT_CS":
+        return any(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    elif condition == "AND_NOT_ENGLISH":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Program'] != "English"
+    elif condition == "AND_NOT_CS":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['Major'] != "Computer Science"
+    else:
+        return False
+
+def is_eligible_special_mgmt_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_College":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['College'] == "COE"
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    else:
+        return False
+
+def is_eligible_special_elec_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_College":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['College'] == "COE"
+    elif condition == "OR_AND_College_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_Senior":
+        return student_info['Student_Level'] == 4 and all(prereq in taken_courses for prereq in prereqs)
+    else:
+        return False
+
+def is_eligible_special_comp_(course, taken_courses, student_info,prerequisites,conditions):
+    prereqs = prerequisites.get(course, [])
+    condition = conditions.get(course, "")
+    
+    if condition == "OR":
+        return any(prereq in taken_courses for prereq in prereqs)
+    elif condition == "AND_College":
+        return all(prereq in taken_courses for prereq in prereqs) and student_info['College'] == "COE"
+    elif condition == "OR_AND_College_OR":
+        return any(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_College_OR":
+        return all(prereq in taken_courses for prereq in prereqs) and (student_info['Major'] == "Computer Science" or student_info['College'] == "COE")
+    elif condition == "AND_Senior":
+        return student_info['Student_Level'] == 4 and all(prereq in taken_courses for prereq in prereqs)
+    else:
+        return False
+
+# Future eligibility: every prerequisite list rescanned per hypothetical course, replaced by
+# find_additional_eligibilities_masked / _compiled and the per-major unlock tables
+def is_eligible(course, taken_courses, prerequisites):
+    prereqs = prerequisites.get(course, [])
+    return all(prereq in taken_courses for prereq in prereqs)
+
+def find_additional_eligibilities(courses, taken_courses, prerequisites):
+    additional_eligibilities = set()
+    for course in courses:
+        hypothetical_courses = taken_courses.copy()
+        hypothetical_courses.add(course)
+        for c in prerequisites.keys():
+            if is_eligible(c, hypothetical_courses, prerequisites) and c not in hypothetical_courses:
+                additional_eligibilities.add(c)
+    return list(additional_eligibilities)
+
+def find_additional_eligibilities_special(courses, taken_courses, student_info, prerequisites_special, conditions, is_eligible_special):
+    additional_eligibilities = set()
+    hypothetical_courses = taken_courses.copy()
+    for course in courses:
+        hypothetical_courses.add(course)
+        for c in prerequisites_special.keys():
+            if is_eligible_special(c, hypothetical_courses, student_info, prerequisites_special, conditions) and c not in hypothetical_courses:
+                additional_eligibilities.add(c)
+    return list(additional_eligibilities)
+
+# Eligibility merge and co-requisites: row-by-row, replaced by combine_eligible_courses and
+# add_co_requisite_courses
+def combine_eligible_courses_rowwise(df1, df2):
+    if df1.shape != df2.shape:
+        raise ValueError("Dataframes do not have the same shape.")
+    
+    if list(df1.columns) != list(df2.columns):
+        raise ValueError("Dataframes do not have the same headers.")
+    
+    combined_data = []
+    for index, row in df1.iterrows():
+        combined_row = row.copy()
+        combined_courses = list(set(row['Eligible_Courses'] + df2.loc[index, 'Eligible_Courses']))
+        combined_row['Eligible_Courses'] = combined_courses
+        combined_data.append(combined_row)
+    
+    combined_df = pd.DataFrame(combined_data)
+    
+    return combined_df
+
+def find_course_combinations(student_courses, requisites_data):
+    combinations = []
+    for _, row in requisites_data.iterrows():
+        requisites_list = row['REQUISITES_LIST']
+        course_id = row['Course_ID']
+        if all(course in student_courses for course in requisites_list):
+            combination = requisites_list + [course_id]
+            combinations.append(combination)
+    return combinations
+
+def create_combined_courses(row, co):
+    eligible_courses = row['Eligible_Courses']
+    combined_courses = eligible_courses[:]
+    co_requisite_courses = []
+    combinations = find_course_combinations(eligible_courses, co)
+    for combination in combinations:
+        combined_courses += combination
+        co_requisite_courses.append(combination)
+    row['Co_Requisite_Courses'] = co_requisite_courses
+    row['Eligible_Courses_CO'] = list(set(combined_courses))
+    return row
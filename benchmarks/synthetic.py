@@ -0,0 +1,177 @@
+import pandas as pd
+import ast
+import numpy as np
+import re
+import time
+from sqlalchemy import event
+
+from eligibility_data import (
+    DB_POOL_SIZE,
+    active_students_query,
+    create_db_engine,
+    new_pool_stats,
+    st_enrollment_delta_query,
+    st_enrollment_query,
+)
+
+# Synthetic student data and a local warehouse stand-in, used by the benchmarks and tests (never by the reports)
+synthetic_major_profiles = {
+    "Accounting": ("CBA", "Accounting", "ACCOUNTING"),
+    "International Business": ("CBA", "Business Administration", "INTL BUSIN"),
+    "Mgmt & Organizational Behavior": ("CBA", "Business Administration", "MANAGEMENT"),
+    "Management Information Systems": ("CBA", "Management Information Systems", "MIS"),
+    "Marketing": ("CBA", "Marketing", "MARKETING2"),
+    "Finance": ("CBA", "Finance", "FINANCE"),
+    "Computer Science": ("CAS", "Computer Science", "COMSCIENCE"),
+    "Radio / TV": ("CAS", "Mass Communication", "DIGITALMED"),
+    "Digital Media Production": ("CAS", "Mass Communication", "DIGITALMED"),
+    "Eng- Linguistics - Translation": ("CAS", "English", "LINGUISTIC"),
+    "English Education": ("CAS", "English", "ENGLISH"),
+    "English Literature": ("CAS", "English", "LITERATURE"),
+    "Public relations & Advertising": ("CAS", "Mass Communication", "PR / ADV"),
+    "Visual Communication": ("CAS", "Mass Communication", "VISUAL COM"),
+    "Engineering Management": ("COE", "Engineering Management", "MGMTENG"),
+    "Electrical Engineering": ("COE", "Electrical Engineering", "ELECENG"),
+    "Computer Engineering": ("COE", "Computer Engineering", "COMPENG"),
+}
+
+def generate_synthetic_student_data(major_data, n_students=500, seed=0,
+                                    terms=(2110, 2120, 2130, 2210, 2220, 2310, 2320, 2410, 2420)):
+    rng = np.random.default_rng(seed)
+    all_courses = major_data["All_Courses"]
+
+    def parse_requisites(value):
+        try:
+            return ast.literal_eval(value)
+        except (ValueError, SyntaxError):
+            return []
+
+    # Course order and prerequisites per sheet major, so histories follow the catalog
+    major_courses = {}
+    major_requisites = {}
+    for sheet_major, group in all_courses.groupby("Major"):
+        major_courses[sheet_major] = group.sort_values("Course_Level")["Course_ID"].drop_duplicates().tolist()
+        major_requisites[sheet_major] = dict(zip(group["Course_ID"], group["REQUISITES_LIST"].apply(parse_requisites)))
+
+    level_labels = {1: "1- Freshman", 2: "2- Sophomore", 3: "3- Junior", 4: "4- Senior"}
+    grades = ["A", "B", "C", "D", "F", "FA", "W", "P", "NP", "I"]
+    grade_weights = [.2, .2, .2, .1, .08, .04, .08, .05, .03, .02]
+    majors = list(synthetic_major_profiles)
+
+    enrollment_rows = []
+    transfer_rows = []
+    for index in range(n_students):
+        student_id = f" {100000 + index} "
+        major = majors[rng.integers(len(majors))]
+        sheet_major = synthetic_major_profiles[major][2]
+        courses = major_courses[sheet_major]
+        requisites = major_requisites[sheet_major]
+        n_semesters = int(rng.integers(1, 7))
+        start = int(rng.integers(0, len(terms) - n_semesters + 1))
+        passed_credits = 0
+        taken = set()
+
+        for position, term in enumerate(terms[start:start + n_semesters]):
+            is_latest = position == n_semesters - 1
+            # Some students change major before their latest semester
+            term_major = major if is_latest or rng.random() > 0.1 else majors[rng.integers(len(majors))]
+            college, program, plan_id = synthetic_major_profiles[term_major]
+            level = level_labels[min(4, 1 + passed_credits // 30)] if rng.random() > 0.02 else "NA"
+
+            candidates = [course for course in courses if course not in taken
+                          and (all(req in taken for req in requisites[course]) or rng.random() < 0.05)]
+            n_courses = min(int(rng.integers(2, 6)), len(candidates))
+            picks = list(rng.choice(candidates, size=n_courses, replace=False)) if n_courses else []
+            if position == 0 and rng.random() < 0.3:
+                picks.append(rng.choice(["ENGL097", "ENGL098", "MATH094", "MATH095", "MATH096"]))
+            taken.update(picks)
+
+            for course in picks:
+                grade = None if is_latest and rng.random() < 0.7 else rng.choice(grades, p=grade_weights)
+                enrollment_rows.append({
+                    "EMPLID": student_id, "Status": " Active ", "STRM": term, "Level": level,
+                    "Course": str(course), "GRADE": grade, "CREDITS": 3.0, "Course_Department": "Dept",
+                    "College": college, "Program": program, "Plan": term_major,
+                    "ADMIT_TERM": str(terms[start]), "ACAD_PROG": "UGRD", "ACAD_PLAN": plan_id,
+                    "Passed Credits": float(passed_credits), "CUM_GPA": round(float(rng.uniform(1.5, 4)), 3),
+                    "MPA": None if rng.random() < 0.1 else round(float(rng.uniform(1.5, 4)), 2),
+                    "PROG_STATUS": "AC", "ACAD_CAREER": "UGRD"})
+            if not is_latest or rng.random() < 0.5:
+                passed_credits += 3 * len(picks)
+
+        if rng.random() < 0.15:
+            for course in rng.choice(courses[:20], size=2, replace=False):
+                transfer_rows.append({
+                    "Course_ID": str(course), "STUDENT_ID": student_id, "STUDENT_NAME": "Synthetic Student",
+                    "TRANSFER_TERM": int(terms[start]), "UNT_TRNSFR": 3.0,
+                    "SUBJECT": str(course)[:4], "CATALOG_NBR": str(course)[4:]})
+
+    enrollment_data = pd.DataFrame(enrollment_rows).sort_values(["STRM", "EMPLID"], kind="stable").reset_index(drop=True)
+    transfer_data = pd.DataFrame(transfer_rows, columns=["Course_ID", "STUDENT_ID", "STUDENT_NAME", "TRANSFER_TERM",
+                                                         "UNT_TRNSFR", "SUBJECT", "CATALOG_NBR"])
+    return enrollment_data, transfer_data
+
+def create_sqlite_db(tables, db_path, latency=0.0, pool_size=DB_POOL_SIZE):
+    # Local SQLite stand-in for the warehouse holding {table name: frame}; latency (seconds) is
+    # added to every SELECT
+    pool_stats = new_pool_stats()
+    engine = create_db_engine(f"sqlite:///{db_path}", pool_stats, pool_size=pool_size, max_overflow=0)
+
+    @event.listens_for(engine, "connect")
+    def add_concat(dbapi_connection, connection_record):
+        # T-SQL CONCAT, NULLs as empty strings (SQLite only has it from 3.44)
+        dbapi_connection.create_function("CONCAT", -1, lambda *parts: "".join("" if part is None else str(part) for part in parts))
+
+    with engine.begin() as conn:
+        for name, frame in tables.items():
+            frame.to_sql(name, conn, if_exists="replace", index=False)
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def add_latency(conn, cursor, statement, parameters, context, executemany):
+        if latency and statement.lstrip().upper().startswith("SELECT"):
+            time.sleep(latency)
+
+    return engine, pool_stats
+
+def create_benchmark_db(enrollment_data, transfer_data, db_path, latency=0.0, pool_size=DB_POOL_SIZE):
+    # The extracts as tables of their own, for SELECT * benchmarks of the fetch layer
+    return create_sqlite_db({"ActiveStudentEnrollmentFull": enrollment_data, "StudentCourseTransfer": transfer_data},
+                            db_path, latency, pool_size)
+
+# Warehouse tables the production queries read, rebuilt from the synthetic extracts so that the
+# queries return those extracts (Level "NA" is a missing AcademicLevelID)
+academic_level_ids = {"1- Freshman": "10", "2- Sophomore": "20", "3- Junior": "30", "4- Senior": "40"}
+
+def warehouse_tables(enrollment_data, transfer_data):
+    enrollment = pd.DataFrame({
+        "StudentID": enrollment_data["EMPLID"], "ProgramStatusTitle": enrollment_data["Status"],
+        "Semester": enrollment_data["STRM"], "AcademicLevelID": enrollment_data["Level"].map(academic_level_ids),
+        "CourseSubject": enrollment_data["Course"].str[:4], "CourseCode": enrollment_data["Course"].str[4:],
+        "LetterGrade": enrollment_data["GRADE"], "CourseUnits": enrollment_data["CREDITS"],
+        "CourseDepartmentDescription": enrollment_data["Course_Department"], "StudentCollegeID": enrollment_data["College"],
+        "StudentProgramDescription": enrollment_data["Program"], "StudentPlanDescription": enrollment_data["Plan"],
+        "AdmitSemester": enrollment_data["ADMIT_TERM"], "StudentProgramID": enrollment_data["ACAD_PROG"],
+        "StudentPlanID": enrollment_data["ACAD_PLAN"], "UnitPassed": enrollment_data["Passed Credits"],
+        "CumulativeGPA": enrollment_data["CUM_GPA"], "MPA": enrollment_data["MPA"],
+        "ProgramStatusID": enrollment_data["PROG_STATUS"], "ClassType": "E"})
+    students = enrollment_data["EMPLID"].drop_duplicates()
+    transfer_names = transfer_data.drop_duplicates("STUDENT_ID").set_index("STUDENT_ID")["STUDENT_NAME"]
+    master = pd.DataFrame({"StudentID": students, "AcademicCareer": "UGRD", "ProgramStatusID": "AC  ",
+                           "Fullname": students.map(transfer_names).fillna("Synthetic Student")})
+    transfer = pd.DataFrame({
+        "StudentID": transfer_data["STUDENT_ID"], "CourseSubject": transfer_data["SUBJECT"], "CourseCode": transfer_data["CATALOG_NBR"],
+        "TransferSemester": transfer_data["TRANSFER_TERM"], "TransferUnit": transfer_data["UNT_TRNSFR"]})
+    return {"ActiveStudentEnrollmentFull": enrollment, "StudentMaster": master, "StudentCourseTransfer": transfer}
+
+def create_warehouse_db(enrollment_data, transfer_data, db_path, latency=0.0, pool_size=DB_POOL_SIZE):
+    # The warehouse tables behind the extracts, for running the production queries (see warehouse_query)
+    return create_sqlite_db(warehouse_tables(enrollment_data, transfer_data), db_path, latency, pool_size)
+
+def warehouse_query(query):
+    # A production T-SQL query as SQLite runs it against create_warehouse_db: tables without their
+    # database and schema, no N'' literals and no non-breaking spaces (SQL Server reads them as whitespace)
+    return re.sub(r"\bN'", "'", query.replace("[GUST-DW-Staging].DataBridge.", "").replace("\xa0", " "))
+
+def warehouse_sync_queries():
+    # The enrollment snapshot sync's full, delta and active-student queries for create_warehouse_db
+    return tuple(warehouse_query(query) for query in (st_enrollment_query, st_enrollment_delta_query, active_students_query))
@@ -0,0 +1,651 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pandas.api.types import union_categoricals
+from sqlalchemy import create_engine, event, text
+
+# Database access, enrollment ingestion and history cleaning of the Course Eligibility and
+# Recommendation System; the Streamlit app and the pipeline workers import it from here
+
+# pyarrow backs the enrollment snapshot partitions and the compact ID columns
+ID_STRING_DTYPE = "string[pyarrow]"
+
+# Database connection settings, overridable through environment variables
+DB_SERVER = os.environ.get("GUST_DB_SERVER", "192.168.8.11")
+DB_DATABASE = os.environ.get("GUST_DB_DATABASE", "GUST-DW-Staging")
+DB_CONNECTION_URL = os.environ.get(
+    "GUST_DB_URL",
+    f'mssql+pyodbc://{DB_SERVER}/{DB_DATABASE}?trusted_connection=yes&driver=ODBC+Driver+17+for+SQL+Server')
+
+# Connection pool settings (shared by every Streamlit session in this process)
+DB_POOL_SIZE = int(os.environ.get("GUST_DB_POOL_SIZE", 5))
+DB_MAX_OVERFLOW = int(os.environ.get("GUST_DB_MAX_OVERFLOW", 5))
+DB_POOL_TIMEOUT = int(os.environ.get("GUST_DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.environ.get("GUST_DB_POOL_RECYCLE", 1800))
+DB_POOL_PRE_PING = os.environ.get("GUST_DB_POOL_PRE_PING", "1") == "1"
+
+# Streaming ingestion settings for the large enrollment query
+DB_STREAM_ENROLLMENT = os.environ.get("GUST_DB_STREAM_ENROLLMENT", "1") == "1"
+DB_STREAM_CHUNK_SIZE = int(os.environ.get("GUST_DB_STREAM_CHUNK_SIZE", 50000))
+# Fetch enrollment columns straight into their final dtypes instead of text
+DB_TYPED_INGESTION = os.environ.get("GUST_DB_TYPED_INGESTION", "1") == "1"
+# Only fetch students whose latest plan is one of the selected majors
+DB_MAJOR_PUSHDOWN = os.environ.get("GUST_DB_MAJOR_PUSHDOWN", "1") == "1"
+
+# Enrollment sync: "direct" pulls everything each run, "delta" refreshes a local Parquet
+# snapshot from the last synced term onwards, "full" rebuilds that snapshot
+ENROLLMENT_SYNC_MODE = os.environ.get("GUST_ENROLLMENT_SYNC_MODE", "direct")
+SNAPSHOT_DIR = os.environ.get("GUST_SNAPSHOT_DIR", "enrollment_snapshot")
+SNAPSHOT_MAX_AGE_DAYS = float(os.environ.get("GUST_SNAPSHOT_MAX_AGE_DAYS", 7))
+
+def new_pool_stats():
+    return {
+        "lock": threading.Lock(),
+        "local": threading.local(),
+        "connections_created": 0,
+        "connect_time_total": 0.0,
+        "connect_time_max": 0.0,
+        "checkouts": 0,
+        "checkins": 0,
+        "checkout_wait_total": 0.0,
+        "checkout_wait_max": 0.0,
+        "invalidated": 0,
+    }
+
+def create_db_engine(connection_url, pool_stats, pool_size=DB_POOL_SIZE, max_overflow=DB_MAX_OVERFLOW,
+                     pool_timeout=DB_POOL_TIMEOUT, pool_recycle=DB_POOL_RECYCLE, pool_pre_ping=DB_POOL_PRE_PING):
+    engine = create_engine(connection_url, pool_size=pool_size, max_overflow=max_overflow,
+                           pool_timeout=pool_timeout, pool_recycle=pool_recycle, pool_pre_ping=pool_pre_ping)
+
+    # Time every new DBAPI connection (do_connect fires before the driver connects, connect after)
+    @event.listens_for(engine, "do_connect")
+    def start_connect_timer(dialect, conn_rec, cargs, cparams):
+        pool_stats["local"].connect_started = time.perf_counter()
+
+    @event.listens_for(engine, "connect")
+    def record_connect(dbapi_connection, connection_record):
+        elapsed = time.perf_counter() - getattr(pool_stats["local"], "connect_started", time.perf_counter())
+        pool_stats["local"].connect_seconds = getattr(pool_stats["local"], "connect_seconds", 0.0) + elapsed
+        with pool_stats["lock"]:
+            pool_stats["connections_created"] += 1
+            pool_stats["connect_time_total"] += elapsed
+            pool_stats["connect_time_max"] = max(pool_stats["connect_time_max"], elapsed)
+
+    @event.listens_for(engine, "checkout")
+    def record_checkout(dbapi_connection, connection_record, connection_proxy):
+        with pool_stats["lock"]:
+            pool_stats["checkouts"] += 1
+
+    @event.listens_for(engine, "checkin")
+    def record_checkin(dbapi_connection, connection_record):
+        with pool_stats["lock"]:
+            pool_stats["checkins"] += 1
+
+    @event.listens_for(engine, "invalidate")
+    def record_invalidate(dbapi_connection, connection_record, exception):
+        with pool_stats["lock"]:
+            pool_stats["invalidated"] += 1
+
+    return engine
+
+@st.cache_resource
+def get_db_pool_stats():
+    return new_pool_stats()
+
+# One long-lived engine per server process, reused across sessions and reruns
+@st.cache_resource
+def get_db_engine():
+    return create_db_engine(DB_CONNECTION_URL, get_db_pool_stats())
+
+def connect_with_stats(engine, pool_stats):
+    # Checkout wait = time spent in engine.connect() minus any new-connection latency
+    pool_stats["local"].connect_seconds = 0.0
+    started = time.perf_counter()
+    conn = engine.connect()
+    wait = max(time.perf_counter() - started - pool_stats["local"].connect_seconds, 0.0)
+    with pool_stats["lock"]:
+        pool_stats["checkout_wait_total"] += wait
+        pool_stats["checkout_wait_max"] = max(pool_stats["checkout_wait_max"], wait)
+    return conn
+
+def get_db_pool_status(engine, pool_stats):
+    pool = engine.pool
+    with pool_stats["lock"]:
+        checkouts = pool_stats["checkouts"]
+        created = pool_stats["connections_created"]
+        status = {
+            "pool_size": pool.size() if hasattr(pool, "size") else None,
+            "checked_out": pool.checkedout() if hasattr(pool, "checkedout") else None,
+            "overflow": pool.overflow() if hasattr(pool, "overflow") else None,
+            "checkouts": checkouts,
+            "checkins": pool_stats["checkins"],
+            "avg_checkout_wait_ms": round(pool_stats["checkout_wait_total"] / checkouts * 1000, 2) if checkouts else 0.0,
+            "max_checkout_wait_ms": round(pool_stats["checkout_wait_max"] * 1000, 2),
+            "connections_created": created,
+            "avg_connect_latency_ms": round(pool_stats["connect_time_total"] / created * 1000, 2) if created else 0.0,
+            "max_connect_latency_ms": round(pool_stats["connect_time_max"] * 1000, 2),
+            "invalidated": pool_stats["invalidated"],
+        }
+    return status
+
+def fetch_data_from_db(query, engine=None, pool_stats=None, params=None):
+    if engine is None:
+        engine = get_db_engine()
+        pool_stats = get_db_pool_stats()
+    conn = None  # Initialize the connection variable
+
+    try:
+        # Borrow a pooled connection
+        conn = connect_with_stats(engine, pool_stats) if pool_stats is not None else engine.connect()
+        print("Connection successful")
+        
+        # Fetch data into a DataFrame (named :bind parameters go through text())
+        df = pd.read_sql(text(query), conn, params=params) if params else pd.read_sql(query, conn)
+        
+        return df  # Return the DataFrame
+
+    except Exception as e:
+        print(f"Error: {e}")
+        
+    finally:
+        # Return the connection to the pool; the engine itself stays alive
+        if conn:
+            conn.close()
+            print("Connection returned to pool")
+
+def compact_enrollment_chunk(chunk):
+    # Apply st_data_cleaning's text normalisation (missing -> "0", stripped) once per chunk,
+    # so text columns can be kept as categories and integer columns downcast
+    for column in chunk.columns:
+        if chunk[column].dtype == object:
+            chunk[column] = chunk[column].fillna(0).astype(str).str.strip().astype("category")
+        elif pd.api.types.is_integer_dtype(chunk[column]):
+            chunk[column] = pd.to_numeric(chunk[column], downcast="integer")
+    return chunk
+
+# Final dtypes for the typed ingestion path (raw query column names); every other
+# text column becomes a category
+enrollment_column_dtypes = {
+    "EMPLID": ID_STRING_DTYPE,
+    "STRM": "int32",
+    "Level": "Int8",
+    "CREDITS": "int16",
+    "Passed Credits": "int16",
+    # GPA/MPA stay float64 so they come out exactly as stored
+    "CUM_GPA": "float64",
+    "MPA": "float64",
+}
+
+def type_enrollment_chunk(chunk):
+    # Same normalisation as st_data_cleaning (missing -> 0, stripped, level number extracted),
+    # done once per column so the cleaning step can skip its astype(str) round-trip
+    for column in chunk.columns:
+        values = chunk[column].fillna(0)
+        dtype = enrollment_column_dtypes.get(column)
+        if column == "EMPLID":
+            chunk[column] = values.astype(str).str.strip().astype(dtype)
+        elif column == "Level":
+            # Map each distinct label once; labels without a number become <NA> and are dropped later
+            labels = values.astype(str).str.strip().astype("category")
+            levels = pd.to_numeric(labels.cat.categories.str.extract(r"(\d+)", expand=False)).to_numpy(dtype=float)
+            chunk[column] = pd.array(levels[labels.cat.codes.to_numpy()], dtype=dtype)
+        elif dtype is not None:
+            if values.dtype == object:
+                values = values.astype(str).str.strip()
+            chunk[column] = pd.to_numeric(values).astype(float).astype(dtype)
+        elif values.dtype == object:
+            chunk[column] = values.astype(str).str.strip().astype("category")
+    return chunk
+
+def combine_compact_chunks(column_buffers):
+    combined = {}
+    for column, parts in column_buffers.items():
+        if all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            combined[column] = union_categoricals(parts)
+        else:
+            combined[column] = pd.concat(parts, ignore_index=True)
+    return pd.DataFrame(combined)
+
+def fetch_data_from_db_chunked(query, chunksize=DB_STREAM_CHUNK_SIZE, engine=None, pool_stats=None, ingestion_stats=None, params=None,
+                               typed=DB_TYPED_INGESTION):
+    if engine is None:
+        engine = get_db_engine()
+        pool_stats = get_db_pool_stats()
+    conn = None
+    started = time.perf_counter()
+
+    try:
+        conn = connect_with_stats(engine, pool_stats) if pool_stats is not None else engine.connect()
+        # Server-side cursor: only one chunk of raw rows is held in memory at a time
+        conn = conn.execution_options(stream_results=True, max_row_buffer=chunksize)
+
+        column_buffers = {}
+        n_chunks = 0
+        n_rows = 0
+        chunks = pd.read_sql(text(query), conn, params=params, chunksize=chunksize) if params else pd.read_sql(query, conn, chunksize=chunksize)
+        for chunk in chunks:
+            chunk = type_enrollment_chunk(chunk) if typed else compact_enrollment_chunk(chunk)
+            for column in chunk.columns:
+                column_buffers.setdefault(column, []).append(chunk[column].reset_index(drop=True))
+            n_chunks += 1
+            n_rows += len(chunk)
+
+        df = combine_compact_chunks(column_buffers)
+        elapsed = time.perf_counter() - started
+        stats = {
+            "chunks": n_chunks,
+            "rows": n_rows,
+            "chunk_size": chunksize,
+            "seconds": round(elapsed, 3),
+            "rows_per_second": round(n_rows / elapsed, 1) if elapsed > 0 else None,
+            "buffer_mb": round(df.memory_usage(deep=True).sum() / 1024 ** 2, 2),
+        }
+        if ingestion_stats is not None:
+            ingestion_stats.update(stats)
+        print(f"Streamed {n_rows} rows in {n_chunks} chunks ({stats['rows_per_second']} rows/s, {stats['buffer_mb']} MB buffer)")
+        return df
+
+    except Exception as e:
+        print(f"Error: {e}")
+
+    finally:
+        if conn:
+            conn.close()
+            print("Connection returned to pool")
+
+@st.cache_resource
+def get_snapshot_lock():
+    return threading.Lock()
+
+def read_snapshot_manifest(snapshot_dir):
+    manifest_path = os.path.join(snapshot_dir, "manifest.json")
+    if not os.path.exists(manifest_path):
+        return None
+    with open(manifest_path) as f:
+        return json.load(f)
+
+def write_snapshot_manifest(snapshot_dir, manifest):
+    temp_path = os.path.join(snapshot_dir, "manifest.json.tmp")
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_path, os.path.join(snapshot_dir, "manifest.json"))
+
+def write_snapshot_partition(snapshot_dir, term, term_data):
+    # Write next to the target and swap in, so readers never see a half-written partition
+    partition_path = os.path.join(snapshot_dir, f"STRM={term}.parquet")
+    term_data.to_parquet(partition_path + ".tmp", index=False)
+    os.replace(partition_path + ".tmp", partition_path)
+
+def load_enrollment_snapshot(snapshot_dir, manifest):
+    column_buffers = {}
+    for term in sorted(manifest["partitions"]):
+        term_data = pd.read_parquet(os.path.join(snapshot_dir, f"STRM={term}.parquet"))
+        # Parquet restores the string dtype but not its pyarrow storage
+        string_columns = term_data.select_dtypes("string").columns
+        term_data = term_data.astype(dict.fromkeys(string_columns, ID_STRING_DTYPE))
+        for column in term_data.columns:
+            column_buffers.setdefault(column, []).append(term_data[column])
+    return combine_compact_chunks(column_buffers)
+
+def sync_enrollment_snapshot(mode="delta", snapshot_dir=SNAPSHOT_DIR, engine=None, pool_stats=None,
+                             chunksize=DB_STREAM_CHUNK_SIZE, max_age_days=SNAPSHOT_MAX_AGE_DAYS, sync_stats=None,
+                             snapshot_lock=None, queries=None):
+    if engine is None:
+        engine = get_db_engine()
+        pool_stats = get_db_pool_stats()
+    if snapshot_lock is None:
+        snapshot_lock = get_snapshot_lock()
+    # Full, delta and active-student queries
+    if queries is None:
+        queries = (st_enrollment_query, st_enrollment_delta_query, active_students_query)
+    full_query, delta_query, active_query = queries
+
+    with snapshot_lock:
+        os.makedirs(snapshot_dir, exist_ok=True)
+        manifest = read_snapshot_manifest(snapshot_dir)
+        # Fall back to a full resync when there is no snapshot or it is too old
+        # (grade changes in terms before the watermark are only picked up by a full resync)
+        if manifest is None or time.time() - manifest["last_full_sync"] > max_age_days * 86400:
+            mode = "full"
+
+        if mode == "full":
+            delta = fetch_data_from_db_chunked(full_query, chunksize, engine, pool_stats)
+        else:
+            delta = fetch_data_from_db_chunked(delta_query, chunksize, engine, pool_stats,
+                                               params={"last_synced_term": manifest["last_synced_term"]})
+        if delta is None:
+            raise RuntimeError("Enrollment sync failed, the snapshot was left unchanged.")
+
+        delta_terms = delta["STRM"].astype(str).str.strip()
+        synced_terms = sorted(delta_terms.unique())
+        if mode == "full":
+            # Drop every existing partition
+            stale_terms = list((manifest or {"partitions": {}})["partitions"])
+            manifest = {"last_synced_term": None, "last_full_sync": time.time(), "partitions": {}}
+        else:
+            # Replace the partitions from the watermark onwards and leave older terms alone
+            stale_terms = [term for term in manifest["partitions"]
+                           if term >= manifest["last_synced_term"] and term not in synced_terms]
+        for term in stale_terms:
+            os.remove(os.path.join(snapshot_dir, f"STRM={term}.parquet"))
+            manifest["partitions"].pop(term, None)
+        for term in synced_terms:
+            term_data = delta[(delta_terms == term).to_numpy()].reset_index(drop=True)
+            write_snapshot_partition(snapshot_dir, term, term_data)
+            manifest["partitions"][term] = len(term_data)
+        manifest["last_synced_term"] = max(manifest["partitions"]) if manifest["partitions"] else None
+        write_snapshot_manifest(snapshot_dir, manifest)
+
+        snapshot = load_enrollment_snapshot(snapshot_dir, manifest)
+
+    rows_transferred = len(delta)
+    active_ids = None
+    if mode != "full":
+        # Older partitions may hold students who are no longer active: keep only the students
+        # a full pull would return (the full query's StudentMaster filter)
+        active_ids = fetch_data_from_db(active_query, engine, pool_stats)
+        if active_ids is None:
+            raise RuntimeError("Could not load the active student list for the enrollment snapshot.")
+        active = active_ids["EMPLID"].astype(str).str.strip()
+        snapshot = snapshot[snapshot["EMPLID"].astype(str).isin(active).to_numpy()].reset_index(drop=True)
+        # Drop the categories only the filtered-out students used, as a full pull would not have them
+        for column in snapshot.columns[snapshot.dtypes == "category"]:
+            snapshot[column] = snapshot[column].cat.remove_unused_categories()
+
+    stats = {
+        "mode": mode,
+        "last_synced_term": manifest["last_synced_term"],
+        "rows_transferred": rows_transferred,
+        "active_ids_transferred": 0 if active_ids is None else len(active_ids),
+        "full_pull_rows": len(snapshot),
+        "transfer_saved_pct": round(100 * (1 - rows_transferred / len(snapshot)), 1) if len(snapshot) else 0.0,
+    }
+    if sync_stats is not None:
+        sync_stats.update(stats)
+    print(f"Enrollment {mode} sync: {rows_transferred} rows transferred vs {len(snapshot)} for a full pull")
+    return snapshot
+
+def fetch_enrollment_and_transfer_data(enrollment_query, transfer_query, engine=None, pool_stats=None,
+                                       stream_enrollment=DB_STREAM_ENROLLMENT, chunksize=DB_STREAM_CHUNK_SIZE,
+                                       sync_mode="direct", params=None):
+    # Resolve the shared engine and snapshot lock here: cached Streamlit resources should not be
+    # created from worker threads
+    if engine is None:
+        engine = get_db_engine()
+        pool_stats = get_db_pool_stats()
+    snapshot_lock = get_snapshot_lock() if sync_mode in ("delta", "full") else None
+
+    # The two queries are independent, so run them on two pooled connections at once
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        if sync_mode in ("delta", "full"):
+            enrollment_future = executor.submit(sync_enrollment_snapshot, sync_mode, SNAPSHOT_DIR, engine, pool_stats, chunksize,
+                                                snapshot_lock=snapshot_lock)
+        elif stream_enrollment:
+            enrollment_future = executor.submit(fetch_data_from_db_chunked, enrollment_query, chunksize, engine, pool_stats,
+                                                params=params)
+        else:
+            enrollment_future = executor.submit(fetch_data_from_db, enrollment_query, engine, pool_stats, params)
+        transfer_future = executor.submit(fetch_data_from_db, transfer_query, engine, pool_stats, params)
+        return enrollment_future.result(), transfer_future.result()
+
+def major_scope_params(selected_majors):
+    # One named bind per plan; Radio / TV students are reported under Digital Media Production
+    plans = list(selected_majors)
+    if "Digital Media Production" in plans:
+        plans.append("Radio / TV")
+    params = {f"major_{i}": plan for i, plan in enumerate(plans)}
+    placeholders = ", ".join(f":{name}" for name in params)
+    return placeholders, params
+
+def build_major_scoped_queries(selected_majors):
+    placeholders, params = major_scope_params(selected_majors)
+    enrollment_query = st_enrollment_query_template.format(
+        extra_filters=latest_plan_filter.format(student_column="asef.StudentID", placeholders=placeholders))
+    transfer_query = tc_query_template.format(
+        extra_filters=latest_plan_filter.format(student_column="sct.StudentID", placeholders=placeholders))
+    return enrollment_query, transfer_query, params
+
+def student_semester_stats(combined_data):
+    # One sorted scan over (student, semester) gives every semester's credits in order
+    semester_credits = combined_data.groupby(['Student_ID', 'Semester'])['CREDITS'].sum().reset_index()
+    same_student = semester_credits['Student_ID'].eq(semester_credits['Student_ID'].shift()).to_numpy()
+    semester_credits['Latest_Semester_Previous'] = np.where(same_student, semester_credits['Semester'].shift().fillna(0), 0).astype(int)
+
+    # The last row of each student holds the latest semester, its credits and the semester before it
+    semester_stats = semester_credits.drop_duplicates('Student_ID', keep='last').rename(
+        columns={'Semester': 'Latest_Semester', 'CREDITS': 'Latest_Semester_Credits'})
+
+    # Passed credits recorded in the latest and previous semesters (in order of appearance,
+    # so a semester with several values expands rows exactly like the row-wise version)
+    passed_credits = combined_data[['Student_ID', 'Semester', 'Passed Credits']].drop_duplicates()
+    latest_semester_passed_credits = pd.merge(passed_credits, semester_stats,
+                                              left_on=['Student_ID', 'Semester'], right_on=['Student_ID', 'Latest_Semester'])
+    latest_semester_previous_passed_credits = pd.merge(passed_credits, semester_stats[['Student_ID', 'Latest_Semester_Previous']],
+                                                       left_on=['Student_ID', 'Semester'],
+                                                       right_on=['Student_ID', 'Latest_Semester_Previous'])
+    latest_semester_passed_credits = latest_semester_passed_credits.rename(columns={"Passed Credits":"Passed_Credits_Latest"})
+    latest_semester_previous_passed_credits = latest_semester_previous_passed_credits.rename(columns={"Passed Credits":"Passed_Credits_Previous"})
+
+    total_pcr_previous_latest = pd.merge(latest_semester_passed_credits[['Student_ID', 'Latest_Semester', 'Latest_Semester_Credits', 'Passed_Credits_Latest']],
+                                         latest_semester_previous_passed_credits[['Student_ID', 'Passed_Credits_Previous']],
+                                         on='Student_ID', how="left")
+    total_pcr_previous_latest["Passed_Credits_Previous"] = total_pcr_previous_latest["Passed_Credits_Previous"].fillna(0).astype(int)
+
+    # Passed credits not updated yet for the latest semester: count its credits as incoming
+    total_pcr_previous_latest['Incoming_PCR'] = np.where(
+        total_pcr_previous_latest['Passed_Credits_Previous'] == total_pcr_previous_latest['Passed_Credits_Latest'],
+        total_pcr_previous_latest['Latest_Semester_Credits'] + total_pcr_previous_latest['Passed_Credits_Latest'],
+        total_pcr_previous_latest['Passed_Credits_Latest'])
+    return total_pcr_previous_latest[['Student_ID', 'Latest_Semester', 'Incoming_PCR']]
+
+def add_incoming_pcr(combined_data):
+    # Join the per-student statistics back once; only latest-semester rows carry Incoming_PCR
+    combined_data = pd.merge(combined_data, student_semester_stats(combined_data), on='Student_ID')
+    combined_data = combined_data.fillna(0)
+    combined_data['Incoming_PCR'] = np.where(combined_data['Semester'] != combined_data['Latest_Semester'],
+                                             0, combined_data['Incoming_PCR'])
+    return combined_data.drop(columns=["Latest_Semester"])
+
+def combine_student_history(st_enrollment_data, transfer_credit_data):
+    ac_st_enrollment_data = st_enrollment_data
+    tc_data = transfer_credit_data
+    
+    # Rename columns
+    rename_columns_dict = {"EMPLID": "Student_ID", "STRM": "Semester", "Course": "Course_ID",
+                           "Level": "Student_Level", "Plan": "Major",
+                           "COURSE": "Course_ID", "chosen_semester": "Semester",
+                          "STUDENT_ID" : "Student_ID","TRANSFER_TERM":"Semester",
+                          "UNT_TRNSFR":"CREDITS","CUM_GPA":"GPA"}
+    tc_data.rename(columns=rename_columns_dict, inplace=True)
+    ac_st_enrollment_data.rename(columns=rename_columns_dict, inplace=True)
+    # Typed ingestion delivers Student_Level as a number, with text already filled and stripped
+    typed = pd.api.types.is_numeric_dtype(ac_st_enrollment_data["Student_Level"])
+    if typed:
+        tc_data = tc_data.astype(str)
+        for column in tc_data.columns:
+            tc_data[column] = tc_data[column].str.strip()
+    else:
+        # Streamed frames arrive with their text columns already filled and stored as categories
+        fill_columns = ac_st_enrollment_data.columns[ac_st_enrollment_data.dtypes != "category"]
+        ac_st_enrollment_data = ac_st_enrollment_data.fillna({column: 0 for column in fill_columns})
+        ac_st_enrollment_data = ac_st_enrollment_data.astype(str)
+        tc_data = tc_data.astype(str)
+        
+        # Strip whitespace from all columns
+        for df in [tc_data, ac_st_enrollment_data]:
+            for column in df.columns:
+                df[column] = df[column].str.strip()
+                
+        # Convert relevant columns to appropriate types
+        ac_st_enrollment_data["Student_Level"] = ac_st_enrollment_data["Student_Level"].str.extract('(\d+)', expand=False)
+    # An explicit copy, so the conversions below write to a frame of its own
+    ac_st_enrollment_data = ac_st_enrollment_data.dropna(subset=["Student_Level"]).copy()
+    ac_st_enrollment_data["Semester"] = ac_st_enrollment_data["Semester"].astype(int)
+    ac_st_enrollment_data["Student_Level"] = ac_st_enrollment_data["Student_Level"].astype(int)
+    ac_st_enrollment_data["CREDITS"] = ac_st_enrollment_data["CREDITS"].astype(float)
+    ac_st_enrollment_data["Passed Credits"] = ac_st_enrollment_data["Passed Credits"].astype(float)
+    ac_st_enrollment_data["GPA"] = ac_st_enrollment_data["GPA"].astype(float)
+    ac_st_enrollment_data["MPA"] = ac_st_enrollment_data["MPA"].astype(float)
+    tc_data["Semester"] = tc_data["Semester"].astype(int)
+    tc_data["CREDITS"] = tc_data["CREDITS"].astype(float)
+    
+    ac_st_enrollment_data["CREDITS"] = ac_st_enrollment_data["CREDITS"].astype(int)
+    ac_st_enrollment_data["Passed Credits"] = ac_st_enrollment_data["Passed Credits"].astype(int)
+    tc_data["CREDITS"] = tc_data["CREDITS"].astype(int)
+    
+    max_semester_index = ac_st_enrollment_data.groupby('Student_ID')['Semester'].idxmax()
+    latest_major_df = ac_st_enrollment_data.loc[max_semester_index, ['Student_ID', 'Semester',
+                                                              "College", "Program", 'Major']]
+    
+    
+    ac_st_enrollment_data = pd.merge(ac_st_enrollment_data.drop(columns=["College", "Program", 'Major']),
+                          latest_major_df[["Student_ID", "College", "Program", 'Major']],
+                          left_on="Student_ID", right_on="Student_ID", how='inner')
+
+    tc_data = pd.merge(tc_data, latest_major_df[["Student_ID", "College", "Program", 'Major']],
+                           left_on="Student_ID", right_on="Student_ID", how='inner')
+    
+    semester_stats = ac_st_enrollment_data.groupby('Student_ID')['Semester'].agg(['min', 'max']).reset_index()
+    tc_data = tc_data.merge(semester_stats, on='Student_ID', how='left')
+    
+    # Transfer credits count in the student's first semester
+    tc_data['chosen_semester'] = np.where(tc_data['Semester'] == tc_data['min'], tc_data['Semester'], tc_data['min'])
+    tc_data = tc_data.drop(columns=["min", "max", "Semester", "SUBJECT","CATALOG_NBR"])
+    tc_data.rename(columns=rename_columns_dict, inplace=True)
+    grouped_data = ac_st_enrollment_data.groupby(['Student_ID', 'Semester']).agg({
+        'Student_Level': 'first',
+        'ADMIT_TERM': 'first',
+        'Passed Credits': 'first',
+        'Status': 'first',
+        'GPA': 'first',
+        'MPA': 'first'
+    }).reset_index()
+    
+    tc_data = pd.merge(tc_data, grouped_data, on=['Student_ID', 'Semester'], how='inner')
+
+    # Select and reorder columns
+    tc_data = tc_data[['Student_ID', 'Semester', 'Status', 'Student_Level',
+                       'Course_ID',"CREDITS", 'College', 'Program', 'Major', 'ADMIT_TERM',
+                       'Passed Credits', 'GPA', 'MPA']]
+
+    # Filter out unwanted records
+    values_to_delete = ['Visit', 'Non-Degree', 'Undeclared - English',
+                        'FA', 'F', 'I', 'S', 'NP', 'WA']
+
+    ac_st_enrollment_data = ac_st_enrollment_data[~ac_st_enrollment_data["Major"].isin(values_to_delete)]
+    ac_st_enrollment_data = ac_st_enrollment_data[['Student_ID', 'Semester','GRADE', 'Status', 'Student_Level',
+                                     'Course_ID',"CREDITS", 'College', 'Program', 'Major', 'ADMIT_TERM',
+                                     'Passed Credits', 'GPA', 'MPA']]
+    
+    if typed:
+        # The combined data is plain text from here on, as in the untyped path
+        ac_st_enrollment_data = ac_st_enrollment_data.astype(
+            {column: object for column in ac_st_enrollment_data.columns[ac_st_enrollment_data.dtypes == "category"]})
+        tc_data = tc_data.astype({column: object for column in tc_data.columns[tc_data.dtypes == "category"]})
+
+    # Combine data
+    combined_data = pd.concat([ac_st_enrollment_data, tc_data], axis=0)
+    combined_data["Major"] = combined_data['Major'].replace('Radio / TV', 'Digital Media Production')
+    
+    return combined_data
+
+def st_data_cleaning(st_enrollment_data, transfer_credit_data):
+    combined_data = combine_student_history(st_enrollment_data, transfer_credit_data)
+
+    # Latest and previous semester, passed credits and incoming PCR per student
+    return add_incoming_pcr(combined_data)
+
+# Define the query ({extra_filters} is empty for a full pull)
+st_enrollment_query_template = """
+SELECT
+    asef.StudentId AS EMPLID,
+	asef.ProgramStatusTitle AS Status,
+	asef.Semester AS STRM,
+	CASE 
+        WHEN asef.AcademicLevelID = '10' THEN '1- Freshman'
+        WHEN asef.AcademicLevelID = '20' THEN '2- Sophomore'
+        WHEN asef.AcademicLevelID = '30' THEN '3- Junior'
+        WHEN asef.AcademicLevelID = '40' THEN '4- Senior'
+        ELSE 'NA' 
+    END AS Level,
+	CONCAT(TRIM(CourseSubject), TRIM(CourseCode)) AS Course,
+	asef.LetterGrade AS GRADE,
+	asef.CourseUnits AS CREDITS,
+	asef.CourseDepartmentDescription AS Course_Department,
+	asef.StudentCollegeID AS College,
+	asef.StudentProgramDescription AS Program,
+	asef.StudentPlanDescription AS 'Plan',
+	asef.AdmitSemester AS ADMIT_TERM,
+	asef.StudentProgramID AS ACAD_PROG,
+	asef.StudentPlanID AS ACAD_PLAN,
+	asef.UnitPassed AS 'Passed Credits',
+	asef.CumulativeGPA AS CUM_GPA,
+	asef.MPA,
+	asef.ProgramStatusID AS PROG_STATUS,
+	sm.AcademicCareer AS ACAD_CAREER
+FROM [GUST-DW-Staging].DataBridge.ActiveStudentEnrollmentFull AS asef
+INNER JOIN [GUST-DW-Staging].DataBridge.StudentMaster AS sm
+    ON asef.StudentID = sm.StudentID
+WHERE 
+    sm.AcademicCareer = N'UGRD' 
+    AND sm.ProgramStatusID IN (N'AC  ', N'LA  ')
+	AND asef.ClassType = 'E'{extra_filters}
+	order by asef.Semester,asef.StudentID;
+"""
+st_enrollment_query = st_enrollment_query_template.format(extra_filters="")
+
+# Delta pull for the snapshot store: only terms at or after the last synced term
+st_enrollment_delta_query = st_enrollment_query_template.format(extra_filters="""
+	AND asef.Semester >= :last_synced_term""")
+
+# Students whose latest plan is one of the selected majors. Mirrors the latest major rule in
+# st_data_cleaning: latest semester among the rows that have a student level
+latest_plan_filter = """
+	AND {student_column} IN (
+		SELECT lp.StudentID
+		FROM (
+			SELECT
+				lpe.StudentID,
+				lpe.StudentPlanDescription,
+				ROW_NUMBER() OVER (PARTITION BY lpe.StudentID ORDER BY lpe.Semester DESC) AS rn
+			FROM [GUST-DW-Staging].DataBridge.ActiveStudentEnrollmentFull AS lpe
+			WHERE lpe.ClassType = 'E'
+				AND lpe.AcademicLevelID IN ('10', '20', '30', '40')
+		) AS lp
+		WHERE lp.rn = 1
+			AND TRIM(lp.StudentPlanDescription) IN ({placeholders})
+	)"""
+
+# Students the full enrollment query would currently return
+active_students_query = """
+SELECT DISTINCT
+	sm.StudentID AS EMPLID
+FROM [GUST-DW-Staging].DataBridge.StudentMaster AS sm
+WHERE 
+    sm.AcademicCareer = N'UGRD' 
+    AND sm.ProgramStatusID IN (N'AC  ', N'LA  ')
+"""
+
+tc_query_template = """
+SELECT 
+	CONCAT(TRIM(CourseSubject), TRIM(CourseCode)) AS Course_ID,
+	sct.StudentID AS STUDENT_ID,
+	sm.Fullname AS STUDENT_NAME,
+	TransferSemester AS TRANSFER_TERM,
+	TransferUnit AS UNT_TRNSFR,
+	CourseSubject AS SUBJECT,
+	CourseCode AS CATALOG_NBR
+FROM [GUST-DW-Staging].DataBridge.StudentCourseTransfer AS sct
+INNER JOIN [GUST-DW-Staging].DataBridge.StudentMaster AS sm
+    ON sct.StudentID = sm.StudentID
+WHERE 
+    sm.AcademicCareer = N'UGRD' 
+    AND sm.ProgramStatusID IN (N'AC  ', N'LA  '){extra_filters}
+    
+"""
+tc_query = tc_query_template.format(extra_filters="")
@@ -0,0 +1,1434 @@
+import streamlit as st
+import pandas as pd
+import ast
+import numpy as np
+import hashlib
+import json
+import multiprocessing
+import os
+import pickle
+import tempfile
+import threading
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from multiprocessing import shared_memory
+
+# Course catalog, eligibility engine and report pipeline of the Course Eligibility and
+# Recommendation System. Kept out of the Streamlit script so worker processes can import it
+
+# Compiled copies of the major sheet workbook, keyed by its mtime and content hash
+MAJOR_SHEET_PATH = "Updated_MajorSheet_.xlsx"
+CATALOG_CACHE_DIR = os.environ.get("GUST_CATALOG_CACHE_DIR", "catalog_cache")
+
+# Output folder of the all-majors batch run
+REPORTS_DIR = os.environ.get("GUST_REPORTS_DIR", "reports")
+# Worker processes of the long-lived pool the batch run fans majors out to; 1 runs them one after
+# another in this process
+PIPELINE_WORKERS = int(os.environ.get("GUST_PIPELINE_WORKERS", 1))
+# Shards one major's per-student stages are split into, run on the long-lived pipeline pool
+# (PIPELINE_WORKERS workers); 1 keeps them in this process, as does a pool of a single worker
+STUDENT_SHARDS = int(os.environ.get("GUST_STUDENT_SHARDS", 1))
+# Hand worker tasks their history through one shared-memory block instead of pickling it into each task
+SHARED_MEMORY_TASKS = os.environ.get("GUST_SHARED_MEMORY_TASKS", "1") == "1"
+
+def file_sha256(path):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+@st.cache_resource
+def get_major_sheet_lock():
+    return threading.Lock()
+
+def replace_cache_file(path, dump, mode="wb"):
+    # Write under a unique temp name and swap in, so concurrent writers never share a temp file
+    with tempfile.NamedTemporaryFile(mode, dir=os.path.dirname(path), delete=False) as f:
+        dump(f)
+    os.replace(f.name, path)
+
+def load_major_sheet(path=MAJOR_SHEET_PATH, cache_dir=CATALOG_CACHE_DIR, load_stats=None):
+    # Same result as pd.read_excel(path, sheet_name=None), read from a pickled copy of the
+    # parsed workbook while the xlsx is unchanged
+    started = time.perf_counter()
+    os.makedirs(cache_dir, exist_ok=True)
+    name = os.path.splitext(os.path.basename(path))[0]
+    index_path = os.path.join(cache_dir, f"{name}.json")
+
+    # Sessions load the sheet concurrently: validate, compile and update the index one at a time
+    with get_major_sheet_lock():
+        file_stat = os.stat(path)
+        index = None
+        if os.path.exists(index_path):
+            with open(index_path) as f:
+                index = json.load(f)
+
+        # Unchanged mtime and size: trust the cache without hashing; otherwise compare content hashes
+        cache_path = None
+        sha256 = None
+        index_changed = False
+        if index is not None and os.path.exists(os.path.join(cache_dir, index["cache_file"])):
+            if index["mtime_ns"] == file_stat.st_mtime_ns and index["size"] == file_stat.st_size:
+                cache_path = os.path.join(cache_dir, index["cache_file"])
+            else:
+                sha256 = file_sha256(path)
+                if index["sha256"] == sha256:
+                    cache_path = os.path.join(cache_dir, index["cache_file"])
+                    index.update(mtime_ns=file_stat.st_mtime_ns, size=file_stat.st_size)
+                    index_changed = True
+
+        if cache_path is not None:
+            with open(cache_path, "rb") as f:
+                workbook = pickle.load(f)
+            source = "cache"
+        else:
+            # Compile: parse the workbook once and store every sheet
+            sha256 = sha256 or file_sha256(path)
+            workbook = pd.read_excel(path, sheet_name=None)
+            cache_file = f"{name}-{sha256[:16]}.pkl"
+            replace_cache_file(os.path.join(cache_dir, cache_file),
+                               lambda f: pickle.dump(workbook, f, protocol=pickle.HIGHEST_PROTOCOL))
+            if index is not None and index["cache_file"] != cache_file and os.path.exists(os.path.join(cache_dir, index["cache_file"])):
+                os.remove(os.path.join(cache_dir, index["cache_file"]))
+            index = {"cache_file": cache_file, "sha256": sha256}
+            index.update(mtime_ns=file_stat.st_mtime_ns, size=file_stat.st_size)
+            index_changed = True
+            source = "xlsx"
+
+        if index_changed:
+            replace_cache_file(index_path, lambda f: json.dump(index, f, indent=2), mode="w")
+
+    elapsed = time.perf_counter() - started
+    if load_stats is not None:
+        load_stats.update({"source": source, "seconds": round(elapsed, 4), "sha256": index["sha256"]})
+    print(f"Loaded {path} from {source} in {elapsed:.3f}s")
+    return workbook
+
+# Course Catalog
+catalog_college_majors = {
+    "CBA": ['ACCOUNTING', 'INTL BUSIN', 'MANAGEMENT', 'FINANCE', 'MIS', 'MARKETING2'],
+    "CAS": ['COMSCIENCE', 'ENGLISH', 'LINGUISTIC', 'LITERATURE', 'DIGITALMED', 'PR / ADV', 'VISUAL COM'],
+    "CEA": ['COMPENG', 'ELECENG', 'MGMTENG'],
+}
+
+# Major sheet each reported major is evaluated against
+major_catalog_sheets = {
+    "Accounting": "ACCOUNTING",
+    "International Business": "INTL BUSIN",
+    "Mgmt & Organizational Behavior": "MANAGEMENT",
+    "Management Information Systems": "MIS",
+    "Marketing": "MARKETING2",
+    "Finance": "FINANCE",
+    "Computer Science": "COMSCIENCE",
+    "Digital Media Production": "DIGITALMED",
+    "Eng- Linguistics - Translation": "LINGUISTIC",
+    "English Education": "ENGLISH",
+    "English Literature": "LITERATURE",
+    "Public relations & Advertising": "PR / ADV",
+    "Visual Communication": "VISUAL COM",
+    "Engineering Management": "MGMTENG",
+    "Electrical Engineering": "ELECENG",
+    "Computer Engineering": "COMPENG",
+}
+
+# Conditions of the courses evaluated as plain AND prerequisites; anything else is a special condition
+list_conditions = ['-', 'ONE_COURSE']
+
+def build_reverse_index(prerequisites, conditions):
+    # prerequisite course -> [(dependent course, its Condition)], in prerequisites order
+    reverse_index = {}
+    for course, prereqs in prerequisites.items():
+        for prereq in prereqs:
+            entries = reverse_index.setdefault(prereq, [])
+            if (course, conditions[course]) not in entries:
+                entries.append((course, conditions[course]))
+    return reverse_index
+
+def build_co_requisite_index(co):
+    # Co-requisite rules keyed by their first requisite, so a student only checks the rules whose first
+    # requisite is eligible: course -> [(row position, requisites, requisites + [Course_ID])]
+    co_index = {}
+    for position, (course_id, requisites_list) in enumerate(zip(co['Course_ID'], co['REQUISITES_LIST'])):
+        key = requisites_list[0] if requisites_list else None
+        co_index.setdefault(key, []).append((position, requisites_list, requisites_list + [course_id]))
+    return co_index
+
+def build_course_catalog(major_data, version=None):
+    # Parse the major sheet once into per-major lookups shared by every major's pipeline
+    major = major_data["All_Courses"].copy()
+    courses_co = major_data["CO_Courses"]
+    
+    major["AREA_OF_STUDY"] = major["AREA_OF_STUDY"].fillna("NA")
+    # Dropping records where AREA_OF_STUDY is 'N' and COURSE_OF_STUDY is 'Z'
+    major_filtered = major[~((major['AREA_OF_STUDY'] == 'NA') & (major['COURSE_OF_STUDY'] == 'Z'))]
+    
+    major_filtered = major_filtered.copy()
+    # Apply replacements directly to the specific columns to avoid SettingWithCopyWarning
+    major_filtered['AREA_OF_STUDY'] = major_filtered['AREA_OF_STUDY'].replace("NA","GE")
+    major_filtered['COURSE_OF_STUDY'] = major_filtered['COURSE_OF_STUDY'].replace("N","E")
+
+    catalog = {"version": version, "majors": {}, "course_bits": {}}
+    for college, college_majors in catalog_college_majors.items():
+        college_courses = major_filtered[major_filtered['Major'].isin(college_majors)]
+        if college == "CAS":
+            # CAS keeps every course of study except general free electives
+            df_college = college_courses[~((college_courses['AREA_OF_STUDY'] == 'GE') & (college_courses['COURSE_OF_STUDY'] == 'E'))]
+        else:
+            df_college = college_courses[college_courses['COURSE_OF_STUDY'].isin(['R', 'RE'])]
+        college_list = df_college[df_college['Condition'].isin(list_conditions)]
+        college_special_cases = df_college[~df_college['Condition'].isin(list_conditions)]
+        college_co = courses_co[courses_co['Major'].isin(college_majors)]
+
+        for sheet_major in college_majors:
+            major_list = college_list[college_list["Major"] == sheet_major]
+            major_special_cases = college_special_cases[college_special_cases["Major"] == sheet_major]
+            major_co = college_co[college_co["Major"] == sheet_major].copy()
+            major_co.loc[:, 'REQUISITES_LIST'] = major_co['REQUISITES_LIST'].apply(ast.literal_eval)
+            major_courses = college_courses[college_courses["Major"] == sheet_major]
+
+            prerequisites = major_list.set_index('Course_ID')['REQUISITES_LIST'].apply(eval).to_dict()
+            prerequisites_special = major_special_cases.set_index('Course_ID')['REQUISITES_LIST'].apply(eval).to_dict()
+            conditions = major_special_cases.set_index('Course_ID')['Condition'].to_dict()
+
+            # Reverse index: course -> courses that list it as a prerequisite, standard ones first
+            dependents = build_reverse_index(prerequisites, major_list.set_index('Course_ID')['Condition'].to_dict())
+            for prereq, entries in build_reverse_index(prerequisites_special, conditions).items():
+                dependents.setdefault(prereq, []).extend(entries)
+
+            catalog["majors"][sheet_major] = {
+                "college": college,
+                "courses": major_courses,
+                "co": major_co,
+                "co_index": build_co_requisite_index(major_co),
+                "prerequisites": prerequisites,
+                "prerequisites_special": prerequisites_special,
+                "conditions": conditions,
+                "dependents": dependents,
+                "area_of_study": major_courses.drop_duplicates('Course_ID').set_index('Course_ID')['AREA_OF_STUDY'].to_dict(),
+                "course_level": major_courses.drop_duplicates('Course_ID').set_index('Course_ID')['Course_Level'].to_dict(),
+                "course_ids": frozenset(major_courses['Course_ID']),
+            }
+
+    # Intern every course id (catalog courses and prerequisites) to one bit, then store each
+    # course's AND prerequisites as a mask, in the same order as its prerequisites dict
+    course_bits = catalog["course_bits"]
+    for course in list(major['Course_ID']) + list(courses_co['Course_ID']):
+        course_bits.setdefault(course, 1 << len(course_bits))
+    for major_catalog in catalog["majors"].values():
+        for prerequisites in [major_catalog["prerequisites"], major_catalog["prerequisites_special"]]:
+            for course, prereqs in prerequisites.items():
+                for prereq in [course] + list(prereqs):
+                    course_bits.setdefault(prereq, 1 << len(course_bits))
+        major_catalog["prerequisite_masks"] = [(course, course_mask(prereqs, course_bits))
+                                               for course, prereqs in major_catalog["prerequisites"].items()]
+
+    # Compile the special conditions for the current-semester and future (`_`) variants
+    for sheet_major, variant in special_condition_sheets.items():
+        major_catalog = catalog["majors"][sheet_major]
+        major_catalog["special_rules"] = compile_special_conditions(major_catalog["prerequisites_special"], major_catalog["conditions"], variant)
+        major_catalog["future_special_rules"] = compile_special_conditions(major_catalog["prerequisites_special"], major_catalog["conditions"], variant + "_")
+
+        # Unlock tables for future eligibility: the standard courses a single course opens up on its
+        # own, and the future special courses that list it as a prerequisite
+        unlock_courses = set(major_catalog["course_ids"]) | set(major_catalog["prerequisites"]) | set(major_catalog["prerequisites_special"])
+        major_catalog["unlocks"] = {course: find_additional_eligibilities_masked([course], {course}, major_catalog["prerequisite_masks"], course_bits)
+                                    for course in unlock_courses}
+        major_catalog["special_rule_order"] = {course: position for position, course in enumerate(major_catalog["future_special_rules"])}
+        special_unlocks = {}
+        for prereq, entries in major_catalog["dependents"].items():
+            courses = [course for course, condition in entries if condition not in list_conditions and course in major_catalog["future_special_rules"]]
+            if courses:
+                special_unlocks[prereq] = courses
+        major_catalog["special_unlocks"] = special_unlocks
+    return catalog
+
+def course_dependents(major_catalog, course):
+    # Courses that list `course` as a prerequisite, as (course, Condition) pairs; a Condition in
+    # list_conditions is a standard prerequisite, anything else a special one
+    return major_catalog["dependents"].get(course, [])
+
+def courses_opened_by(catalog, major, course, taken_courses=(), student_info=None):
+    # Advisor query: what taking `course` opens up in `major` for a student who has taken `taken_courses`.
+    # Special conditions also depend on the student's standing, so they are only evaluated with student_info.
+    major_catalog = catalog["majors"][major_catalog_sheets.get(major, major)]
+    special_rules = major_catalog.get("special_rules", {})
+    hypothetical_courses = set(taken_courses) | {course}
+    opened = []
+    for dependent, condition in course_dependents(major_catalog, course):
+        if condition in list_conditions:
+            prereqs = major_catalog["prerequisites"][dependent]
+            opens_now = all(prereq in hypothetical_courses for prereq in prereqs)
+        else:
+            prereqs = major_catalog["prerequisites_special"][dependent]
+            opens_now = None if student_info is None else bool(dependent in special_rules and special_rules[dependent](hypothetical_courses, student_info))
+        opened.append({
+            'Course_ID': dependent,
+            'Condition': condition,
+            'Prerequisites': list(prereqs),
+            'Remaining_Prerequisites': [prereq for prereq in prereqs if prereq not in hypothetical_courses],
+            'Opens_Now': opens_now,
+            'Already_Taken': dependent in hypothetical_courses,
+        })
+    return pd.DataFrame(opened, columns=['Course_ID', 'Condition', 'Prerequisites', 'Remaining_Prerequisites', 'Opens_Now', 'Already_Taken'])
+
+@st.cache_resource(max_entries=2)
+def get_course_catalog(version, _major_data):
+    # One catalog per workbook version (content hash), shared across sessions and reruns
+    return build_course_catalog(_major_data, version)
+
+def load_course_catalog(path=MAJOR_SHEET_PATH):
+    load_stats = {}
+    major_data = load_major_sheet(path, load_stats=load_stats)
+    return get_course_catalog(load_stats["sha256"], major_data)
+
+def build_requirement_vectors(requirements_df, weights_df):
+    # Per major: the requirement/weight rows plus NumPy vectors indexed by AREA_OF_STUDY
+    requirement_vectors = {}
+    for major_name, major_requirements in requirements_df.groupby("Major", sort=False):
+        major_weights = weights_df[weights_df["Major"] == major_name]
+        # The first row of an area wins, as in a .loc[...].values[0] lookup
+        unique_requirements = major_requirements.drop_duplicates("AREA_OF_STUDY")
+        unique_weights = major_weights.drop_duplicates("AREA_OF_STUDY")
+        requirement_vectors[major_name] = {
+            "requirements": major_requirements,
+            "requirements_pivot": major_requirements.pivot_table(index="Major",columns="AREA_OF_STUDY",values ='Required_Courses' ,aggfunc='sum',fill_value=0).reset_index(),
+            "weights": major_weights,
+            "required_areas": {area: i for i, area in enumerate(unique_requirements["AREA_OF_STUDY"])},
+            "required_courses": unique_requirements["Required_Courses"].to_numpy(),
+            "weight_areas": {area: i for i, area in enumerate(unique_weights["AREA_OF_STUDY"])},
+            "area_weights": unique_weights["Weight"].to_numpy(),
+        }
+    return requirement_vectors
+
+@st.cache_resource(max_entries=2)
+def get_requirement_vectors(path, version):
+    requirements_df = pd.read_excel(path,sheet_name="requirements")
+    weights_df = pd.read_excel(path,sheet_name="weights")
+    return build_requirement_vectors(requirements_df, weights_df)
+
+def load_requirements_weights(path):
+    # Parsed once per file version (content hash) instead of twice per major
+    return get_requirement_vectors(path, file_sha256(path))
+
+def subtract_from_requirements(taken_df, requirement_vectors):
+    remaining_df = taken_df.copy()
+    areas = requirement_vectors["required_areas"]
+    columns = [column for column in remaining_df.columns if column in areas]
+    if columns:
+        required = requirement_vectors["required_courses"][[areas[column] for column in columns]]
+        remaining_df[columns] = np.clip(required - remaining_df[columns].to_numpy(), 0, None)
+    return remaining_df
+
+def apply_area_weights(remaining_df, requirement_vectors):
+    weighted_df = remaining_df.copy()
+    areas = requirement_vectors["weight_areas"]
+    columns = [column for column in weighted_df.columns if column in areas]
+    if columns:
+        weighted_df[columns] = weighted_df[columns].to_numpy() * requirement_vectors["area_weights"][[areas[column] for column in columns]]
+    return weighted_df
+
+# Bitset masks for future eligibility: course ids are interned to bits (catalog["course_bits"]), a
+# history is the OR of its courses' bits and a course is unlocked when its prerequisite mask is covered
+def course_mask(courses, course_bits):
+    mask = 0
+    for course in courses:
+        mask |= course_bits.get(course, 0)
+    return mask
+
+# Cohort eligibility: one row per (Student_ID, Semester) holding the cumulative courses taken,
+# multiplied by a prerequisite x course incidence matrix; a course is eligible on a row when
+# the number of satisfied prerequisites reaches the number it requires. With latest_only there is
+# a single row per student, for the latest semester, holding every course taken.
+def cohort_taken_matrix(major_data, course_index, latest_only=False):
+    # Semester keys in Student_ID then Semester order, the position of each key's first history
+    # row and the cumulative taken matrix (rows x course_index). Rows without a Semester are left
+    # out, as they are by groupby
+    semester_groups = major_data.groupby(['Student_ID', 'Semester'])
+    semester_keys = semester_groups.size().index
+    row_codes = semester_groups.ngroup().to_numpy()
+    valid_rows = np.flatnonzero(row_codes >= 0)
+    _, first_rows = np.unique(row_codes[valid_rows], return_index=True)
+    first_positions = valid_rows[first_rows]
+
+    course_codes = course_index.get_indexer(major_data['Course_ID'])
+    valid = (row_codes >= 0) & (course_codes >= 0)
+    taken = np.zeros((len(semester_keys), len(course_index)), dtype=np.int32)
+    taken[row_codes[valid], course_codes[valid]] = 1
+
+    # Running totals restart at each student's first semester row
+    cumulative = taken.cumsum(axis=0)
+    student_codes = semester_keys.codes[0]
+    first_semesters = np.r_[True, student_codes[1:] != student_codes[:-1]] if len(student_codes) else np.zeros(0, dtype=bool)
+    start_rows = np.maximum.accumulate(np.where(first_semesters, np.arange(len(semester_keys)), 0)) if len(student_codes) else np.zeros(0, dtype=int)
+    has_previous = start_rows > 0
+    cumulative[has_previous] -= cumulative[start_rows[has_previous] - 1]
+
+    if latest_only:
+        latest_semesters = np.r_[student_codes[1:] != student_codes[:-1], True] if len(student_codes) else np.zeros(0, dtype=bool)
+        semester_keys, first_positions, cumulative = semester_keys[latest_semesters], first_positions[latest_semesters], cumulative[latest_semesters]
+    return semester_keys, first_positions, (cumulative > 0).astype(np.int32)
+
+def requirement_incidence(requirements, course_index):
+    # course_index x requirement matrix counting how often each course appears in a requirement;
+    # courses outside the index can never be satisfied and are left out
+    incidence = np.zeros((len(course_index), len(requirements)), dtype=np.int32)
+    for requirement_code, courses in enumerate(requirements):
+        course_codes = course_index.get_indexer(list(courses))
+        np.add.at(incidence[:, requirement_code], course_codes[course_codes >= 0], 1)
+    return incidence
+
+def cohort_eligible_by_prerequisites(prerequisites, cumulative, course_index):
+    # Rows x prerequisites matrix of the courses whose prerequisites are all in each row of the
+    # cumulative taken matrix
+    requirements = [set(prereqs) for prereqs in prerequisites.values()]
+    required = np.array([len(prereqs) for prereqs in requirements], dtype=np.int32)
+    return cumulative @ requirement_incidence(requirements, course_index) >= required
+
+# Condition compiler: every (course, Condition) pair of a major sheet becomes a predicate
+# predicate(taken_courses, student_info) once per catalog load, so evaluation is a direct call
+# instead of walking the is_eligible_special_* if/elif chains (kept in benchmarks/reference.py).
+# Predicates are partials of the module-level functions below, so compiled catalogs can be pickled.
+def taken_all(required, taken_courses, student_info):
+    return required.issubset(taken_courses)
+
+def taken_any(options, taken_courses, student_info):
+    return not options.isdisjoint(taken_courses)
+
+def taken_at_least(prereqs, minimum, taken_courses, student_info):
+    return sum(map(taken_courses.__contains__, prereqs)) >= minimum
+
+def student_in(field, values, taken_courses, student_info):
+    return student_info[field] in values
+
+def student_not(field, value, taken_courses, student_info):
+    return student_info[field] != value
+
+def credits_at_least(minimum, incoming, taken_courses, student_info):
+    return student_info['Passed Credits'] >= minimum or (incoming and int(student_info['Incoming_PCR']) >= minimum)
+
+def credits_below(maximum, incoming, taken_courses, student_info):
+    return student_info['Passed Credits'] < maximum or (incoming and int(student_info['Incoming_PCR']) < maximum)
+
+def rule_both(first, second, taken_courses, student_info):
+    return first(taken_courses, student_info) and second(taken_courses, student_info)
+
+def rule_either(first, second, taken_courses, student_info):
+    return first(taken_courses, student_info) or second(taken_courses, student_info)
+
+def all_of(prereqs):
+    return partial(taken_all, frozenset(prereqs))
+
+def any_of(prereqs):
+    return partial(taken_any, frozenset(prereqs))
+
+def both(*rules):
+    compiled = rules[-1]
+    for rule in reversed(rules[:-1]):
+        compiled = partial(rule_both, rule, compiled)
+    return compiled
+
+def major_is(*majors):
+    return partial(student_in, 'Major', majors)
+
+def program_is(*programs):
+    return partial(student_in, 'Program', programs)
+
+def college_is(college):
+    return partial(student_in, 'College', (college,))
+
+def level_is(level):
+    return partial(student_in, 'Student_Level', (level,))
+
+special_condition_builders = {
+    "OR": lambda prereqs: any_of(prereqs),
+    "AND": lambda prereqs: all_of(prereqs),
+    "AND_NOT_CS": lambda prereqs: both(all_of(prereqs), partial(student_not, 'Major', "Computer Science")),
+    "OR_AND_NOT_CS": lambda prereqs: both(any_of(prereqs), partial(student_not, 'Major', "Computer Science")),
+    "AND_NOT_ENGLISH": lambda prereqs: both(all_of(prereqs), partial(student_not, 'Program', "English")),
+    "Credits": lambda prereqs: partial(credits_at_least, 81, True),
+    "Credits_College": lambda prereqs: both(partial(credits_at_least, 81, True), college_is("CBA")),
+    "AND_OR": lambda prereqs: both(all_of(prereqs[:1]), any_of(prereqs[1:])),
+    "AND_OR_2": lambda prereqs: both(all_of(prereqs[:1]), any_of(prereqs[1:3]), any_of(prereqs[3:])),
+    "AND_OR_2_FROM_2": lambda prereqs: both(all_of(prereqs[:2]), any_of(prereqs[2:])),
+    "AND_OR_2_FROM_3": lambda prereqs: both(all_of(prereqs[:2]), any_of(prereqs[3:])),
+    "AND_OR_3": lambda prereqs: both(any_of(prereqs[:2]), all_of(prereqs[2:])),
+    "OR_AND": lambda prereqs: partial(rule_either, all_of(prereqs[:2]), any_of(prereqs[2:])),
+    "AND_OR_PR": lambda prereqs: partial(rule_either, both(all_of(prereqs[:3]), major_is("Public relations & Advertising")), all_of(prereqs[4:])),
+    "AND_3_Courses": lambda prereqs: both(all_of(prereqs[:3]), partial(taken_at_least, tuple(prereqs[3:]), 3)),
+    "Any_Two": lambda prereqs: partial(taken_at_least, tuple(prereqs), 2),
+    "Any_Three": lambda prereqs: partial(taken_at_least, tuple(prereqs), 3),
+    "Senior": lambda prereqs: level_is(4),
+    "AND_Senior": lambda prereqs: both(level_is(4), all_of(prereqs)),
+    "AND_Junior": lambda prereqs: both(level_is(3), all_of(prereqs)),
+    "AND_Major_ACC": lambda prereqs: both(all_of(prereqs), major_is("Accounting")),
+    "AND_Major_FIN": lambda prereqs: both(all_of(prereqs), major_is("Finance")),
+    "AND_Major_MIS": lambda prereqs: both(all_of(prereqs), major_is("Management Information Systems")),
+    "AND_Major_MRKT": lambda prereqs: both(all_of(prereqs), major_is("Marketing")),
+    "AND_Major_MG_IB": lambda prereqs: both(all_of(prereqs), major_is("International Business", "Mgmt & Organizational Behavior")),
+    "AND_Major_MG_IB_MRKT": lambda prereqs: both(all_of(prereqs), major_is("International Business", "Mgmt & Organizational Behavior", "Marketing")),
+    "AND_Major_MG_IB_MRKT_MIS": lambda prereqs: both(all_of(prereqs), major_is("International Business", "Mgmt & Organizational Behavior", "Marketing", "Management Information Systems")),
+    "Junior_AND_Major_ACC": lambda prereqs: both(level_is(3), major_is("Accounting")),
+    "Junior_AND_Major_MIS": lambda prereqs: both(level_is(3), major_is("Management Information Systems")),
+    "Junior_AND_Major_MRKT": lambda prereqs: both(level_is(3), major_is("Marketing")),
+    "Junior_And_Major_IB": lambda prereqs: both(level_is(3), major_is("International Business")),
+    "Junior_And_Major_MOB": lambda prereqs: both(level_is(3), major_is("Mgmt & Organizational Behavior")),
+    "Senior_AND_Major_FIN": lambda prereqs: both(level_is(4), major_is("Finance")),
+    "Senior_AND_Major_MIS": lambda prereqs: both(level_is(4), major_is("Management Information Systems")),
+    "Senior_AND_Major_MRKT": lambda prereqs: both(level_is(4), major_is("Marketing")),
+    "Senior_And_Major_MG_IB": lambda prereqs: both(level_is(4), major_is("International Business", "Mgmt & Organizational Behavior")),
+    "AND_Credits_MIS_CS": lambda prereqs: both(all_of(prereqs), partial(credits_below, 45, True), major_is("Management Information Systems", "Computer Science")),
+    "AND_Credits_MIS_CS_PASSED": lambda prereqs: both(all_of(prereqs), partial(credits_below, 45, False), major_is("Management Information Systems", "Computer Science")),
+    "AND_College_OR": lambda prereqs: both(all_of(prereqs), partial(rule_either, major_is("Computer Science"), college_is("COE"))),
+    "OR_AND_College_OR": lambda prereqs: both(any_of(prereqs), partial(rule_either, major_is("Computer Science"), college_is("COE"))),
+    "OR_CS": lambda prereqs: both(any_of(prereqs), major_is("Computer Science")),
+    "Junior_CS": lambda prereqs: both(level_is(3), major_is("Computer Science")),
+    "Senior_CS": lambda prereqs: both(level_is(4), major_is("Computer Science")),
+    "AND_College": lambda prereqs: both(all_of(prereqs), college_is("COE")),
+    "Junior_ECOM": lambda prereqs: both(level_is(3), program_is("Computer Engineering")),
+    "Senior_ECOM": lambda prereqs: both(level_is(4), program_is("Computer Engineering")),
+    "OR_MCOM": lambda prereqs: both(any_of(prereqs), program_is("Mass Communication")),
+    "AND_MCOM": lambda prereqs: both(all_of(prereqs), program_is("Mass Communication")),
+    "AND_Credits_MCOM": lambda prereqs: both(all_of(prereqs), partial(credits_at_least, 54, True), program_is("Mass Communication")),
+    "AND_Credits_MCOM_PASSED": lambda prereqs: both(all_of(prereqs), partial(credits_at_least, 54, False), program_is("Mass Communication")),
+    "AND_Credits_MCOM_2": lambda prereqs: both(all_of(prereqs), partial(credits_at_least, 60, True), program_is("Mass Communication")),
+    "AND_Credits_MCOM_2_PASSED": lambda prereqs: both(all_of(prereqs), partial(credits_at_least, 60, False), program_is("Mass Communication")),
+    "AND_OR_Junior_Program": lambda prereqs: both(all_of(prereqs[:1]), any_of(prereqs[1:]), level_is(3), program_is("Mass Communication")),
+    "OR_AND_Program_OR": lambda prereqs: both(any_of(prereqs), program_is("Mass Communication", "English")),
+    "Junior_Program": lambda prereqs: both(level_is(3), program_is("Mass Communication")),
+    "Senior_MCOM": lambda prereqs: both(level_is(4), program_is("Mass Communication")),
+    "AND_Junior_Program": lambda prereqs: both(level_is(3), all_of(prereqs), program_is("Mass Communication")),
+    "AND_UENG": lambda prereqs: both(all_of(prereqs), program_is("English")),
+    "AND_EDU": lambda prereqs: both(all_of(prereqs), major_is("English Education")),
+    "AND_LIN_LIT": lambda prereqs: both(all_of(prereqs), major_is("Eng- Linguistics - Translation", "English Literature")),
+    "Senior_Lingusitics": lambda prereqs: both(level_is(4), major_is("Eng- Linguistics - Translation")),
+    "Senior_AND_UENG": lambda prereqs: both(level_is(4), program_is("English")),
+}
+
+# Conditions each is_eligible_special_<variant> chain supported; anything else is never eligible
+special_condition_variants = {
+    "acc": ('OR', 'AND', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'Credits', 'Credits_College', 'AND_OR', 'AND_Senior', 'Junior_AND_Major_ACC', 'AND_Major_ACC', 'Senior', 'Any_Two', 'AND_NOT_ENGLISH'),
+    "ib": ('OR', 'AND_Major_MG_IB', 'AND_Major_MG_IB_MRKT', 'AND_Major_MG_IB_MRKT_MIS', 'AND', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'Credits', 'Credits_College', 'AND_OR', 'Senior_And_Major_MG_IB', 'Junior_And_Major_IB', 'Senior', 'Any_Two', 'AND_NOT_ENGLISH'),
+    "mob": ('OR', 'AND_Major_MG_IB', 'AND_Major_MG_IB_MRKT', 'AND_Major_MG_IB_MRKT_MIS', 'AND', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'Credits', 'Credits_College', 'AND_OR', 'Senior_And_Major_MG_IB', 'Junior_And_Major_MOB', 'Senior', 'Any_Two', 'AND_NOT_ENGLISH'),
+    "mis": ('OR', 'AND', 'AND_Major_MG_IB_MRKT_MIS', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'Credits', 'Credits_College', 'AND_OR', 'Senior_AND_Major_MIS', 'Junior_AND_Major_MIS', 'AND_Major_MIS', 'Senior', 'Any_Two', 'AND_NOT_ENGLISH', 'AND_Credits_MIS_CS'),
+    "mrkt": ('OR', 'AND_Major_MG_IB_MRKT', 'AND_Major_MG_IB_MRKT_MIS', 'AND', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'Credits', 'Credits_College', 'AND_OR', 'Senior_AND_Major_MRKT', 'Junior_AND_Major_MRKT', 'AND_Major_MRKT', 'Senior', 'Any_Two', 'AND_NOT_ENGLISH'),
+    "fin": ('OR', 'AND', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'Credits', 'Credits_College', 'AND_OR', 'OR_AND', 'Senior_AND_Major_FIN', 'AND_Major_FIN', 'AND_Senior', 'Senior', 'Any_Two', 'AND_NOT_ENGLISH'),
+    "cs": ('OR', 'AND', 'AND_OR', 'AND_College_OR', 'OR_CS', 'Junior_CS', 'Senior_CS', 'Any_Two', 'OR_AND_College_OR', 'AND_Credits_MIS_CS'),
+    "dmp": ('OR', 'AND', 'OR_MCOM', 'AND_MCOM', 'AND_Credits_MCOM', 'AND_Credits_MCOM_2', 'AND_OR_2', 'AND_OR_PR', 'AND_OR_Junior_Program', 'OR_AND_Program_OR', 'AND_Junior', 'Junior_Program', 'Senior_MCOM', 'AND_Junior_Program', 'Any_Two', 'AND_NOT_ENGLISH', 'AND_NOT_CS', 'OR_AND_NOT_CS'),
+    "eng_lin": ('OR', 'AND', 'AND_UENG', 'Senior_Lingusitics', 'OR_AND_Program_OR', 'Senior_AND_UENG', 'Any_Two', 'OR_AND_NOT_CS', 'AND_LIN_LIT'),
+    "eng_edu": ('OR', 'AND', 'AND_EDU', 'AND_UENG', 'OR_AND_Program_OR', 'Any_Three', 'Any_Two', 'OR_AND_NOT_CS', 'Senior_Lingusitics', 'Senior_AND_UENG'),
+    "eng_lit": ('OR', 'AND_UENG', 'OR_AND_Program_OR', 'Any_Two', 'OR_AND_NOT_CS', 'Senior_Lingusitics', 'Senior_AND_UENG', 'AND', 'AND_LIN_LIT'),
+    "pr": ('AND', 'OR', 'OR_MCOM', 'AND_MCOM', 'AND_Credits_MCOM', 'AND_Credits_MCOM_2', 'AND_OR_2', 'AND_OR_PR', 'AND_OR_Junior_Program', 'OR_AND_Program_OR', 'Junior_Program', 'Senior_MCOM', 'AND_Junior', 'AND_Junior_Program', 'Any_Two', 'OR_AND_NOT_CS', 'AND_NOT_ENGLISH', 'AND_NOT_CS'),
+    "vc": ('OR', 'AND', 'AND_MCOM', 'OR_MCOM', 'AND_Credits_MCOM', 'AND_Credits_MCOM_2', 'AND_OR_Junior_Program', 'AND_OR_2', 'AND_OR_PR', 'Senior_MCOM', 'OR_AND_Program_OR', 'Junior_Program', 'AND_Junior', 'AND_Junior_Program', 'Any_Two', 'OR_AND_NOT_CS', 'AND_NOT_ENGLISH', 'AND_NOT_CS'),
+    "mgmt": ('OR', 'AND', 'AND_College', 'AND_College_OR', 'AND_Senior', 'AND_OR_2', 'Any_Two'),
+    "elec": ('OR', 'AND', 'AND_College', 'OR_AND_College_OR', 'AND_College_OR', 'AND_Senior', 'AND_OR_2', 'AND_3_Courses', 'Any_Two'),
+    "comp": ('OR', 'AND', 'AND_College', 'OR_AND_College_OR', 'AND_OR', 'Junior_ECOM', 'Senior_ECOM', 'AND_OR_2', 'AND_OR_3', 'AND_College_OR', 'AND_3_Courses', 'Any_Two', 'AND_Senior'),
+    "acc_": ('OR', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'AND_Senior', 'AND_Major_ACC', 'AND_NOT_ENGLISH'),
+    "ib_": ('OR', 'AND_Major_MG_IB', 'AND_Major_MG_IB_MRKT', 'AND_Major_MG_IB_MRKT_MIS', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'AND_NOT_ENGLISH'),
+    "mob_": ('OR', 'AND_Major_MG_IB', 'AND_Major_MG_IB_MRKT', 'AND_Major_MG_IB_MRKT_MIS', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'AND_NOT_ENGLISH'),
+    "mis_": ('OR', 'AND_Major_MG_IB_MRKT_MIS', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'AND_Major_MIS', 'AND_NOT_ENGLISH', 'AND_Credits_MIS_CS'),
+    "mrkt_": ('OR', 'AND_Major_MG_IB_MRKT', 'AND_Major_MG_IB_MRKT_MIS', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'AND_Major_MRKT', 'AND_NOT_ENGLISH'),
+    "fin_": ('OR', 'AND_NOT_CS', 'OR_AND_NOT_CS', 'AND_Major_FIN', 'AND_Senior', 'AND_NOT_ENGLISH'),
+    "cs_": ('OR', 'AND_College_OR', 'OR_CS', 'OR_AND_College_OR', 'AND_Credits_MIS_CS'),
+    "dmp_": ('OR', 'OR_MCOM', 'AND_MCOM', 'AND_Credits_MCOM', 'AND_Credits_MCOM_2', 'OR_AND_Program_OR', 'AND_Junior', 'AND_Junior_Program', 'AND_NOT_ENGLISH', 'AND_NOT_CS', 'OR_AND_NOT_CS'),
+    "eng_lin_": ('OR', 'AND_UENG', 'OR_AND_Program_OR', 'OR_AND_NOT_CS', 'AND_LIN_LIT'),
+    "eng_edu_": ('OR', 'AND_EDU', 'AND_UENG', 'OR_AND_Program_OR', 'OR_AND_NOT_CS'),
+    "eng_lit_": ('OR', 'AND_UENG', 'OR_AND_Program_OR', 'OR_AND_NOT_CS', 'AND_LIN_LIT'),
+    "pr_": ('OR', 'OR_MCOM', 'AND_MCOM', 'AND_Credits_MCOM', 'AND_Credits_MCOM_2', 'OR_AND_Program_OR', 'AND_Junior', 'AND_Junior_Program', 'OR_AND_NOT_CS', 'AND_NOT_ENGLISH', 'AND_NOT_CS'),
+    "vc_": ('OR', 'AND_MCOM', 'OR_MCOM', 'AND_Credits_MCOM', 'AND_Credits_MCOM_2', 'OR_AND_Program_OR', 'AND_Junior', 'AND_Junior_Program', 'OR_AND_NOT_CS', 'AND_NOT_ENGLISH', 'AND_NOT_CS'),
+    "mgmt_": ('OR', 'AND_College', 'AND_College_OR'),
+    "elec_": ('OR', 'AND_College', 'OR_AND_College_OR', 'AND_College_OR', 'AND_Senior'),
+    "comp_": ('OR', 'AND_College', 'OR_AND_College_OR', 'AND_College_OR', 'AND_Senior'),
+}
+
+# Variants where a condition name has a different meaning from the builder of the same name
+special_condition_forms = {
+    ("mis", "AND_Credits_MIS_CS"): "AND_Credits_MIS_CS_PASSED",
+    ("mis_", "AND_Credits_MIS_CS"): "AND_Credits_MIS_CS_PASSED",
+    ("cs_", "AND_Credits_MIS_CS"): "AND_Credits_MIS_CS_PASSED",
+    ("dmp_", "AND_Credits_MCOM"): "AND_Credits_MCOM_PASSED",
+    ("pr_", "AND_Credits_MCOM"): "AND_Credits_MCOM_PASSED",
+    ("vc_", "AND_Credits_MCOM"): "AND_Credits_MCOM_PASSED",
+    ("dmp_", "AND_Credits_MCOM_2"): "AND_Credits_MCOM_2_PASSED",
+    ("pr_", "AND_Credits_MCOM_2"): "AND_Credits_MCOM_2_PASSED",
+    ("vc_", "AND_Credits_MCOM_2"): "AND_Credits_MCOM_2_PASSED",
+    ("comp", "AND_OR_2"): "AND_OR_2_FROM_2",
+    ("mgmt", "AND_OR_2"): "AND_OR_2_FROM_3",
+    ("elec", "AND_OR_2"): "AND_OR_2_FROM_3",
+}
+
+# Major sheet -> variant whose conditions its pipeline evaluates
+special_condition_sheets = {
+    "ACCOUNTING": "acc", "INTL BUSIN": "ib", "MANAGEMENT": "mob", "MIS": "mis",
+    "MARKETING2": "mrkt", "FINANCE": "fin", "COMSCIENCE": "cs", "DIGITALMED": "dmp",
+    "LINGUISTIC": "eng_lin", "ENGLISH": "eng_edu", "LITERATURE": "eng_lit", "PR / ADV": "pr",
+    "VISUAL COM": "vc", "MGMTENG": "mgmt", "ELECENG": "elec", "COMPENG": "comp",
+}
+
+def compile_special_conditions(prerequisites_special, conditions, variant):
+    # Courses keep their prerequisites_special order; unsupported conditions are left out
+    supported = special_condition_variants[variant]
+    rules = {}
+    for course, prereqs in prerequisites_special.items():
+        condition = conditions.get(course, "")
+        if condition in supported:
+            builder = special_condition_builders[special_condition_forms.get((variant, condition), condition)]
+            rules[course] = builder(list(prereqs))
+    return rules
+
+# Student fields read by the condition predicates
+special_condition_fields = ('Major', 'College', 'Program', 'Passed Credits', 'Student_Level', 'Incoming_PCR')
+
+def eligible_by_rules(special_rules, taken_courses, student_info):
+    return {course for course, rule in special_rules.items() if rule(taken_courses, student_info)}
+
+# Cohort form of the compiled predicates: a taken predicate is a (prerequisites, minimum) leaf,
+# satisfied on a row of the cumulative taken matrix when the count of its prerequisites taken
+# reaches the minimum; the student predicates compare columns of the rows' first history record
+def taken_leaf(rule):
+    if rule.func is taken_all:
+        return tuple(rule.args[0]), len(rule.args[0])
+    if rule.func is taken_any:
+        return tuple(rule.args[0]), 1
+    if rule.func is taken_at_least:
+        return rule.args
+    return None
+
+def rule_taken_leaves(rule):
+    leaf = taken_leaf(rule)
+    if leaf is not None:
+        return [leaf]
+    if rule.func in (rule_both, rule_either):
+        return rule_taken_leaves(rule.args[0]) + rule_taken_leaves(rule.args[1])
+    return []
+
+def rule_rows(rule, leaf_rows, student_rows):
+    # leaf_rows yields the rows of the rule's taken leaves in rule_taken_leaves order
+    if taken_leaf(rule) is not None:
+        return next(leaf_rows)
+    func, args = rule.func, rule.args
+    if func is rule_both:
+        first = rule_rows(args[0], leaf_rows, student_rows)
+        return first & rule_rows(args[1], leaf_rows, student_rows)
+    if func is rule_either:
+        first = rule_rows(args[0], leaf_rows, student_rows)
+        return first | rule_rows(args[1], leaf_rows, student_rows)
+    if func is student_in:
+        return student_rows[args[0]].isin(args[1]).to_numpy()
+    if func is student_not:
+        return (student_rows[args[0]] != args[1]).to_numpy()
+    if func in (credits_at_least, credits_below):
+        compare = np.greater_equal if func is credits_at_least else np.less
+        limit, incoming = args
+        rows = compare(student_rows['Passed Credits'].to_numpy(dtype=float), limit)
+        if incoming:
+            rows |= compare(np.trunc(student_rows['Incoming_PCR'].to_numpy(dtype=float)), limit)
+        return rows
+    raise ValueError(f"No cohort form for the {func.__name__} predicate")
+
+def cohort_eligible_by_rules(special_rules, cumulative, course_index, student_rows):
+    # Rows x special_rules matrix of the rules holding on each row of the cumulative taken matrix
+    rules = list(special_rules.values())
+    leaves = [leaf for rule in rules for leaf in rule_taken_leaves(rule)]
+    incidence = requirement_incidence([prereqs for prereqs, _ in leaves], course_index)
+    minimums = np.array([minimum for _, minimum in leaves], dtype=np.int32)
+    leaf_rows = iter((cumulative @ incidence >= minimums).T)
+    eligible = np.zeros((len(cumulative), len(rules)), dtype=bool)
+    for rule_code, rule in enumerate(rules):
+        eligible[:, rule_code] = rule_rows(rule, leaf_rows, student_rows)
+    return eligible
+
+# Eligibility Timeline
+# Special conditions that only look at the courses taken; every other condition also depends on
+# the student's level, credits, major or program and is re-checked each semester
+taken_only_conditions = {"OR", "AND", "AND_OR", "AND_OR_2", "AND_OR_3", "OR_AND", "AND_3_Courses", "Any_Two", "Any_Three"}
+
+def student_semesters(major_data):
+    # (Student_ID, Semester, courses taken that semester, first row of the semester as a dict),
+    # in Student_ID then Semester order, from one groupby over the major instead of one per student
+    semester_groups = major_data.groupby(['Student_ID', 'Semester'])
+    semester_info = {(record['Student_ID'], record['Semester']): record for record in semester_groups.head(1).to_dict('records')}
+    for (student_id, semester), courses in semester_groups['Course_ID'].agg(list).items():
+        yield student_id, semester, courses, semester_info[(student_id, semester)]
+
+def eligibility_timeline(st_hist_data, catalog, major, incremental=True):
+    # Eligibility at every semester of every student, walking each student's semesters once and
+    # re-checking only the courses whose prerequisites include a newly completed course, found
+    # through the catalog's reverse index (incremental=False re-checks the whole catalog every semester)
+    values_to_delete = ['FA', 'F', 'I', 'S', 'NP', 'WA']
+    major_data = st_hist_data[(st_hist_data['Major'] == major) & ~st_hist_data["GRADE"].isin(values_to_delete)]
+    major_data = major_data.sort_values(by=['Student_ID', 'Semester'])
+
+    major_catalog = catalog["majors"][major_catalog_sheets[major]]
+    prerequisites = major_catalog["prerequisites"]
+    special_rules = major_catalog["special_rules"]
+    conditions = major_catalog["conditions"]
+    standing_rules = [course for course in special_rules if conditions[course] not in taken_only_conditions]
+
+    timeline = []
+    current_student = None
+    for student_id, semester, courses, student_info in student_semesters(major_data):
+        first_semester = student_id != current_student
+        if first_semester:
+            current_student = student_id
+            cumulative_courses = set()
+            previous_eligible = set()
+        new_courses = set(courses) - cumulative_courses
+        cumulative_courses.update(new_courses)
+        if first_semester or not incremental:
+            # A student's first semester is checked against the whole catalog
+            standard_eligible = set()
+            special_eligible = set()
+            standard_candidates = prerequisites.keys()
+            special_candidates = special_rules.keys()
+        else:
+            standard_candidates = set()
+            special_candidates = set()
+            for new_course in new_courses:
+                for course, condition in course_dependents(major_catalog, new_course):
+                    if condition in list_conditions:
+                        standard_candidates.add(course)
+                    elif course in special_rules:
+                        special_candidates.add(course)
+            special_candidates.update(standing_rules)
+
+        # Standard prerequisites only accumulate, special conditions can also stop holding
+        standard_eligible.update(course for course in standard_candidates
+                                 if all(req in cumulative_courses for req in prerequisites[course]))
+        for course in special_candidates:
+            if special_rules[course](cumulative_courses, student_info):
+                special_eligible.add(course)
+            else:
+                special_eligible.discard(course)
+
+        eligible = (standard_eligible | special_eligible) - cumulative_courses
+        timeline.append({
+            'Student_ID': student_id,
+            'Semester': semester,
+            'Major': student_info['Major'],
+            'College': student_info['College'],
+            'Program': student_info['Program'],
+            'Passed Credits': student_info['Passed Credits'],
+            'Student_Level': student_info['Student_Level'],
+            'Eligible_Courses': sorted(eligible),
+            'Gained_Eligibility': sorted(eligible - previous_eligible),
+            'Lost_Eligibility': sorted(previous_eligible - eligible),
+        })
+        previous_eligible = eligible
+
+    return pd.DataFrame(timeline, columns=['Student_ID', 'Semester', 'Major', 'College', 'Program', 'Passed Credits', 'Student_Level',
+                                           'Eligible_Courses', 'Gained_Eligibility', 'Lost_Eligibility'])
+
+# Helper Functions from provided logic
+def combine_eligible_courses(df1, df2):
+    if df1.shape != df2.shape:
+        raise ValueError("Dataframes do not have the same shape.")
+    
+    if list(df1.columns) != list(df2.columns):
+        raise ValueError("Dataframes do not have the same headers.")
+    
+    # Union the two Eligible_Courses columns in one pass, rows matched by index label
+    combined_df = df1.copy()
+    combined_df['Eligible_Courses'] = [list(set(standard_courses + special_courses))
+                                       for standard_courses, special_courses in zip(df1['Eligible_Courses'], df2['Eligible_Courses'].loc[df1.index])]
+    
+    return combined_df
+
+def co_requisite_combinations(eligible_courses, co_index):
+    # Same combinations as find_course_combinations, in CO_Courses row order
+    eligible = set(eligible_courses)
+    matched = [(position, combination) for position, requisites_list, combination in co_index.get(None, [])]
+    for course in eligible:
+        for position, requisites_list, combination in co_index.get(course, []):
+            if all(requisite in eligible for requisite in requisites_list):
+                matched.append((position, combination))
+    matched.sort(key=lambda match: match[0])
+    return [list(combination) for position, combination in matched]
+
+def add_co_requisite_courses(combined_list, co_index):
+    # create_combined_courses for the whole cohort in one pass over the Eligible_Courses column
+    co_requisite_courses = [co_requisite_combinations(eligible_courses, co_index) for eligible_courses in combined_list['Eligible_Courses']]
+    combined_list = combined_list.copy()
+    combined_list['Co_Requisite_Courses'] = co_requisite_courses
+    combined_list['Eligible_Courses_CO'] = [list(set(eligible_courses + [course for combination in combinations for course in combination]))
+                                            for eligible_courses, combinations in zip(combined_list['Eligible_Courses'], co_requisite_courses)]
+    return combined_list
+
+def find_additional_eligibilities_masked(courses, taken_courses, prerequisite_masks, course_bits):
+    # find_additional_eligibilities (benchmarks/reference.py) with each prerequisite test done as one mask test
+    additional_eligibilities = set()
+    taken_mask = course_mask(taken_courses, course_bits)
+    for course in courses:
+        hypothetical_courses = taken_courses.copy()
+        hypothetical_courses.add(course)
+        hypothetical_mask = taken_mask | course_bits.get(course, 0)
+        for c, mask in prerequisite_masks:
+            if hypothetical_mask & mask == mask and c not in hypothetical_courses:
+                additional_eligibilities.add(c)
+    return list(additional_eligibilities)
+
+def find_additional_eligibilities_compiled(courses, taken_courses, student_info, special_rules):
+    # find_additional_eligibilities_special (benchmarks/reference.py) evaluated with compiled condition predicates
+    additional_eligibilities = set()
+    hypothetical_courses = taken_courses.copy()
+    for course in courses:
+        hypothetical_courses.add(course)
+        for c, rule in special_rules.items():
+            if rule(hypothetical_courses, student_info) and c not in hypothetical_courses:
+                additional_eligibilities.add(c)
+    return list(additional_eligibilities)
+
+def future_eligible_courses(comprehensive_data, major_catalog, course_bits):
+    # Rows of the exploded comprehensive data hold one course, so each row is a lookup in the unlock table
+    unlocks = major_catalog["unlocks"]
+    future_courses = []
+    for courses in comprehensive_data['Eligible_Courses_CO']:
+        if len(courses) == 1 and courses[0] in unlocks:
+            future_courses.append(list(unlocks[courses[0]]))
+        else:
+            future_courses.append(find_additional_eligibilities_masked(courses, set(courses), major_catalog["prerequisite_masks"], course_bits))
+    return future_courses
+
+def future_eligible_special(comprehensive_data, major_catalog):
+    # find_additional_eligibilities_compiled per row. For a one-course row, a rule that does not list
+    # the course gives the same answer as with no courses taken, which only depends on the student's
+    # standing and is evaluated once per standing; only the rules listing the course run per row.
+    special_rules = major_catalog["future_special_rules"]
+    rule_order = major_catalog["special_rule_order"]
+    fields = [field for field in special_condition_fields if field in comprehensive_data.columns]
+    standing_special = {}
+    future_courses = []
+    for courses, student_info in zip(comprehensive_data['Eligible_Courses_CO'], comprehensive_data[fields].to_dict('records')):
+        if len(courses) != 1:
+            future_courses.append(find_additional_eligibilities_compiled(courses, set(courses), student_info, special_rules))
+            continue
+        course = courses[0]
+        standing = tuple(student_info.values())
+        if standing not in standing_special:
+            standing_special[standing] = [c for c, rule in special_rules.items() if rule(set(), student_info)]
+        dependents = major_catalog["special_unlocks"].get(course, [])
+        candidates = standing_special[standing]
+        if dependents:
+            candidates = sorted(set(candidates).union(dependents), key=rule_order.get)
+        hypothetical_courses = {course}
+        additional_eligibilities = set()
+        for c in candidates:
+            if (c not in dependents or special_rules[c](hypothetical_courses, student_info)) and c not in hypothetical_courses:
+                additional_eligibilities.add(c)
+        future_courses.append(list(additional_eligibilities))
+    return future_courses
+
+# Function to remove matches
+def remove_matches(row):
+    eligible_courses = set(row["Eligible_Courses_CO"])
+    course_id = set(row["Course_ID"])
+    unmatched_courses = eligible_courses - course_id  # Set difference to find unmatched courses
+    return list(unmatched_courses)  # Return as list for compatibility
+
+# Function to process each row based on multiple course categories
+def process_row(row):
+    course_data = [
+        (['MATH100','MATH131','MATH132','MATH231','MATH140','MATH221','MATH211',
+          'MATH330','MATH111','MATH130','MATH121','MATH400','MATH331','MATH342',
+          'MATH232','MATH122','MATH120'],
+         ['MATH094','MATH095','MATH096','MATH098']),
+        
+        (['ENGL100','ENGL110','ENGL112'],
+         ['ENGL097','ENGL098']),
+         (['MATH096'],
+         ['MATH095','MATH094']),
+         (['MATH098'],
+         ['MATH096','MATH095','MATH094'])
+    ]
+
+    for check_courses, remove_courses in course_data:
+        if any(course in check_courses for course in row['Course_ID']):
+            row['Eligible_Courses_CO'] = [course for course in row['Eligible_Courses_CO'] if course not in remove_courses]
+    
+    return row
+
+
+def find_best_courses(group):
+    sorted_courses = group.sort_values(by='Course_Score', ascending=False)
+    return sorted_courses['Eligible_Courses_CO'].tolist()[:5]
+
+def find_best_courses_v2(group):
+    sorted_courses = group.sort_values(by='Course_Score', ascending=False)
+    return sorted_courses['Eligible_Courses_CO'].tolist()[:5]
+
+# Function to normalize the scores per student for each eligible course using Max Normalization
+def normalize_by_student(group):
+    # Normalize the Course Score by Max Normalization
+    if group['Course_Score'].max() > 0:  # Avoid division by zero
+        group['Normalized_Course_Score'] = group['Course_Score'] / group['Course_Score'].max()
+    else:
+        group['Normalized_Course_Score'] = 0  # Assign a default value if all scores are the same
+    
+    # Normalize the Remaining Weight Score by Max Normalization
+    if group['Remaining_Courses_Weight_Score'].max() > 0:
+        group['Normalized_Remaining_Courses_Weight'] = group['Remaining_Courses_Weight_Score'] / group['Remaining_Courses_Weight_Score'].max()
+    else:
+        group['Normalized_Remaining_Courses_Weight'] = 0  # Assign a default value if all scores are the same
+
+    # Normalize the Course Level by Max Normalization and invert it
+    if group['Course_Level'].max() > 0:
+        group['Normalized_Course_Level'] = 1 - (group['Course_Level'] / group['Course_Level'].max())
+    else:
+        group['Normalized_Course_Level'] = 0  # Assign a default value if all levels are the same
+
+    return group
+
+def find_best_courses_cea_v2(group):
+    sorted_courses = group.sort_values(by='Final_Score', ascending=False)
+    return sorted_courses['Eligible_Courses_CO'].tolist()[:7]
+
+def student_eligibility(major_data, major_catalog, latest_only=True):
+    # Standard and special eligibility of every student's semesters (only the latest with latest_only)
+    # at once on the cohort's cumulative taken matrix, merged and matched against the co-requisites.
+    # Every row depends on one student only, so the stage can run on shards of whole students and
+    # be concatenated back in order
+    prerequisites_major = major_catalog["prerequisites"]
+    special_rules_major = major_catalog["special_rules"]
+    courses = list(prerequisites_major)
+    special_courses = list(special_rules_major)
+    # Prerequisites nobody in the cohort has taken can never count, so the courses taken are enough
+    course_index = pd.Index(major_data['Course_ID'].dropna().unique())
+
+    semester_keys, first_positions, cumulative = cohort_taken_matrix(major_data, course_index, latest_only)
+    student_rows = major_data.iloc[first_positions].reset_index(drop=True)
+    eligible = cohort_eligible_by_prerequisites(prerequisites_major, cumulative, course_index)
+    special_eligible = cohort_eligible_by_rules(special_rules_major, cumulative, course_index, student_rows)
+
+    final_results_major = []  # Standard eligibility results
+    final_results_special_major = []  # Special eligibility results
+    course_ids = course_index.to_numpy()
+    student_fields = ['Major', 'College', 'Program', 'Passed Credits', 'Student_Level']
+    for (student_id, semester), student_info, taken_row, eligible_row, special_row in zip(
+            semester_keys, student_rows[student_fields].to_dict('records'), cumulative, eligible, special_eligible):
+        cumulative_courses = set(course_ids[np.flatnonzero(taken_row)])
+        eligible_courses = {courses[course_code] for course_code in np.flatnonzero(eligible_row)}
+        special_eligible_courses = {special_courses[course_code] for course_code in np.flatnonzero(special_row)}
+        final_results_major.append({'Student_ID': student_id, 'Semester': semester, **student_info,
+                                    'Eligible_Courses': list(eligible_courses - cumulative_courses)})
+        final_results_special_major.append({'Student_ID': student_id, 'Semester': semester, **student_info,
+                                            'Eligible_Courses': list(special_eligible_courses - cumulative_courses)})
+
+    # Convert Results to DataFrames
+    final_results_df_major = pd.DataFrame(final_results_major)
+    final_results_special_df_major = pd.DataFrame(final_results_special_major)
+    
+    # Combine Eligible Courses from Both DataFrames
+    combined_major_list = combine_eligible_courses(final_results_df_major, final_results_special_df_major)
+    # Find Course Combinations for Co-requisites
+    return add_co_requisite_courses(combined_major_list, major_catalog["co_index"])
+
+def future_eligibility(comprehensive_data, major_catalog, course_bits):
+    # Standard and special future eligibility of each comprehensive row, one row at a time
+    return future_eligible_courses(comprehensive_data, major_catalog, course_bits), future_eligible_special(comprehensive_data, major_catalog)
+
+# Major registry: everything a major's pipeline depends on besides its data. CEA majors rank the
+# V2 recommendations by Final_Score and keep seven courses, the other colleges by Course_Score and five
+major_registry = {
+    major: {
+        "sheet": sheet_major,
+        "find_best_courses_v2": find_best_courses_cea_v2 if sheet_major in catalog_college_majors["CEA"] else find_best_courses_v2,
+    }
+    for major, sheet_major in major_catalog_sheets.items()
+}
+
+def split_graded_history(st_hist_data):
+    # (passed history, failed attempts): the grade filtering every major's pipeline starts from,
+    # done once for a whole run when passed to process_major_data as graded_history
+    values_to_delete = ['FA', 'F', 'I', 'S', 'NP', 'WA']
+    failed_grades = ['F','FA','NP']
+    failed_data = st_hist_data[st_hist_data["GRADE"].isin(failed_grades)]
+    passed_data = st_hist_data[~st_hist_data["GRADE"].isin(values_to_delete)]
+    return passed_data, failed_data
+
+def process_major_data(major, st_hist_data, catalog, requirements_weights_path, latest_only=True, graded_history=None,
+                       student_shards=STUDENT_SHARDS, executor=None):
+    # Eligibility and recommendation pipeline of one registered major, returning its eight report frames.
+    # Student shards run on `executor` (a pipeline pool started with this catalog), by default the long-lived one
+    student_shards = pool_student_shards(student_shards, executor)
+    if graded_history is None:
+        graded_history = split_graded_history(st_hist_data)
+    passed_data, failed_data = graded_history
+    recommend_v2 = major_registry[major]["find_best_courses_v2"]
+    
+    # Filtering and Sorting Data
+    failed_data = failed_data[failed_data['Major'] == major]
+    failed_data = failed_data.sort_values(by=['Student_ID', 'Semester'])
+
+    grouped_data_failed = failed_data.groupby(['Student_ID'])['Course_ID'].apply(list).reset_index()
+    
+    # Filtering and Sorting Data
+    major_data = passed_data[passed_data['Major'] == major]
+    major_data = major_data.sort_values(by=['Student_ID', 'Semester'])
+
+    # Catalog tables for this major, parsed once per catalog version
+    major_catalog = catalog["majors"][major_registry[major]["sheet"]]
+    courses_major = major_catalog["courses"]
+    
+    grouped_data_major = major_data.groupby(['Student_ID'])['Course_ID'].apply(list).reset_index()
+
+    # Merge dataframes
+    merged_df = grouped_data_failed.merge(grouped_data_major, on=['Student_ID'], how='outer', suffixes=('_failed', '_all'))
+    # Replace NaN with empty lists to avoid errors
+    merged_df['Course_ID_all'] = merged_df['Course_ID_all'].apply(lambda x: x if isinstance(x, list) else [])
+    merged_df['Course_ID_failed'] = merged_df['Course_ID_failed'].apply(lambda x: x if isinstance(x, list) else [])
+
+    merged_df['Failed_Courses'] = merged_df.apply(
+        lambda row: list(set(row['Course_ID_failed']) - set(row['Course_ID_all'])),
+        axis=1)
+    # Keep only relevant columns
+    merged_df = merged_df[['Student_ID', 'Failed_Courses']]
+
+    # Extract the major's requirements and weights from respective DataFrames
+    major_requirements = load_requirements_weights(requirements_weights_path)[major]
+    requirements_major = major_requirements["requirements"]
+    requirements_major_ = major_requirements["requirements_pivot"].copy()
+
+    student_courses = major_data[["Student_ID", "Course_ID"]]
+
+    # Map AREA_OF_STUDY and COURSE_OF_STUDY to major_data
+    student_courses = student_courses.merge(courses_major[['Course_ID', 'AREA_OF_STUDY', 'COURSE_OF_STUDY', "Course_Level"]],
+                                            on='Course_ID', how='left').drop_duplicates()
+
+    # Create summary DataFrames for taken courses
+    student_progress = student_courses.groupby(['Student_ID', 'AREA_OF_STUDY']).size().reset_index(name='Total_Taken_Courses')
+    student_progress = student_progress.merge(requirements_major, on='AREA_OF_STUDY', how='left')
+    student_progress["Remaining_Courses"] = student_progress["Required_Courses"] - student_progress["Total_Taken_Courses"]
+    student_progress["Remaining_Courses"] = student_progress["Remaining_Courses"].apply(lambda x: max(x, 0))
+
+    free_elective_taken_counts = student_courses[(student_courses['AREA_OF_STUDY'] == "GE") & (student_courses['COURSE_OF_STUDY'] == "E")].groupby('Student_ID').size().reset_index(name='Total_Free_Electives_Taken')
+
+    # Update progress by including the free elective data
+    student_progress["Student_Progress"] = (student_progress["Total_Taken_Courses"] / student_progress["Required_Courses"]) * 100
+    student_progress["Student_Progress"].replace([np.inf, -np.inf], 100, inplace=True)
+
+    summary_area_of_study_taken = student_progress.pivot_table(index="Student_ID", columns="AREA_OF_STUDY", values="Total_Taken_Courses", fill_value=0)
+    summary_area_of_study_taken = summary_area_of_study_taken.merge(free_elective_taken_counts, on="Student_ID", how="left").fillna(0).rename(columns={"Total_Free_Electives_Taken": "FE"})
+
+    # Calculate remaining courses for each AREA_OF_STUDY by subtracting from the requirements
+    remaining_courses_df = subtract_from_requirements(summary_area_of_study_taken, major_requirements)
+
+    # Calculate weighted remaining courses
+    weighted_remaining_courses_df = apply_area_weights(remaining_courses_df, major_requirements)
+
+    # Prepare weighted remaining courses for merge
+    weighted_remaining_courses_df = weighted_remaining_courses_df.reset_index().melt(id_vars=['Student_ID'],
+                                                                                      var_name='AREA_OF_STUDY',
+                                                                                      value_name='Remaining_Courses_Weight_Score')
+    weighted_remaining_courses_df = weighted_remaining_courses_df[weighted_remaining_courses_df["AREA_OF_STUDY"] != "index"]
+
+    # Eligibility Calculation for Standard and Special Cases, and Co-requisites, sharded by student
+    sheet_major = major_registry[major]["sheet"]
+    course_bits = catalog["course_bits"]
+    shards = shard_students(major_data, student_shards) if student_shards > 1 else []
+    if len(shards) > 1:
+        executor = executor or get_pipeline_pool(catalog)
+        combined_major_list = pd.concat(map_history_shards(partial(student_eligibility_task, sheet_major, latest_only=latest_only), shards, executor),
+                                        ignore_index=True)
+    else:
+        combined_major_list = student_eligibility(major_data, major_catalog, latest_only)
+    latest_eligible_courses = combined_major_list.sort_values(by='Semester', ascending=False)
+    latest_eligible_courses = latest_eligible_courses.groupby('Student_ID').first().reset_index()
+    latest_eligible_courses = latest_eligible_courses.merge(grouped_data_major,on = "Student_ID",how = "inner")
+    latest_eligible_courses["Eligible_Courses_CO"] = latest_eligible_courses.apply(remove_matches, axis=1)
+    latest_eligible_courses = latest_eligible_courses.apply(process_row, axis=1)
+    latest_eligible_courses.drop(columns=["Course_ID"], inplace=True)
+
+    latest_eligible_courses = latest_eligible_courses.merge(merged_df, on='Student_ID', how='outer')
+    latest_eligible_courses['Failed_Courses'] = latest_eligible_courses['Failed_Courses'].apply(lambda x: x if isinstance(x, list) else [])
+    latest_eligible_courses['Eligible_Courses_CO'] = latest_eligible_courses['Eligible_Courses_CO'].apply(lambda x: x if isinstance(x, list) else [])
+    latest_eligible_courses['Eligible_Courses_CO'] = latest_eligible_courses.apply(
+        lambda row: list(set(row['Eligible_Courses_CO']) | (set(row['Failed_Courses']) - set(row['Eligible_Courses_CO']))),axis=1)
+    latest_eligible_courses = latest_eligible_courses.drop(columns=['Failed_Courses'])
+
+    latest_info_failed = failed_data.loc[failed_data.groupby("Student_ID")["Semester"].idxmax()]
+    missing_semester_df = latest_eligible_courses[latest_eligible_courses['Semester'].isna()]
+    latest_eligible_courses.dropna(inplace=True)
+    columns_to_fill = ['Semester', 'Major', 'College', 'Program', 'Passed Credits', 'Student_Level']
+
+    for col in columns_to_fill:
+        missing_semester_df.loc[missing_semester_df[col].isna(), col] = missing_semester_df.loc[
+            missing_semester_df[col].isna(), 'Student_ID'
+        ].map(latest_info_failed.set_index('Student_ID')[col])
+
+    columns_to_convert = ['Semester', 'Student_Level', 'Passed Credits']
+    for col in columns_to_convert:
+        latest_eligible_courses.loc[:, col] = pd.to_numeric(latest_eligible_courses[col], errors='coerce').astype('Int64')
+        
+    latest_eligible_courses = pd.concat([latest_eligible_courses, missing_semester_df], ignore_index=True)
+
+
+    max_semester_index = major_data.groupby('Student_ID')['Semester'].idxmax()
+    max_semester_data = major_data.loc[max_semester_index, ['Student_ID', 'Semester']]
+
+    last_semester_courses = pd.merge(max_semester_data, major_data, on=['Student_ID', 'Semester'])
+    eng097_fpu_students = last_semester_courses[last_semester_courses['Course_ID'] == 'ENGL097']
+    # Target course list
+    target_courses = ['ENGL098', 'MATH094', 'MATH095', 'MATH096', 'MATH098', 'MATH100', 'MATH111', 'MATH120', 'MATH121', 'MATH131', 'MATH140']
+
+    eng097_fpu_students_eligible = latest_eligible_courses[latest_eligible_courses['Student_ID']
+                                                       .isin(eng097_fpu_students['Student_ID'])].copy()
+    eng097_fpu_students_eligible.loc[:, 'Eligible_Courses_CO'] = eng097_fpu_students_eligible['Eligible_Courses_CO'].apply(
+    lambda courses: [course for course in courses if course in target_courses])
+
+    latest_eligible_courses = latest_eligible_courses.merge(
+    eng097_fpu_students_eligible[['Student_ID', 'Eligible_Courses_CO']],  # Relevant columns from filtered_students
+    on='Student_ID',
+    how='left',  # Keep all rows in students_df
+    suffixes=('', '_updated'))  # Suffix to differentiate new column)
+
+    latest_eligible_courses['Eligible_Courses_CO'] = latest_eligible_courses['Eligible_Courses_CO_updated'].combine_first(latest_eligible_courses['Eligible_Courses_CO'])
+    latest_eligible_courses = latest_eligible_courses.drop(columns=['Eligible_Courses_CO_updated'])
+    latest_eligible_courses = latest_eligible_courses.merge(grouped_data_major,on = "Student_ID",how = "outer")
+    latest_eligible_courses['Course_ID'] = latest_eligible_courses['Course_ID'].apply(lambda x: x if isinstance(x, list) else [])
+    latest_eligible_courses = latest_eligible_courses.apply(process_row, axis=1)
+    latest_eligible_courses.drop(columns=["Course_ID"], inplace=True)
+
+    # Exploding DataFrame and mapping course details
+    eligible_courses_comprehensive_data = latest_eligible_courses.explode("Eligible_Courses_CO")
+    eligible_courses_comprehensive_data = eligible_courses_comprehensive_data.merge(courses_major[['Course_ID', 'AREA_OF_STUDY', 'COURSE_OF_STUDY', 'Course_Level']],
+                                                                                    left_on='Eligible_Courses_CO', right_on='Course_ID', how='left').drop(columns="Course_ID")
+    eligible_courses_comprehensive_data['Eligible_Courses_CO'] = eligible_courses_comprehensive_data['Eligible_Courses_CO'].apply(lambda x: x if isinstance(x, list) else ([] if pd.isna(x) else [x]))
+
+    # Find Additional Eligibilities, sharded by rows
+    row_shards = [rows for rows in np.array_split(np.arange(len(eligible_courses_comprehensive_data)), student_shards) if len(rows)] if student_shards > 1 else []
+    if len(row_shards) > 1:
+        executor = executor or get_pipeline_pool(catalog)
+        future_columns = ['Eligible_Courses_CO'] + [field for field in special_condition_fields if field in eligible_courses_comprehensive_data.columns]
+        future_shards = map_shards(partial(future_eligibility_task, sheet_major),
+                                   [eligible_courses_comprehensive_data[future_columns].iloc[rows] for rows in row_shards], executor)
+        future_courses = [courses for standard, special in future_shards for courses in standard]
+        future_special_courses = [courses for standard, special in future_shards for courses in special]
+    else:
+        future_courses, future_special_courses = future_eligibility(eligible_courses_comprehensive_data, major_catalog, course_bits)
+    eligible_courses_comprehensive_data['Future_Eligible_Courses_List'] = future_courses
+    eligible_courses_per_student = eligible_courses_comprehensive_data.groupby('Student_ID')['Eligible_Courses_CO'].agg(lambda x: list(set([item for sublist in x for item in sublist if isinstance(sublist, list)]))).reset_index()
+
+    # Merge aggregated list back to the comprehensive DataFrame
+    eligible_courses_comprehensive_data = eligible_courses_comprehensive_data.merge(eligible_courses_per_student.rename(columns={'Eligible_Courses_CO': 'Eligible_Courses_List_All'}), on='Student_ID', how='left')
+
+    # Filter matching courses from future eligible lists
+    eligible_courses_comprehensive_data['Future_Eligible_Courses_List'] = eligible_courses_comprehensive_data.apply(lambda row: [course for course in row['Future_Eligible_Courses_List'] if course not in row['Eligible_Courses_List_All']], axis=1)
+    eligible_courses_comprehensive_data['Total_Future_Eligible_Courses_List'] = eligible_courses_comprehensive_data['Future_Eligible_Courses_List'].apply(len)
+
+    # Special eligibility courses
+    eligible_courses_comprehensive_data['Future_Eligible_Courses_Special'] = future_special_courses
+    eligible_courses_comprehensive_data['Future_Eligible_Courses_Special'] = eligible_courses_comprehensive_data.apply(lambda row: [course for course in row['Future_Eligible_Courses_Special'] if course not in row['Eligible_Courses_List_All']], axis=1)
+    eligible_courses_comprehensive_data['Total_Future_Eligible_Courses_Special'] = eligible_courses_comprehensive_data['Future_Eligible_Courses_Special'].apply(len)
+
+    # Combine Future Eligible Courses and calculate the score
+    eligible_courses_comprehensive_data["Future_Eligible_Courses"] = eligible_courses_comprehensive_data["Future_Eligible_Courses_List"] + eligible_courses_comprehensive_data["Future_Eligible_Courses_Special"]
+    eligible_courses_comprehensive_data['Course_Score'] = eligible_courses_comprehensive_data['Future_Eligible_Courses'].apply(len)
+
+    # Find Best Courses
+    recommended_courses_major = eligible_courses_comprehensive_data.groupby(['Student_ID', 'Semester']).apply(lambda group: pd.Series({'Recommended_Courses': find_best_courses(group)})).reset_index()
+
+
+    eligible_courses_comprehensive_data = eligible_courses_comprehensive_data.merge(recommended_courses_major, on=['Student_ID', 'Semester'])
+    eligible_courses_comprehensive_data = eligible_courses_comprehensive_data.merge(weighted_remaining_courses_df, on=['Student_ID', 'AREA_OF_STUDY'], how='left')
+
+
+    eligible_courses_comprehensive_data = eligible_courses_comprehensive_data.groupby('Student_ID', group_keys=False).apply(normalize_by_student)
+    eligible_courses_comprehensive_data['Final_Score'] = (
+        (eligible_courses_comprehensive_data['Normalized_Course_Score'] * 0.4) +
+        (eligible_courses_comprehensive_data['Normalized_Remaining_Courses_Weight'] * 0.4) +
+        (eligible_courses_comprehensive_data['Normalized_Course_Level'] * 0.2))
+
+    # Find Best Courses
+    recommended_courses_major_v2 = eligible_courses_comprehensive_data.groupby(['Student_ID', 'Semester']).apply(lambda group: pd.Series({'Recommended_Courses_V2': recommend_v2(group)})).reset_index()
+    eligible_courses_comprehensive_data = eligible_courses_comprehensive_data.merge(recommended_courses_major_v2, on=['Student_ID', 'Semester'])
+
+    recommended_courses = recommended_courses_major.merge(recommended_courses_major_v2,on=['Student_ID', 'Semester'])
+
+    # Create summary DataFrames for eligible courses
+    summary_area_of_study_eligible = eligible_courses_comprehensive_data.groupby(['Student_ID', 'AREA_OF_STUDY']).size().reset_index(name='Total_Eligible_Courses')
+    summary_course_of_study_eligible = eligible_courses_comprehensive_data.groupby(['Student_ID', 'COURSE_OF_STUDY']).size().reset_index(name='Total_Eligible_Courses')
+    summary_area_of_study_eligible = summary_area_of_study_eligible.pivot_table(index="Student_ID", columns="AREA_OF_STUDY", values="Total_Eligible_Courses", fill_value=0).reset_index()
+
+    return requirements_major_,student_progress,summary_area_of_study_taken,remaining_courses_df,latest_eligible_courses,eligible_courses_comprehensive_data,recommended_courses,summary_area_of_study_eligible
+
+# The eight report families returned by process_major_data, in order, with the CSV each is saved as
+report_files = {
+    "requirements_df": "requirements_df.csv",
+    "student_progress": "student_progress.csv",
+    "summary_area_of_study_taken": "summary_area_of_study_taken.csv",
+    "remaining_courses_df": "remaining_courses_df.csv",
+    "latest_eligible_courses": "latest_eligible_courses.csv",
+    "eligible_courses_comprehensive_data": "eligible_courses_comprehensive_data.csv",
+    "recommended_courses": "recommended_courses.csv",
+    "summary_area_of_study_eligible": "summary_area_of_study_eligible.csv",
+}
+
+def major_partitions(st_hist_data, majors=None):
+    # (major, passed history, failed attempts) for every registered major (or `majors`) with a passed
+    # history: the history is grade-filtered once and partitioned once by Major
+    passed_data, failed_data = split_graded_history(st_hist_data)
+    passed_by_major = dict(tuple(passed_data.groupby('Major', sort=False, observed=True)))
+    failed_by_major = dict(tuple(failed_data.groupby('Major', sort=False, observed=True)))
+    no_failed = failed_data.iloc[:0]
+    return [(major, passed_by_major[major], failed_by_major.get(major, no_failed))
+            for major in (majors or major_registry) if major in passed_by_major]
+
+# Catalog of a pipeline worker process, set once by init_pipeline_worker, and the decode tables of
+# the shared history block it last read, as (block name, tables)
+pipeline_worker_catalog = None
+pipeline_worker_history = None
+
+def init_pipeline_worker(catalog):
+    global pipeline_worker_catalog
+    pipeline_worker_catalog = catalog
+
+def run_major_task(major, passed_data, failed_data, requirements_weights_path, latest_only=True, catalog=None, student_shards=STUDENT_SHARDS):
+    # One major's pipeline over its partition, with the worker's catalog unless one is given
+    started = time.perf_counter()
+    major_reports = process_major_data(major, passed_data, catalog or pipeline_worker_catalog, requirements_weights_path, latest_only,
+                                       graded_history=(passed_data, failed_data), student_shards=student_shards)
+    return major, major_reports, time.perf_counter() - started
+
+def pipeline_mp_context():
+    # Never fork the multi-threaded Streamlit server: workers come from a fork server that has
+    # imported this module (spawned where there is none), and tasks are pickled by reference to
+    # this module rather than to the script Streamlit re-creates as __main__ on every rerun. Workers
+    # get their own string-hash seed: set PYTHONHASHSEED for the server when the batch reports must
+    # break recommendation ties exactly as the main page does
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context("forkserver")
+        mp_context.set_forkserver_preload([__name__])
+        return mp_context
+    return multiprocessing.get_context("spawn")
+
+def pipeline_pool(catalog, workers):
+    # The catalog goes to each worker once through the initializer, not with every task
+    return ProcessPoolExecutor(max_workers=workers, mp_context=pipeline_mp_context(), initializer=init_pipeline_worker, initargs=(catalog,))
+
+# One long-lived pipeline pool per server process, shared by every session and rerun
+pipeline_pool_lock = threading.Lock()
+pipeline_pool_state = {"catalog": None, "workers": None, "executor": None}
+
+def get_pipeline_pool(catalog, workers=PIPELINE_WORKERS):
+    # Started on first use and replaced only when the worker count or the catalog changes (a catalog
+    # without a version is matched by identity), or after discard_pipeline_pool dropped it
+    with pipeline_pool_lock:
+        state = pipeline_pool_state
+        executor = state["executor"]
+        same_catalog = state["catalog"] is catalog or (catalog["version"] is not None and state["catalog"] is not None
+                                                       and state["catalog"]["version"] == catalog["version"])
+        if executor is None or state["workers"] != workers or not same_catalog:
+            if executor is not None:
+                # Tasks already submitted to the old pool still run to completion
+                executor.shutdown(wait=False)
+            state.update(catalog=catalog, workers=workers, executor=pipeline_pool(catalog, workers))
+        return state["executor"]
+
+def discard_pipeline_pool(executor):
+    # A worker died and broke the pool (BrokenProcessPool from submit or result): shut the long-lived
+    # pool down so the next get_pipeline_pool starts a new one. Pools the caller started are left alone
+    with pipeline_pool_lock:
+        if pipeline_pool_state["executor"] is not executor:
+            return
+        pipeline_pool_state.update(catalog=None, workers=None, executor=None)
+    executor.shutdown(wait=False, cancel_futures=True)
+
+def pool_student_shards(student_shards, executor):
+    # Shards on a single-worker pool would run one after another and only add the hand-off cost,
+    # so without a caller's pool and with PIPELINE_WORKERS = 1 the stages run unsharded
+    if student_shards > 1 and executor is None and PIPELINE_WORKERS <= 1:
+        warnings.warn(f"{student_shards} student shards need PIPELINE_WORKERS > 1; running the major unsharded",
+                      RuntimeWarning, stacklevel=3)
+        return 1
+    return student_shards
+
+def shard_students(major_data, shards):
+    # Up to `shards` frames of whole students, keeping the rows in order (major_data is sorted by Student_ID)
+    student_codes = pd.factorize(major_data['Student_ID'])[0]
+    shard_of = student_codes * shards // max(student_codes.max(initial=-1) + 1, 1)
+    return [shard for _, shard in major_data.groupby(shard_of, sort=True)]
+
+def map_shards(task, shards, executor):
+    # task(shard) for every shard on a pipeline pool, results in shard order
+    try:
+        return list(executor.map(task, shards))
+    except BrokenProcessPool:
+        discard_pipeline_pool(executor)
+        raise
+
+def encode_shared_column(values):
+    # (flat array, decode table): numeric and datetime columns as they are (no table), anything else
+    # as int32 codes into its distinct values, -1 for missing
+    if isinstance(values.dtype, np.dtype) and values.dtype.kind in "biufM":
+        return values.to_numpy(), None
+    codes, uniques = pd.factorize(values)
+    return codes.astype(np.int32), pd.Series(uniques).array
+
+def share_history(st_hist_data):
+    # Copy a history frame (its index and every column) into one shared-memory block, followed by the
+    # pickled decode tables. The returned layout is all a worker needs to attach it: the block name and
+    # the offset and dtype of each array and of the tables, a few hundred bytes whatever the data
+    encoded = [(None,) + encode_shared_column(st_hist_data.index)]
+    encoded += [(column,) + encode_shared_column(st_hist_data[column]) for column in st_hist_data.columns]
+    tables = pickle.dumps([table for _, _, table in encoded], protocol=pickle.HIGHEST_PROTOCOL)
+    block = shared_memory.SharedMemory(create=True, size=sum(-(-array.nbytes // 8) * 8 for _, array, _ in encoded) + len(tables))
+    try:
+        fields = []
+        offset = 0
+        for column, array, _ in encoded:
+            np.ndarray(array.shape, array.dtype, buffer=block.buf, offset=offset)[:] = array
+            fields.append((column, array.dtype.str, offset))
+            offset += -(-array.nbytes // 8) * 8
+        block.buf[offset:offset + len(tables)] = tables
+    except BaseException:
+        block.close()
+        block.unlink()
+        raise
+    return block, {"name": block.name, "rows": len(st_hist_data), "fields": fields, "tables": (offset, len(tables))}
+
+def read_history_tables(layout, block):
+    # Decode tables of a shared history block, one per field (None for the uncoded ones)
+    offset, size = layout["tables"]
+    return pickle.loads(block.buf[offset:offset + size])
+
+def attach_history(layout, start=0, stop=None, block=None, tables=None):
+    # Worker side of share_history: attach the block without copying it (or use an attached `block`)
+    # and build rows [start, stop) as a DataFrame, decoding the coded columns
+    attached = block is None
+    if attached:
+        block = shared_memory.SharedMemory(name=layout["name"])
+    try:
+        if tables is None:
+            tables = read_history_tables(layout, block)
+        index = None
+        columns = {}
+        for (column, dtype, offset), table in zip(layout["fields"], tables):
+            values = np.ndarray(layout["rows"], dtype, buffer=block.buf, offset=offset)[start:stop]
+            values = values.copy() if table is None else table.take(values, allow_fill=True)
+            if column is None:
+                index = pd.Index(values)
+            else:
+                columns[column] = values
+        return pd.DataFrame(columns, index=index)
+    finally:
+        if attached:
+            block.close()
+
+def worker_history_rows(layout, start, stop):
+    # Rows [start, stop) of a shared history block. The block is attached for the task only, so an
+    # idle worker never keeps a finished run's memory mapped; its decode tables are read once per worker
+    global pipeline_worker_history
+    block = shared_memory.SharedMemory(name=layout["name"])
+    try:
+        if pipeline_worker_history is None or pipeline_worker_history[0] != layout["name"]:
+            pipeline_worker_history = (layout["name"], read_history_tables(layout, block))
+        return attach_history(layout, start, stop, block, pipeline_worker_history[1])
+    finally:
+        block.close()
+
+def history_rows_task(task, layout, rows):
+    return task(worker_history_rows(layout, *rows))
+
+def map_history_shards(task, shards, executor, shared_memory_tasks=SHARED_MEMORY_TASKS):
+    # map_shards over history frames. With shared memory the shards are laid out back to back in one
+    # block, and each task only carries its small layout and row range
+    if not shared_memory_tasks:
+        return map_shards(task, shards, executor)
+    block, layout = share_history(pd.concat(shards))
+    try:
+        bounds = np.cumsum([0] + [len(shard) for shard in shards]).tolist()
+        return map_shards(partial(history_rows_task, task, layout), list(zip(bounds[:-1], bounds[1:])), executor)
+    finally:
+        block.close()
+        block.unlink()
+
+def student_eligibility_task(sheet_major, major_data, latest_only=True):
+    return student_eligibility(major_data, pipeline_worker_catalog["majors"][sheet_major], latest_only)
+
+def future_eligibility_task(sheet_major, comprehensive_data):
+    return future_eligibility(comprehensive_data, pipeline_worker_catalog["majors"][sheet_major], pipeline_worker_catalog["course_bits"])
+
+def run_shared_major_task(major, layout, passed_rows, failed_rows, requirements_weights_path, latest_only=True):
+    # run_major_task over the major's passed and failed row ranges of a shared history block
+    return run_major_task(major, worker_history_rows(layout, *passed_rows), worker_history_rows(layout, *failed_rows),
+                          requirements_weights_path, latest_only, student_shards=1)
+
+def major_task_ranges(partitions):
+    # (major, passed rows, failed rows) of the partitions laid out back to back, passed before failed
+    task_ranges = []
+    start = 0
+    for major, passed_data, failed_data in partitions:
+        middle = start + len(passed_data)
+        task_ranges.append((major, (start, middle), (middle, middle + len(failed_data))))
+        start = middle + len(failed_data)
+    return task_ranges
+
+def iter_major_reports(st_hist_data, catalog, requirements_weights_path, majors=None, latest_only=True, workers=PIPELINE_WORKERS,
+                       shared_memory_tasks=SHARED_MEMORY_TASKS):
+    # (major, eight report frames, seconds) for each major as soon as it finishes; with workers > 1
+    # the majors run in a process pool and arrive in completion order
+    partitions = major_partitions(st_hist_data, majors)
+    if workers <= 1:
+        for major, passed_data, failed_data in partitions:
+            yield run_major_task(major, passed_data, failed_data, requirements_weights_path, latest_only, catalog)
+        return
+
+    executor = get_pipeline_pool(catalog, workers)
+    block = None
+    futures = []
+    try:
+        # Majors already fill the workers, so their students are not sharded further
+        if shared_memory_tasks:
+            block, layout = share_history(pd.concat([frame for _, passed_data, failed_data in partitions for frame in (passed_data, failed_data)]))
+            futures = [executor.submit(run_shared_major_task, major, layout, passed_rows, failed_rows, requirements_weights_path, latest_only)
+                       for major, passed_rows, failed_rows in major_task_ranges(partitions)]
+        else:
+            futures = [executor.submit(run_major_task, major, passed_data, failed_data, requirements_weights_path, latest_only, student_shards=1)
+                       for major, passed_data, failed_data in partitions]
+        for future in as_completed(futures):
+            yield future.result()
+    except BrokenProcessPool:
+        discard_pipeline_pool(executor)
+        raise
+    finally:
+        # A failed or abandoned run drops its queued tasks from the shared pool, and the block goes
+        # whether the pool, the block or a task failed
+        for future in futures:
+            future.cancel()
+        if block is not None:
+            block.close()
+            block.unlink()
+
+def combine_major_reports(major_reports):
+    # {major: eight report frames} -> {report family: frame for all those majors, in that major order}
+    report_lists = {family: [] for family in report_files}
+    for reports in major_reports.values():
+        for family, report in zip(report_files, reports):
+            report_lists[family].append(report)
+    return {family: pd.concat(report_list, ignore_index=True) for family, report_list in report_lists.items() if report_list}
+
+def run_all_majors(st_hist_data, catalog, requirements_weights_path, majors=None, latest_only=True, workers=PIPELINE_WORKERS,
+                   shared_memory_tasks=SHARED_MEMORY_TASKS):
+    # Every registered major (or `majors`) in one job. Returns ({report family: frame for all majors},
+    # {major: seconds}), in registry order whatever order the workers finish in
+    major_reports = {}
+    timings = {}
+    for major, reports, elapsed in iter_major_reports(st_hist_data, catalog, requirements_weights_path, majors, latest_only, workers,
+                                                      shared_memory_tasks):
+        major_reports[major] = reports
+        timings[major] = elapsed
+    order = [major for major in (majors or major_registry) if major in major_reports]
+    return combine_major_reports({major: major_reports[major] for major in order}), {major: timings[major] for major in order}
+
+def write_report_families(reports, output_dir=REPORTS_DIR):
+    # One CSV per report family, named as the main page's downloads
+    os.makedirs(output_dir, exist_ok=True)
+    paths = []
+    for family, report in reports.items():
+        path = os.path.join(output_dir, report_files[family])
+        report.to_csv(path, index=False)
+        paths.append(path)
+    return paths
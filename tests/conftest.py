@@ -0,0 +1,34 @@
+import pandas as pd
+import pytest
+
+from benchmarks.synthetic import generate_synthetic_student_data
+from eligibility_data import st_data_cleaning
+from eligibility_pipeline import MAJOR_SHEET_PATH, build_course_catalog
+
+# Major sheet, catalog and synthetic warehouse extracts shared by the tests. The cleaning renames
+# the extract columns in place, so every test gets its own copies
+
+@pytest.fixture(scope="session")
+def major_sheets():
+    return pd.read_excel(MAJOR_SHEET_PATH, sheet_name=None)
+
+@pytest.fixture(scope="session")
+def catalog(major_sheets):
+    return build_course_catalog(major_sheets)
+
+@pytest.fixture(scope="session")
+def synthetic_extracts(major_sheets):
+    return generate_synthetic_student_data(major_sheets, n_students=400, seed=0)
+
+@pytest.fixture
+def enrollment_data(synthetic_extracts):
+    return synthetic_extracts[0].copy()
+
+@pytest.fixture
+def transfer_data(synthetic_extracts):
+    return synthetic_extracts[1].copy()
+
+@pytest.fixture(scope="session")
+def st_hist_data(synthetic_extracts):
+    enrollment_data, transfer_data = synthetic_extracts
+    return st_data_cleaning(enrollment_data.copy(), transfer_data.copy())
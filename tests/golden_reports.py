@@ -0,0 +1,28 @@
+import os
+import re
+import sys
+import pandas as pd
+
+from eligibility_pipeline import MAJOR_SHEET_PATH, build_course_catalog, major_registry, process_major_data
+
+# Golden reports of process_major_data. Each fixture holds one major's synthetic student history
+# and the eight report frames the original per-major process_data_* function returned for it.
+# Run as a script, this writes {major: eight report frames} of process_major_data over those
+# histories to the path given
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "process_major_data")
+REQUIREMENTS_WEIGHTS_PATH = "Requierments_Weights.xlsx"
+
+def fixture_path(major):
+    return os.path.join(FIXTURE_DIR, re.sub(r"[^a-z0-9]+", "_", major.lower()).strip("_") + ".pkl.gz")
+
+def load_fixture(major):
+    return pd.read_pickle(fixture_path(major))
+
+def engine_reports():
+    catalog = build_course_catalog(pd.read_excel(MAJOR_SHEET_PATH, sheet_name=None))
+    return {major: process_major_data(major, load_fixture(major)["history"], catalog, REQUIREMENTS_WEIGHTS_PATH, student_shards=1)
+            for major in major_registry}
+
+if __name__ == "__main__":
+    pd.to_pickle(engine_reports(), sys.argv[1])
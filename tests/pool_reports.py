@@ -0,0 +1,28 @@
+import sys
+import pandas as pd
+
+from eligibility_pipeline import MAJOR_SHEET_PATH, build_course_catalog, major_registry, pipeline_pool, process_major_data, run_all_majors
+from golden_reports import REQUIREMENTS_WEIGHTS_PATH, load_fixture
+
+# Reports of the golden histories run in this process and on pipeline pools. Workers break
+# recommendation ties in their own set iteration order, so this runs as a script with a fixed
+# PYTHONHASHSEED, which the pool's workers inherit, and writes {run: reports} to the path given
+
+SHARDED_MAJOR = "Computer Science"
+
+def pool_reports():
+    catalog = build_course_catalog(pd.read_excel(MAJOR_SHEET_PATH, sheet_name=None))
+    st_hist_data = pd.concat([load_fixture(major)["history"] for major in major_registry], ignore_index=True)
+    major_data = st_hist_data[st_hist_data["Major"] == SHARDED_MAJOR]
+    reports = {"in-process": run_all_majors(st_hist_data, catalog, REQUIREMENTS_WEIGHTS_PATH, workers=1)[0]}
+    for shared_memory_tasks in [False, True]:
+        reports[f"2 workers, shared_memory_tasks={shared_memory_tasks}"] = run_all_majors(
+            st_hist_data, catalog, REQUIREMENTS_WEIGHTS_PATH, workers=2, shared_memory_tasks=shared_memory_tasks)[0]
+    reports["unsharded"] = process_major_data(SHARDED_MAJOR, major_data, catalog, REQUIREMENTS_WEIGHTS_PATH, student_shards=1)
+    with pipeline_pool(catalog, 2) as executor:
+        reports["2 student shards"] = process_major_data(SHARDED_MAJOR, major_data, catalog, REQUIREMENTS_WEIGHTS_PATH,
+                                                         student_shards=2, executor=executor)
+    return reports
+
+if __name__ == "__main__":
+    pd.to_pickle(pool_reports(), sys.argv[1])
@@ -0,0 +1,184 @@
+import pandas as pd
+import numpy as np
+import pytest
+import os
+import threading
+import time
+from sqlalchemy import text
+
+from benchmarks.reference import add_incoming_pcr_rowwise, st_data_cleaning_rowwise
+from benchmarks.synthetic import create_benchmark_db, create_warehouse_db, warehouse_query, warehouse_sync_queries
+from eligibility_data import (
+    add_incoming_pcr,
+    build_major_scoped_queries,
+    combine_student_history,
+    fetch_data_from_db,
+    fetch_data_from_db_chunked,
+    fetch_enrollment_and_transfer_data,
+    st_data_cleaning,
+    read_snapshot_manifest,
+    st_enrollment_query,
+    sync_enrollment_snapshot,
+    tc_query,
+    write_snapshot_manifest,
+)
+from eligibility_pipeline import MAJOR_SHEET_PATH, load_major_sheet
+
+enrollment_query = "SELECT * FROM ActiveStudentEnrollmentFull"
+transfer_query = "SELECT * FROM StudentCourseTransfer"
+
+@pytest.fixture
+def benchmark_db(tmp_path, enrollment_data, transfer_data):
+    engine, pool_stats = create_benchmark_db(enrollment_data, transfer_data, tmp_path / "warehouse.sqlite")
+    yield engine, pool_stats
+    engine.dispose()
+
+@pytest.fixture
+def warehouse_db(tmp_path, enrollment_data, transfer_data):
+    engine, pool_stats = create_warehouse_db(enrollment_data, transfer_data, tmp_path / "warehouse.sqlite")
+    yield engine, pool_stats
+    engine.dispose()
+
+def latest_plan_students(enrollment, plans):
+    # Students whose latest semester with an academic level is in one of the plans
+    leveled = enrollment[enrollment["Level"] != "NA"]
+    latest = leveled.loc[leveled.groupby("EMPLID")["STRM"].idxmax()]
+    return latest.loc[latest["Plan"].str.strip().isin(plans), "EMPLID"]
+
+def snapshot_sync(warehouse_db, snapshot_dir, mode, **kwargs):
+    engine, pool_stats = warehouse_db
+    sync_stats = {}
+    snapshot = sync_enrollment_snapshot(mode, snapshot_dir, engine, pool_stats, sync_stats=sync_stats,
+                                        snapshot_lock=threading.Lock(), queries=warehouse_sync_queries(), **kwargs)
+    return snapshot, sync_stats
+
+def direct_pull(warehouse_db):
+    engine, pool_stats = warehouse_db
+    return fetch_data_from_db_chunked(warehouse_query(st_enrollment_query), engine=engine, pool_stats=pool_stats)
+
+def current_term(warehouse_db):
+    with warehouse_db[0].connect() as conn:
+        return conn.execute(text("SELECT MAX(Semester) FROM ActiveStudentEnrollmentFull")).scalar()
+
+def sorted_rows(frame):
+    return frame.sort_values(list(frame.columns)).reset_index(drop=True)
+
+def test_concurrent_fetch_matches_sequential(benchmark_db):
+    engine, pool_stats = benchmark_db
+    enrollment, transfer = fetch_enrollment_and_transfer_data(enrollment_query, transfer_query, engine, pool_stats, stream_enrollment=False)
+    pd.testing.assert_frame_equal(enrollment, fetch_data_from_db(enrollment_query, engine, pool_stats))
+    pd.testing.assert_frame_equal(transfer, fetch_data_from_db(transfer_query, engine, pool_stats))
+
+@pytest.mark.parametrize("typed", [False, True])
+def test_streamed_fetch_cleans_like_read_sql(benchmark_db, transfer_data, typed):
+    engine, pool_stats = benchmark_db
+    ingestion_stats = {}
+    streamed = fetch_data_from_db_chunked(enrollment_query, 1000, engine, pool_stats, ingestion_stats, typed=typed)
+    assert ingestion_stats["chunks"] > 1
+    pd.testing.assert_frame_equal(st_data_cleaning(streamed, transfer_data.copy()),
+                                  st_data_cleaning(fetch_data_from_db(enrollment_query, engine, pool_stats), transfer_data.copy()))
+
+def test_typed_ingestion_keeps_gpa_precision(tmp_path, enrollment_data, transfer_data):
+    # GPA/MPA with every float64 digit in use come out of typed ingestion and cleaning unchanged
+    rng = np.random.default_rng(0)
+    enrollment_data["CUM_GPA"] = rng.uniform(0, 4, len(enrollment_data))
+    enrollment_data["MPA"] = enrollment_data["MPA"].where(enrollment_data["MPA"].isna(), rng.uniform(0, 4, len(enrollment_data)))
+    engine, pool_stats = create_benchmark_db(enrollment_data, transfer_data, tmp_path / "precision.sqlite")
+    try:
+        typed = fetch_data_from_db_chunked(enrollment_query, 1000, engine, pool_stats, typed=True)
+        for column in ["CUM_GPA", "MPA"]:
+            assert typed[column].dtype == np.float64
+            np.testing.assert_array_equal(typed[column].to_numpy(), enrollment_data[column].fillna(0).to_numpy())
+        pd.testing.assert_frame_equal(st_data_cleaning(typed, transfer_data.copy()),
+                                      st_data_cleaning(fetch_data_from_db(enrollment_query, engine, pool_stats), transfer_data.copy()))
+    finally:
+        engine.dispose()
+
+def test_st_data_cleaning_matches_rowwise(enrollment_data, transfer_data):
+    pd.testing.assert_frame_equal(st_data_cleaning(enrollment_data.copy(), transfer_data.copy()),
+                                  st_data_cleaning_rowwise(enrollment_data.copy(), transfer_data.copy()))
+
+def test_add_incoming_pcr_matches_rowwise(enrollment_data, transfer_data):
+    combined_data = combine_student_history(enrollment_data, transfer_data)
+    pd.testing.assert_frame_equal(add_incoming_pcr(combined_data), add_incoming_pcr_rowwise(combined_data))
+
+def test_cached_major_sheet_matches_read_excel(tmp_path, major_sheets):
+    sources = []
+    for _ in range(2):
+        load_stats = {}
+        workbook = load_major_sheet(MAJOR_SHEET_PATH, tmp_path, load_stats)
+        sources.append(load_stats["source"])
+        assert list(workbook) == list(major_sheets)
+        for sheet in major_sheets:
+            pd.testing.assert_frame_equal(workbook[sheet], major_sheets[sheet], obj=sheet)
+    assert sources == ["xlsx", "cache"]
+
+@pytest.mark.parametrize("selection", [["Accounting", "Finance"], ["Digital Media Production"], ["Computer Engineering"]])
+def test_major_scoped_queries_match_filtered_full_pull(warehouse_db, selection):
+    engine, pool_stats = warehouse_db
+    full_enrollment, full_transfer = fetch_enrollment_and_transfer_data(
+        warehouse_query(st_enrollment_query), warehouse_query(tc_query), engine, pool_stats, stream_enrollment=False)
+    scoped_enrollment_query, scoped_transfer_query, params = build_major_scoped_queries(selection)
+    enrollment, transfer = fetch_enrollment_and_transfer_data(
+        warehouse_query(scoped_enrollment_query), warehouse_query(scoped_transfer_query), engine, pool_stats,
+        stream_enrollment=False, params=params)
+
+    students = latest_plan_students(full_enrollment, set(params.values()))
+    assert not students.empty
+    pd.testing.assert_frame_equal(sorted_rows(enrollment), sorted_rows(full_enrollment[full_enrollment["EMPLID"].isin(students)]))
+    pd.testing.assert_frame_equal(sorted_rows(transfer), sorted_rows(full_transfer[full_transfer["STUDENT_ID"].isin(students)]))
+
+    # The selected majors come out of cleaning exactly as they do from the full pull
+    full_data = st_data_cleaning(full_enrollment, full_transfer)
+    scoped_data = st_data_cleaning(enrollment, transfer)
+    pd.testing.assert_frame_equal(scoped_data[scoped_data["Major"].isin(selection)].reset_index(drop=True),
+                                  full_data[full_data["Major"].isin(selection)].reset_index(drop=True))
+
+def test_delta_sync_matches_full_pull(warehouse_db, tmp_path, transfer_data):
+    snapshot_dir = tmp_path / "snapshot"
+    _, full_stats = snapshot_sync(warehouse_db, snapshot_dir, "full")
+    snapshot, delta_stats = snapshot_sync(warehouse_db, snapshot_dir, "delta")
+    full_pull = direct_pull(warehouse_db)
+    assert full_stats["mode"] == "full" and full_stats["rows_transferred"] == len(full_pull)
+    assert delta_stats["mode"] == "delta" and 0 < delta_stats["rows_transferred"] < len(full_pull)
+    pd.testing.assert_frame_equal(snapshot, full_pull)
+    pd.testing.assert_frame_equal(st_data_cleaning(snapshot, transfer_data.copy()), st_data_cleaning(full_pull, transfer_data.copy()))
+
+def test_delta_sync_picks_up_current_term_changes(warehouse_db, tmp_path):
+    snapshot_dir = tmp_path / "snapshot"
+    snapshot_sync(warehouse_db, snapshot_dir, "full")
+    term = current_term(warehouse_db)
+    with warehouse_db[0].begin() as conn:
+        conn.execute(text("UPDATE ActiveStudentEnrollmentFull SET LetterGrade = 'F' WHERE Semester = :term AND rowid % 3 = 0"), {"term": term})
+        conn.execute(text("DELETE FROM ActiveStudentEnrollmentFull WHERE Semester = :term AND rowid % 3 = 1"), {"term": term})
+        # Students who leave drop out of the older partitions too
+        inactive = conn.execute(text("SELECT StudentID FROM StudentMaster WHERE rowid % 10 = 0")).scalars().all()
+        conn.execute(text("UPDATE StudentMaster SET ProgramStatusID = 'DC  ' WHERE rowid % 10 = 0"))
+    snapshot, sync_stats = snapshot_sync(warehouse_db, snapshot_dir, "delta")
+    assert sync_stats["mode"] == "delta" and sync_stats["last_synced_term"] == str(term)
+    assert not snapshot["EMPLID"].astype(str).isin([student.strip() for student in inactive]).any()
+    pd.testing.assert_frame_equal(snapshot, direct_pull(warehouse_db))
+
+def test_empty_delta_drops_the_deleted_term(warehouse_db, tmp_path):
+    snapshot_dir = tmp_path / "snapshot"
+    snapshot_sync(warehouse_db, snapshot_dir, "full")
+    term = current_term(warehouse_db)
+    with warehouse_db[0].begin() as conn:
+        conn.execute(text("DELETE FROM ActiveStudentEnrollmentFull WHERE Semester = :term"), {"term": term})
+    snapshot, sync_stats = snapshot_sync(warehouse_db, snapshot_dir, "delta")
+    assert sync_stats["rows_transferred"] == 0
+    assert sync_stats["last_synced_term"] == str(current_term(warehouse_db))
+    assert not os.path.exists(snapshot_dir / f"STRM={term}.parquet")
+    pd.testing.assert_frame_equal(snapshot, direct_pull(warehouse_db))
+
+def test_snapshot_older_than_max_age_forces_full_sync(warehouse_db, tmp_path):
+    snapshot_dir = tmp_path / "snapshot"
+    snapshot_sync(warehouse_db, snapshot_dir, "full", max_age_days=7)
+    manifest = read_snapshot_manifest(snapshot_dir)
+    manifest["last_full_sync"] = time.time() - 8 * 86400
+    write_snapshot_manifest(snapshot_dir, manifest)
+    snapshot, sync_stats = snapshot_sync(warehouse_db, snapshot_dir, "delta", max_age_days=7)
+    full_pull = direct_pull(warehouse_db)
+    assert sync_stats["mode"] == "full" and sync_stats["rows_transferred"] == len(full_pull)
+    assert time.time() - read_snapshot_manifest(snapshot_dir)["last_full_sync"] < 86400
+    pd.testing.assert_frame_equal(snapshot, full_pull)
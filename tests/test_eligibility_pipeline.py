@@ -0,0 +1,124 @@
+import pandas as pd
+import pytest
+
+from benchmarks.eligibility import (
+    cohort_eligibility,
+    dependent_queries,
+    dependents_by_index,
+    dependents_by_scan,
+    eligible_by_matrix,
+    eligible_by_sets,
+    eligible_course_lists,
+    future_eligibility_per_row,
+    future_eligibility_unlocks,
+    per_student_eligibility,
+    semester_histories,
+    special_condition_chain,
+    special_condition_states,
+    synthetic_eligibility_frames,
+)
+from benchmarks.pipeline import per_major_reports
+from benchmarks.reference import combine_eligible_courses_rowwise, create_combined_courses
+from eligibility_pipeline import (
+    add_co_requisite_courses,
+    combine_eligible_courses,
+    eligibility_timeline,
+    major_catalog_sheets,
+    major_partitions,
+    major_registry,
+    process_major_data,
+    report_files,
+    run_all_majors,
+    share_history,
+    worker_history_rows,
+)
+
+REQUIREMENTS_WEIGHTS_PATH = "Requierments_Weights.xlsx"
+
+def major_history(st_hist_data, major):
+    major_data = st_hist_data[st_hist_data["Major"] == major]
+    assert not major_data.empty
+    return major_data
+
+@pytest.mark.parametrize("major", list(major_catalog_sheets))
+def test_prerequisite_matrix_matches_sets(major, st_hist_data, catalog):
+    major_catalog = catalog["majors"][major_catalog_sheets[major]]
+    major_data = major_history(st_hist_data, major)
+    assert eligible_by_matrix(major_data, major_catalog) == eligible_by_sets(semester_histories(major_data), major_catalog["prerequisites"])
+
+@pytest.mark.parametrize("major", list(major_catalog_sheets))
+def test_cohort_eligibility_matches_per_student(major, st_hist_data, catalog):
+    major_catalog = catalog["majors"][major_catalog_sheets[major]]
+    major_data = major_history(st_hist_data, major)
+    assert cohort_eligibility(major_data, major_catalog) == per_student_eligibility(major_data, major_catalog)
+
+def test_compiled_conditions_match_chains(st_hist_data, catalog):
+    mismatches = []
+    for sheet_major, taken_courses, student_info in special_condition_states(st_hist_data, catalog, max_states=20):
+        major_catalog = catalog["majors"][sheet_major]
+        for future, special_rules in [(False, major_catalog["special_rules"]), (True, major_catalog["future_special_rules"])]:
+            is_eligible_special = special_condition_chain(sheet_major, future)
+            for course in major_catalog["prerequisites_special"]:
+                expected = bool(is_eligible_special(course, taken_courses, student_info, major_catalog["prerequisites_special"], major_catalog["conditions"]))
+                compiled = course in special_rules and bool(special_rules[course](taken_courses, student_info))
+                if expected != compiled:
+                    mismatches.append((sheet_major, future, course, major_catalog["conditions"].get(course, "")))
+    assert mismatches == []
+
+@pytest.mark.parametrize("major", list(major_registry))
+def test_latest_only_matches_full_history(major, st_hist_data, catalog):
+    major_data = major_history(st_hist_data, major)
+    full_history = process_major_data(major, major_data, catalog, REQUIREMENTS_WEIGHTS_PATH, latest_only=False, student_shards=1)
+    latest_only = process_major_data(major, major_data, catalog, REQUIREMENTS_WEIGHTS_PATH, latest_only=True, student_shards=1)
+    for family, full_report, latest_report in zip(report_files, full_history, latest_only):
+        pd.testing.assert_frame_equal(latest_report, full_report, obj=f"{major} {family}")
+
+@pytest.mark.parametrize("major", list(major_catalog_sheets))
+def test_incremental_timeline_matches_full_recheck(major, st_hist_data, catalog):
+    major_history(st_hist_data, major)
+    pd.testing.assert_frame_equal(eligibility_timeline(st_hist_data, catalog, major, incremental=True),
+                                  eligibility_timeline(st_hist_data, catalog, major, incremental=False))
+
+@pytest.mark.parametrize("major", list(major_registry))
+def test_future_eligibility_unlocks_match_per_row_scan(major, st_hist_data, catalog):
+    major_catalog = catalog["majors"][major_catalog_sheets[major]]
+    comprehensive_data = process_major_data(major, major_history(st_hist_data, major), catalog, REQUIREMENTS_WEIGHTS_PATH, student_shards=1)[5]
+    assert future_eligibility_unlocks(comprehensive_data, major_catalog, catalog["course_bits"]) == \
+        future_eligibility_per_row(comprehensive_data, major_catalog, major_catalog_sheets[major])
+
+def test_course_dependents_match_scan(catalog):
+    queries = dependent_queries(catalog)
+    assert dependents_by_index(queries) == dependents_by_scan(queries)
+
+@pytest.mark.parametrize("major", list(major_catalog_sheets))
+def test_co_requisites_match_apply(major, st_hist_data, catalog):
+    major_catalog = catalog["majors"][major_catalog_sheets[major]]
+    combined_list = eligible_course_lists(major_history(st_hist_data, major), major_catalog)
+    columns = ['Co_Requisite_Courses', 'Eligible_Courses_CO']
+    pd.testing.assert_frame_equal(add_co_requisite_courses(combined_list, major_catalog["co_index"])[columns],
+                                  combined_list.apply(create_combined_courses, axis=1, co=major_catalog["co"])[columns])
+
+def test_combine_eligible_courses_matches_rowwise(catalog):
+    standard, special = synthetic_eligibility_frames(catalog, rows=2000)
+    pd.testing.assert_frame_equal(combine_eligible_courses(standard, special), combine_eligible_courses_rowwise(standard, special))
+
+def test_run_all_majors_matches_per_major_loop(st_hist_data, catalog):
+    expected = per_major_reports(st_hist_data, catalog, REQUIREMENTS_WEIGHTS_PATH)
+    reports, timings = run_all_majors(st_hist_data, catalog, REQUIREMENTS_WEIGHTS_PATH, workers=1)
+    assert list(timings) == [major for major in major_registry if (st_hist_data["Major"] == major).any()]
+    assert reports.keys() == expected.keys()
+    for family in expected:
+        pd.testing.assert_frame_equal(reports[family], expected[family], obj=family)
+
+def test_shared_history_rows_match_partitions(st_hist_data):
+    partitions = major_partitions(st_hist_data)
+    frames = [frame for _, passed_data, failed_data in partitions for frame in (passed_data, failed_data)]
+    block, layout = share_history(pd.concat(frames))
+    try:
+        start = 0
+        for frame in frames:
+            pd.testing.assert_frame_equal(worker_history_rows(layout, start, start + len(frame)), frame)
+            start += len(frame)
+    finally:
+        block.close()
+        block.unlink()
@@ -0,0 +1,56 @@
+import os
+import subprocess
+import sys
+import pandas as pd
+import pytest
+from concurrent.futures.process import BrokenProcessPool
+
+import eligibility_pipeline
+from eligibility_pipeline import discard_pipeline_pool, get_pipeline_pool, map_shards, process_major_data, report_files
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REQUIREMENTS_WEIGHTS_PATH = "Requierments_Weights.xlsx"
+
+@pytest.fixture(scope="module")
+def pool_reports(tmp_path_factory):
+    output_path = tmp_path_factory.mktemp("pool") / "reports.pkl"
+    env = dict(os.environ, PYTHONHASHSEED="0", PYTHONPATH=os.pathsep.join(filter(None, [REPO_DIR, os.environ.get("PYTHONPATH")])))
+    subprocess.run([sys.executable, os.path.join(REPO_DIR, "tests", "pool_reports.py"), str(output_path)],
+                   cwd=REPO_DIR, env=env, check=True)
+    return pd.read_pickle(output_path)
+
+@pytest.mark.parametrize("shared_memory_tasks", [False, True])
+def test_pool_reports_match_in_process(shared_memory_tasks, pool_reports):
+    expected = pool_reports["in-process"]
+    reports = pool_reports[f"2 workers, shared_memory_tasks={shared_memory_tasks}"]
+    assert reports.keys() == expected.keys()
+    for family in expected:
+        pd.testing.assert_frame_equal(reports[family], expected[family], obj=family)
+
+def test_student_shards_match_unsharded(pool_reports):
+    for family, report, expected in zip(report_files, pool_reports["2 student shards"], pool_reports["unsharded"]):
+        pd.testing.assert_frame_equal(report, expected, obj=family)
+
+def test_broken_pipeline_pool_is_replaced(catalog):
+    executor = get_pipeline_pool(catalog, 2)
+    try:
+        # A task that kills its worker breaks the pool
+        with pytest.raises(BrokenProcessPool):
+            map_shards(os._exit, [1], executor)
+        replacement = get_pipeline_pool(catalog, 2)
+        assert replacement is not executor
+        assert map_shards(abs, [-1, -2], replacement) == [1, 2]
+    finally:
+        discard_pipeline_pool(get_pipeline_pool(catalog, 2))
+
+def test_student_shards_on_one_worker_run_unsharded(monkeypatch, st_hist_data, catalog):
+    def no_pool(*args, **kwargs):
+        raise AssertionError("a single-worker pool was started for student shards")
+    monkeypatch.setattr(eligibility_pipeline, "PIPELINE_WORKERS", 1)
+    monkeypatch.setattr(eligibility_pipeline, "get_pipeline_pool", no_pool)
+    major_data = st_hist_data[st_hist_data["Major"] == "Computer Science"]
+    with pytest.warns(RuntimeWarning, match="student shards"):
+        sharded = process_major_data("Computer Science", major_data, catalog, REQUIREMENTS_WEIGHTS_PATH, student_shards=4)
+    unsharded = process_major_data("Computer Science", major_data, catalog, REQUIREMENTS_WEIGHTS_PATH, student_shards=1)
+    for family, report, expected in zip(report_files, sharded, unsharded):
+        pd.testing.assert_frame_equal(report, expected, obj=family)